@@ -0,0 +1,159 @@
+"""Couche de calcul optionnelle pour Vecteur et Matrice.
+
+Les petits objets restent sur le chemin Python pur (convertir vers NumPy coûte plus
+cher que le calcul lui-même). Au-delà d'un seuil de taille, configurable par type
+d'opération, les calculs sont délégués à NumPy si celui-ci est installé. NumPy
+travaille directement sur les tampons array('d') : aucune copie en entrée, et les
+résultats sont écrits dans un nouveau tampon array('d').
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Nombre minimal d'éléments traités à partir duquel une opération passe par NumPy
+SEUILS = {
+    "vecteur": 256,       # opérations élément par élément et produit scalaire de Vecteur (taille)
+    "matrice": 1024,      # opérations élément par élément de Matrice (num_ligne * num_colonne)
+    "matmul": 32 ** 3,    # produit matriciel (m * k * n)
+    "mut_vec": 1024,      # produit matrice-vecteur (num_ligne * num_colonne)
+    "lecture": 4096,      # conversion d'une ligne de fichier texte en nombres (octets)
+}
+
+_actif = np is not None
+_compteurs = {operation: {"numpy": 0, "python": 0} for operation in SEUILS}
+
+
+def disponible() -> bool:
+    """Indique si NumPy est installé."""
+    return np is not None
+
+
+def activer(actif: bool = True) -> None:
+    """Active ou désactive le calcul NumPy (sans effet si NumPy n'est pas installé)."""
+    global _actif
+    _actif = actif and np is not None
+
+
+def configurer(**seuils: int) -> None:
+    """Modifie les seuils de bascule vers NumPy.
+
+    Args:
+        **seuils: Nouveaux seuils, par type d'opération (ex: vecteur=512, matmul=10**6)
+
+    Raises:
+        ValueError: Si un type d'opération est inconnu ou si un seuil est négatif
+    """
+    for operation, seuil in seuils.items():
+        if operation not in SEUILS:
+            raise ValueError(f"Opération inconnue: {operation} (attendu: {', '.join(SEUILS)})")
+        if seuil < 0:
+            raise ValueError(f"Le seuil de {operation} doit être positif")
+    SEUILS.update(seuils)
+
+
+def rapport() -> dict:
+    """Retourne l'état de la couche de calcul : disponibilité, seuils et répartition des appels."""
+    return {
+        "numpy": np.__version__ if np is not None else None,
+        "actif": _actif,
+        "seuils": dict(SEUILS),
+        "appels": {operation: dict(compte) for operation, compte in _compteurs.items()},
+    }
+
+
+def reinitialiser_compteurs() -> None:
+    """Remet à zéro les compteurs d'appels."""
+    for compte in _compteurs.values():
+        compte["numpy"] = compte["python"] = 0
+
+
+def utilise_numpy(operation: str, taille: int) -> bool:
+    """Décide si une opération de la taille donnée doit passer par NumPy."""
+    if _actif and taille >= SEUILS[operation]:
+        _compteurs[operation]["numpy"] += 1
+        return True
+    _compteurs[operation]["python"] += 1
+    return False
+
+
+def vue(tampon):
+    """Vue ndarray 1-D (sans copie) sur un tampon array('d') ou une memoryview 'd'."""
+    return np.asarray(memoryview(tampon))
+
+
+def vue_2d(tampon, num_ligne: int, num_colonne: int, pas_ligne: int, pas_colonne: int, decalage: int):
+    """Vue ndarray 2-D (sans copie) décrite par une forme, des pas et un décalage (en éléments)."""
+    base = np.asarray(memoryview(tampon))[decalage:]
+    taille = base.itemsize
+    return np.lib.stride_tricks.as_strided(base, shape=(num_ligne, num_colonne),
+                                           strides=(pas_ligne * taille, pas_colonne * taille))
+
+
+def nouveau_tampon(taille: int):
+    """Alloue un tampon array('d') et retourne (tampon, vue ndarray sur ce tampon)."""
+    tampon = array("d", [0.0]) * taille
+    return tampon, np.frombuffer(tampon, dtype=np.float64)
+
+
+def appliquer(ufunc, *operandes, taille: int) -> array:
+    """Applique une ufunc NumPy élément par élément et écrit le résultat dans un nouveau tampon array('d')."""
+    tampon, sortie = nouveau_tampon(taille)
+    ufunc(*operandes, out=sortie)
+    return tampon
+
+
+def somme(a, b) -> array:
+    return appliquer(np.add, vue(a), vue(b), taille=len(a))
+
+
+def difference(a, b) -> array:
+    return appliquer(np.subtract, vue(a), vue(b), taille=len(a))
+
+
+def produit(a, coef) -> array:
+    return appliquer(np.multiply, vue(a), coef, taille=len(a))
+
+
+def oppose(a) -> array:
+    return appliquer(np.negative, vue(a), taille=len(a))
+
+
+def produit_scalaire(a, b) -> float:
+    return float(np.dot(vue(a), vue(b)))
+
+
+def axpy(y, alpha, x) -> None:
+    """y <- y + alpha * x, en place dans le tampon y."""
+    vue_y = vue(y)
+    vue_y += alpha * vue(x)
+
+
+def en_place(operation: str, y, operande) -> None:
+    """y <- operation(y, operande), en place dans le tampon y.
+
+    Args:
+        operation (str): Nom de la ufunc NumPy ("add", "subtract", "multiply", "divide")
+        y: Le tampon modifié
+        operande: Un tampon de même taille ou un scalaire
+    """
+    vue_y = vue(y)
+    if not isinstance(operande, (int, float)):
+        operande = vue(operande)
+    getattr(np, operation)(vue_y, operande, out=vue_y)
+
+
+def produit_matriciel(a, b) -> array:
+    """Produit de deux vues ndarray 2-D, écrit dans un nouveau tampon array('d') en ligne-majeure."""
+    tampon, sortie = nouveau_tampon(a.shape[0] * b.shape[1])
+    np.matmul(a, b, out=sortie.reshape(a.shape[0], b.shape[1]))
+    return tampon
+
+
+def produit_matrice_vecteur(a, x) -> array:
+    """Produit d'une vue ndarray 2-D par un tampon 1-D, écrit dans un nouveau tampon array('d')."""
+    tampon, sortie = nouveau_tampon(a.shape[0])
+    np.matmul(a, vue(x), out=sortie)
+    return tampon
@@ -0,0 +1,243 @@
+"""Résolution directe de systèmes structurés : diagonaux, triangulaires, tridiagonaux et bande.
+
+Pour une matrice n x n de largeurs de bande (p, q) (voir Matrice.largeurs_de_bande) :
+    diagonale         O(n)
+    triangulaire      O(n * q) ou O(n * p) par substitution
+    tridiagonale      O(n) par l'algorithme de Thomas
+    bande             O(n * p * (p + q)) par factorisation LU bande avec pivot partiel
+au lieu de O(n³) pour l'élimination de Gauss. Pivot.resoudre choisit automatiquement le
+solveur d'après Matrice.largeurs_de_bande().
+
+Les fonctions acceptent une Matrice ou une MatriceCreuse, ne la modifient pas, et retournent
+la solution du même type que le second membre (list ou Vecteur).
+"""
+from array import array
+from operator import mul
+from vecteur import Vecteur
+from creuse import MatriceCreuse
+
+
+def _valeurs_ligne(matrice, i: int, debut: int, fin: int):
+    """Les éléments des colonnes debut à fin - 1 de la ligne i (vue sans copie pour une Matrice)."""
+    if isinstance(matrice, MatriceCreuse):
+        valeurs = array("d", [0.0]) * (fin - debut)
+        for j, v in matrice._couples(i):
+            if debut <= j < fin:
+                valeurs[j - debut] = v
+        return valeurs
+    return matrice._ligne(i)[debut:fin]
+
+
+def _preparer(matrice, second_membre) -> list:
+    n = matrice.num_ligne
+    if matrice.num_colonne != n:
+        raise ValueError("La matrice doit être carrée")
+    if len(second_membre) != n:
+        raise ValueError("Le second membre doit avoir la même taille que la matrice")
+    return [float(v) for v in second_membre]
+
+
+def _resultat(matrice, second_membre, x: list):
+    if isinstance(second_membre, Vecteur):
+        return Vecteur(f"{matrice.name}^-1 {second_membre.name}", x)
+    return x
+
+
+def resoudre_diagonale(matrice, second_membre):
+    """Résout D x = b pour une matrice diagonale.
+
+    Raises:
+        ValueError: Si un élément diagonal est nul
+    """
+    x = _preparer(matrice, second_membre)
+    for i, d in enumerate(matrice.diagonale()):
+        if d == 0:
+            raise ValueError("Système impossible à résoudre (matrice singulière)")
+        x[i] /= d
+    return _resultat(matrice, second_membre, x)
+
+
+def resoudre_triangulaire(matrice, second_membre, inferieure: bool, largeur: int | None = None):
+    """Résout T x = b par substitution avant (triangulaire inférieure) ou arrière (supérieure).
+
+    Args:
+        matrice (Matrice | MatriceCreuse): La matrice triangulaire T
+        second_membre (list | Vecteur): Le second membre b
+        inferieure (bool): Vrai si T est triangulaire inférieure
+        largeur (int, optional): La largeur de bande de T hors diagonale (n - 1 par défaut) ;
+                                 chaque ligne ne lit alors que largeur éléments
+
+    Raises:
+        ValueError: Si un élément diagonal est nul
+    """
+    x = _preparer(matrice, second_membre)
+    n = len(x)
+    if largeur is None:
+        largeur = n - 1
+    diagonale = matrice.diagonale()
+    lignes = range(n) if inferieure else range(n - 1, -1, -1)
+    for i in lignes:
+        if diagonale[i] == 0:
+            raise ValueError("Système impossible à résoudre (matrice singulière)")
+        debut, fin = (max(0, i - largeur), i) if inferieure else (i + 1, min(n, i + largeur + 1))
+        x[i] = (x[i] - sum(map(mul, _valeurs_ligne(matrice, i, debut, fin), x[debut:fin]))) / diagonale[i]
+    return _resultat(matrice, second_membre, x)
+
+
+def thomas(sous_diagonale, diagonale, sur_diagonale, second_membre) -> list:
+    """Algorithme de Thomas : élimination de Gauss sans pivot sur un système tridiagonal, O(n).
+
+    Stable si la matrice est à diagonale dominante (ou symétrique définie positive).
+
+    Args:
+        sous_diagonale (Sequence[float]): a[1..n-1], le coefficient de x[i-1] dans l'équation i
+                                          (a[0] est ignoré)
+        diagonale (Sequence[float]): b[0..n-1]
+        sur_diagonale (Sequence[float]): c[0..n-2], le coefficient de x[i+1] dans l'équation i
+        second_membre (Sequence[float]): d[0..n-1]
+
+    Returns:
+        list: La solution x
+
+    Raises:
+        ValueError: Si un pivot est nul
+    """
+    n = len(diagonale)
+    c = [0.0] * n
+    d = [0.0] * n
+    pivot = diagonale[0] if n else 1
+    for i in range(n):
+        if i > 0:
+            pivot = diagonale[i] - sous_diagonale[i] * c[i - 1]
+        if pivot == 0:
+            raise ValueError("Système impossible à résoudre (pivot nul)")
+        c[i] = sur_diagonale[i] / pivot if i < n - 1 else 0.0
+        d[i] = (second_membre[i] - (sous_diagonale[i] * d[i - 1] if i > 0 else 0.0)) / pivot
+    for i in range(n - 2, -1, -1):
+        d[i] -= c[i] * d[i + 1]
+    return d
+
+
+def resoudre_tridiagonale(matrice, second_membre):
+    """Résout un système tridiagonal : Thomas si la matrice est à diagonale dominante,
+    LU bande avec pivot partiel sinon.
+
+    Raises:
+        ValueError: Si la matrice est singulière
+    """
+    b = _preparer(matrice, second_membre)
+    n = len(b)
+    sous = [0.0] + [matrice[i, i - 1] for i in range(1, n)]
+    diagonale = matrice.diagonale().tolist()
+    sur = [matrice[i, i + 1] for i in range(n - 1)] + [0.0]
+    if all(abs(diagonale[i]) >= abs(sous[i]) + abs(sur[i]) for i in range(n)):
+        return _resultat(matrice, second_membre, thomas(sous, diagonale, sur, b))
+    return FactorisationBande(matrice, 1, 1).resoudre(second_membre)
+
+
+class FactorisationBande:
+    """Factorisation PA = LU d'une matrice bande, avec pivot partiel.
+
+    Pour des largeurs de bande (p, q), L a au plus p éléments sous la diagonale par colonne
+    et U, élargie par les permutations, au plus p + q au-dessus. Chaque ligne i est rangée
+    sur 2p + q + 1 cases couvrant les colonnes i - p à i + p + q, soit O(n * (p + q)) en
+    mémoire ; la factorisation coûte O(n * p * (p + q)) et chaque résolution O(n * (p + q)).
+    """
+    __slots__ = ("name", "taille", "inferieure", "superieure", "_largeur", "_bande", "_permutations")
+
+    def __init__(self, matrice, inferieure: int | None = None, superieure: int | None = None):
+        """
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée à factoriser (non modifiée)
+            inferieure (int, optional): La largeur de bande inférieure p (détectée par défaut)
+            superieure (int, optional): La largeur de bande supérieure q (détectée par défaut)
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        n = matrice.num_ligne
+        if matrice.num_colonne != n:
+            raise ValueError("La matrice doit être carrée")
+        if inferieure is None or superieure is None:
+            inferieure, superieure = matrice.largeurs_de_bande()
+        self.name = matrice.name
+        self.taille = n
+        self.inferieure = p = inferieure
+        self.superieure = q = superieure
+        self._largeur = largeur = 2 * p + q + 1
+        self._bande = bande = array("d", [0.0]) * (n * largeur)
+        for i in range(n):
+            debut, fin = max(0, i - p), min(n, i + q + 1)
+            position = i * largeur + debut - i + p
+            bande[position:position + fin - debut] = array("d", _valeurs_ligne(matrice, i, debut, fin))
+        # _permutations[k] : ligne échangée avec la ligne k à l'étape k
+        self._permutations = array("q", range(n))
+        self._factoriser()
+
+    def _position(self, i: int, j: int) -> int:
+        return i * self._largeur + j - i + self.inferieure
+
+    def _factoriser(self) -> None:
+        n, p, q = self.taille, self.inferieure, self.superieure
+        bande = self._bande
+        tampon = memoryview(bande)
+        position = self._position
+        for k in range(n):
+            dernier = min(n - 1, k + p)
+            fin = min(n, k + p + q + 1)
+            # Pivot partiel parmi les p lignes sous la diagonale
+            r = max(range(k, dernier + 1), key=lambda i: abs(bande[position(i, k)]))
+            if bande[position(r, k)] == 0:
+                raise ValueError("Système impossible à résoudre (matrice singulière)")
+            self._permutations[k] = r
+            if r != k:
+                # Les colonnes k..fin-1 sont contiguës dans les deux lignes
+                ligne_k = array("d", tampon[position(k, k):position(k, fin)])
+                tampon[position(k, k):position(k, fin)] = tampon[position(r, k):position(r, fin)]
+                tampon[position(r, k):position(r, fin)] = ligne_k
+
+            pivot = bande[position(k, k)]
+            reste_pivot = tampon[position(k, k + 1):position(k, fin)]
+            for i in range(k + 1, dernier + 1):
+                facteur = bande[position(i, k)] / pivot
+                bande[position(i, k)] = facteur
+                if facteur != 0:
+                    reste = tampon[position(i, k + 1):position(i, fin)]
+                    reste[:] = array("d", [x - facteur * y for x, y in zip(reste, reste_pivot)])
+
+    def resoudre(self, second_membre):
+        """Résout A x = b par substitutions avant (L) et arrière (U) dans la bande.
+
+        Args:
+            second_membre (list | Vecteur): Le second membre b
+
+        Returns:
+            list | Vecteur: La solution x, du même type que le second membre
+
+        Raises:
+            ValueError: Si le second membre n'a pas la taille de la matrice
+        """
+        n, p, q = self.taille, self.inferieure, self.superieure
+        if len(second_membre) != n:
+            raise ValueError("Le second membre doit avoir la même taille que la matrice")
+        bande = self._bande
+        position = self._position
+        x = [float(v) for v in second_membre]
+
+        # L y = P b : permutations et éliminations dans l'ordre de la factorisation
+        for k in range(n):
+            r = self._permutations[k]
+            if r != k:
+                x[k], x[r] = x[r], x[k]
+            for i in range(k + 1, min(n, k + p + 1)):
+                x[i] -= bande[position(i, k)] * x[k]
+
+        # U x = y, U de largeur p + q au-dessus de la diagonale
+        tampon = memoryview(bande)
+        for i in range(n - 1, -1, -1):
+            fin = min(n, i + p + q + 1)
+            x[i] = (x[i] - sum(map(mul, tampon[position(i, i + 1):position(i, fin)], x[i + 1:fin]))) / bande[position(i, i)]
+
+        if isinstance(second_membre, Vecteur):
+            return Vecteur(f"{self.name}^-1 {second_membre.name}", x)
+        return x
@@ -0,0 +1,363 @@
+from array import array
+from bisect import bisect_left
+from operator import mul
+from vecteur import Vecteur
+from matrice import Matrice, matrice_nulle, forme_de_bande
+from typing import *
+import backend
+
+
+class MatriceCreuse:
+    """Matrice creuse au format CSR (lignes compressées).
+
+    Seuls les coefficients non nuls sont stockés, dans trois tampons :
+        _valeurs[k]            la valeur du k-ième coefficient non nul
+        _indices[k]            sa colonne
+        _debuts[i]:_debuts[i+1] la tranche des coefficients de la ligne i
+
+    La matrice expose la même interface que Matrice (num_ligne, num_colonne, taille, ligne,
+    elements, @, mut_vec, +, -, * scalaire), ce qui permet de l'utiliser là où une Matrice
+    est attendue. Le produit par un vecteur coûte O(nnz) au lieu de O(n²).
+    """
+    __slots__ = ("name", "taille", "num_ligne", "num_colonne", "_valeurs", "_indices", "_debuts")
+
+    def __init__(self, name: str, lignes: Sequence[int], colonnes: Sequence[int],
+                 valeurs: Sequence[float], forme: Tuple[int, int]):
+        """Assemble une matrice creuse à partir de triplets (ligne, colonne, valeur) (format COO).
+
+        Les doublons sont additionnés et les zéros ne sont pas stockés.
+
+        Args:
+            name (str): Le nom de la matrice
+            lignes (Sequence[int]): Les indices de ligne des coefficients
+            colonnes (Sequence[int]): Les indices de colonne des coefficients
+            valeurs (Sequence[float]): Les valeurs des coefficients
+            forme (tuple): (num_ligne, num_colonne)
+
+        Raises:
+            ValueError: Si les trois séquences n'ont pas la même longueur ou si un indice sort de la matrice
+        """
+        num_ligne, num_colonne = forme
+        if not len(lignes) == len(colonnes) == len(valeurs):
+            raise ValueError("Les lignes, colonnes et valeurs doivent avoir la même longueur")
+
+        valeurs_csr = array("d")
+        indices = array("q")
+        debuts = array("q", [0]) * (num_ligne + 1)
+        precedent = None
+        for i, j, v in sorted(zip(lignes, colonnes, valeurs)):
+            if not (0 <= i < num_ligne and 0 <= j < num_colonne):
+                raise ValueError(f"Coefficient ({i}, {j}) hors de la matrice {num_ligne}x{num_colonne}")
+            if (i, j) == precedent:
+                valeurs_csr[-1] += v
+                continue
+            precedent = (i, j)
+            valeurs_csr.append(v)
+            indices.append(j)
+            debuts[i + 1] += 1
+        for i in range(num_ligne):
+            debuts[i + 1] += debuts[i]
+
+        self._initialiser(name, valeurs_csr, indices, debuts, num_ligne, num_colonne)
+        if 0.0 in valeurs_csr:
+            # Des doublons se sont annulés (ou des zéros explicites ont été fournis)
+            self._supprimer_zeros()
+
+    def _initialiser(self, name, valeurs, indices, debuts, num_ligne, num_colonne) -> None:
+        self.name = name
+        self.num_ligne = num_ligne
+        self.num_colonne = num_colonne
+        self.taille = num_colonne
+        self._valeurs = valeurs
+        self._indices = indices
+        self._debuts = debuts
+
+    @classmethod
+    def _depuis_csr(cls, name: str, valeurs, indices, debuts, num_ligne: int, num_colonne: int) -> "MatriceCreuse":
+        """Constructeur interne de confiance à partir des trois tampons CSR."""
+        matrice = cls.__new__(cls)
+        matrice._initialiser(name, valeurs, indices, debuts, num_ligne, num_colonne)
+        return matrice
+
+    @classmethod
+    def _depuis_lignes(cls, name: str, lignes: Iterable[Iterable[Tuple[int, float]]],
+                       num_ligne: int, num_colonne: int) -> "MatriceCreuse":
+        """Construit une matrice à partir, pour chaque ligne, de ses couples (colonne, valeur)
+        déjà triés par colonne ; les valeurs nulles sont ignorées."""
+        valeurs = array("d")
+        indices = array("q")
+        debuts = array("q", [0])
+        for ligne in lignes:
+            for j, v in ligne:
+                if v != 0:
+                    indices.append(j)
+                    valeurs.append(v)
+            debuts.append(len(valeurs))
+        return cls._depuis_csr(name, valeurs, indices, debuts, num_ligne, num_colonne)
+
+    @classmethod
+    def depuis_dense(cls, matrice: Matrice, name: str | None = None) -> "MatriceCreuse":
+        """Convertit une Matrice dense en MatriceCreuse."""
+        lignes = (((j, v) for j, v in enumerate(matrice._ligne(i)) if v != 0) for i in range(matrice.num_ligne))
+        return cls._depuis_lignes(name or matrice.name, lignes, matrice.num_ligne, matrice.num_colonne)
+
+    def en_dense(self, name: str | None = None) -> Matrice:
+        """Convertit la matrice en Matrice dense."""
+        dense = matrice_nulle(self.num_ligne, self.num_colonne, name or self.name)
+        tampon, n = dense._data, self.num_colonne
+        for i in range(self.num_ligne):
+            for k in range(self._debuts[i], self._debuts[i + 1]):
+                tampon[i * n + self._indices[k]] = self._valeurs[k]
+        return dense
+
+    def _supprimer_zeros(self) -> None:
+        lignes = (list(self._couples(i)) for i in range(self.num_ligne))
+        copie = MatriceCreuse._depuis_lignes(self.name, lignes, self.num_ligne, self.num_colonne)
+        self._valeurs, self._indices, self._debuts = copie._valeurs, copie._indices, copie._debuts
+
+    def _couples(self, i: int):
+        """Les couples (colonne, valeur) de la ligne i."""
+        a, b = self._debuts[i], self._debuts[i + 1]
+        return zip(self._indices[a:b], self._valeurs[a:b])
+
+    @property
+    def nombre_non_nuls(self) -> int:
+        """Le nombre de coefficients stockés (nnz)."""
+        return len(self._valeurs)
+
+    @property
+    def elements(self) -> List[Vecteur]:
+        """Les lignes de la matrice sous forme de Vecteurs denses (copies)."""
+        return [self.ligne(i) for i in range(self.num_ligne)]
+
+    def ligne(self, i: int) -> Vecteur:
+        """Retourne la ligne i sous forme de Vecteur dense (copie)."""
+        tampon = array("d", [0.0]) * self.num_colonne
+        for j, v in self._couples(i):
+            tampon[j] = v
+        return Vecteur._depuis_tampon(f"{self.name}_{i}", tampon)
+
+    def diagonale(self) -> Vecteur:
+        """Retourne la diagonale sous forme de Vecteur dense (copie)."""
+        taille = min(self.num_ligne, self.num_colonne)
+        return Vecteur._depuis_tampon(f"diag({self.name})", array("d", [self[i, i] for i in range(taille)]))
+
+    def largeurs_de_bande(self) -> Tuple[int, int]:
+        """Retourne (p, q) tels que tout coefficient stocké (i, j) vérifie -p <= j - i <= q ; O(n)."""
+        inferieure = superieure = 0
+        for i in range(self.num_ligne):
+            a, b = self._debuts[i], self._debuts[i + 1]
+            if a < b:
+                inferieure = max(inferieure, i - self._indices[a])
+                superieure = max(superieure, self._indices[b - 1] - i)
+        return inferieure, superieure
+
+    def est_symetrique(self, tolerance: float = 0.0) -> bool:
+        """Vrai si la matrice est carrée et égale à sa transposée (à tolerance près) ; O(nnz)."""
+        if self.num_ligne != self.num_colonne:
+            return False
+        ecart = self - self.transposee()
+        return all(abs(v) <= tolerance for v in ecart._valeurs)
+
+    def structure(self) -> dict:
+        """Détecte la structure de la matrice (voir Matrice.structure)."""
+        bande = self.largeurs_de_bande()
+        return {
+            "forme": forme_de_bande(self.num_ligne, self.num_colonne, *bande),
+            "bande": bande,
+            "symetrique": self.est_symetrique(),
+        }
+
+    def __len__(self) -> int:
+        return self.num_ligne
+
+    def __iter__(self):
+        return (self.ligne(i) for i in range(self.num_ligne))
+
+    def __getitem__(self, index):
+        """matrice[i] retourne la ligne i (dense), matrice[i, j] retourne le coefficient (i, j)."""
+        if not isinstance(index, tuple):
+            return self.ligne(index)
+        i, j = index
+        a, b = self._debuts[i], self._debuts[i + 1]
+        k = bisect_left(self._indices, j, a, b)
+        if k < b and self._indices[k] == j:
+            return self._valeurs[k]
+        return 0.0
+
+    def transposee(self) -> "MatriceCreuse":
+        """Retourne la transposée (au format CSR, c'est-à-dire la matrice au format CSC)."""
+        m, n = self.num_ligne, self.num_colonne
+        debuts = array("q", [0]) * (n + 1)
+        for j in self._indices:
+            debuts[j + 1] += 1
+        for j in range(n):
+            debuts[j + 1] += debuts[j]
+        position = array("q", debuts[:-1])
+        valeurs = array("d", [0.0]) * len(self._valeurs)
+        indices = array("q", [0]) * len(self._valeurs)
+        for i in range(m):
+            for k in range(self._debuts[i], self._debuts[i + 1]):
+                j = self._indices[k]
+                p = position[j]
+                indices[p] = i
+                valeurs[p] = self._valeurs[k]
+                position[j] = p + 1
+        return MatriceCreuse._depuis_csr(f"{self.name}^T", valeurs, indices, debuts, n, m)
+
+    def __str__(self):
+        rows = "\n".join(str(dict(self._couples(i))) for i in range(self.num_ligne))
+        return (f"Matrice creuse {self.name} ({self.num_ligne}x{self.num_colonne}, "
+                f"{self.nombre_non_nuls} non nuls):\n[{rows}]")
+
+    def _verifier_forme(self, other) -> None:
+        if self.num_ligne != other.num_ligne or self.num_colonne != other.num_colonne:
+            raise ValueError("Les matrices n'ont pas la meme taille")
+
+    def _combiner(self, other, signe: int, name: str):
+        self._verifier_forme(other)
+        if isinstance(other, Matrice):
+            dense = other * signe if signe != 1 else other.copie()
+            tampon, n = dense._data, self.num_colonne
+            for i in range(self.num_ligne):
+                for j, v in self._couples(i):
+                    tampon[i * n + j] += v
+            dense.name = name
+            return dense
+        lignes = []
+        for i in range(self.num_ligne):
+            somme = dict(self._couples(i))
+            for j, v in other._couples(i):
+                somme[j] = somme.get(j, 0.0) + signe * v
+            lignes.append(sorted(somme.items()))
+        return MatriceCreuse._depuis_lignes(name, lignes, self.num_ligne, self.num_colonne)
+
+    def __add__(self, other):
+        if not isinstance(other, (Matrice, MatriceCreuse)):
+            return NotImplemented
+        return self._combiner(other, 1, f"{self.name} + {other.name}")
+
+    def __radd__(self, other):
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        return self._combiner(other, 1, f"{other.name} + {self.name}")
+
+    def __sub__(self, other):
+        if not isinstance(other, (Matrice, MatriceCreuse)):
+            return NotImplemented
+        return self._combiner(other, -1, f"{self.name} - {other.name}")
+
+    def __rsub__(self, other):
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        return (-self)._combiner(other, 1, f"{other.name} - {self.name}")
+
+    def __mul__(self, entier: int | float):
+        """Multiplie la matrice par un scalaire (la structure creuse est partagée)"""
+        if not isinstance(entier, (int, float)):
+            raise TypeError("Le multiplicateur doit être un nombre")
+        if entier == 0:
+            return MatriceCreuse._depuis_lignes(f"{self.name} * 0", [[]] * self.num_ligne,
+                                                self.num_ligne, self.num_colonne)
+        valeurs = array("d", [v * entier for v in self._valeurs])
+        return MatriceCreuse._depuis_csr(f"{self.name} * {entier}", valeurs, self._indices, self._debuts,
+                                         self.num_ligne, self.num_colonne)
+
+    def __rmul__(self, entier: int | float):
+        """Permet la multiplication scalaire * matrice"""
+        return self.__mul__(entier)
+
+    def __neg__(self):
+        valeurs = array("d", [-v for v in self._valeurs])
+        return MatriceCreuse._depuis_csr(f"-{self.name}", valeurs, self._indices, self._debuts,
+                                         self.num_ligne, self.num_colonne)
+
+    def mut_vec(self, vecteur: Vecteur) -> Vecteur:
+        """Produit matrice-vecteur en O(nnz)
+
+        Args:
+            vecteur (Vecteur): Le vecteur à multiplier
+
+        Returns:
+            Vecteur: Le produit de la matrice par le vecteur
+
+        Raises:
+            ValueError: Si les dimensions ne sont pas compatibles
+        """
+        if self.num_colonne != vecteur.taille:
+            raise ValueError(f"Dimensions incompatibles: matrice ({self.num_ligne}x{self.num_colonne}) et vecteur ({vecteur.taille})")
+        x = vecteur.elements
+        if backend.utilise_numpy("mut_vec", self.nombre_non_nuls):
+            np = backend.np
+            debuts = np.frombuffer(self._debuts, dtype=np.int64)
+            lignes = np.repeat(np.arange(self.num_ligne), np.diff(debuts))
+            produits = backend.vue(self._valeurs) * backend.vue(x)[np.frombuffer(self._indices, dtype=np.int64)]
+            tampon, sortie = backend.nouveau_tampon(self.num_ligne)
+            sortie[:] = np.bincount(lignes, weights=produits, minlength=self.num_ligne)
+        else:
+            valeurs, indices, debuts = memoryview(self._valeurs), memoryview(self._indices), self._debuts
+            lire = x.__getitem__
+            tampon = array("d", [sum(map(mul, valeurs[debuts[i]:debuts[i + 1]],
+                                         map(lire, indices[debuts[i]:debuts[i + 1]])))
+                                 for i in range(self.num_ligne)])
+        return Vecteur._depuis_tampon(f"{self.name}@{vecteur.name}", tampon)
+
+    def __matmul__(self, other):
+        """Produit matriciel (@) par un Vecteur, une MatriceCreuse ou une Matrice
+
+        Returns:
+            Vecteur | MatriceCreuse | Matrice: Le produit ; creux seulement si other est creuse
+
+        Raises:
+            ValueError: Si les dimensions ne sont pas compatibles
+        """
+        if isinstance(other, Vecteur):
+            return self.mut_vec(other)
+        if not isinstance(other, (Matrice, MatriceCreuse)):
+            return NotImplemented
+        if self.num_colonne != other.num_ligne:
+            raise ValueError("Les matrices ne peuvent pas être multipliées: dimensions incompatibles")
+        name = f"{self.name}@{other.name}"
+
+        if isinstance(other, MatriceCreuse):
+            # Gustavson : la ligne i du produit combine les lignes de other désignées par la ligne i de self
+            lignes = []
+            for i in range(self.num_ligne):
+                somme = {}
+                for k, a in self._couples(i):
+                    for j, b in other._couples(k):
+                        somme[j] = somme.get(j, 0.0) + a * b
+                lignes.append(sorted(somme.items()))
+            return MatriceCreuse._depuis_lignes(name, lignes, self.num_ligne, other.num_colonne)
+
+        resultat = matrice_nulle(self.num_ligne, other.num_colonne, name)
+        for i in range(self.num_ligne):
+            ligne = resultat._ligne(i)
+            for k, a in self._couples(i):
+                ligne[:] = array("d", [x + a * y for x, y in zip(ligne, other._ligne(k))])
+        return resultat
+
+    def __rmatmul__(self, other):
+        """Produit Matrice dense @ MatriceCreuse, calculé comme (self^T @ other^T)^T."""
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        if other.num_colonne != self.num_ligne:
+            raise ValueError("Les matrices ne peuvent pas être multipliées: dimensions incompatibles")
+        produit = (self.transposee() @ other.transposee()).transposee()
+        produit.name = f"{other.name}@{self.name}"
+        return produit
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (Matrice, MatriceCreuse)):
+            return NotImplemented
+        if self.num_ligne != other.num_ligne or self.num_colonne != other.num_colonne:
+            return False
+        if isinstance(other, Matrice):
+            return self.en_dense() == other
+        return (self._debuts == other._debuts and self._indices == other._indices
+                and self._valeurs == other._valeurs)
+
+
+def en_dense(matrice) -> Matrice:
+    """Retourne matrice sous forme de Matrice dense (sans copie si elle l'est déjà)."""
+    return matrice.en_dense() if isinstance(matrice, MatriceCreuse) else matrice
@@ -0,0 +1,208 @@
+"""Évaluation paresseuse des opérations élément par élément sur Matrice et Vecteur.
+
+Une expression comme A + B * 2 - C ne calcule rien tant qu'elle n'est pas évaluée :
+les opérateurs construisent un arbre, et evaluer() le parcourt une seule fois, élément
+par élément, en écrivant directement dans l'unique tampon résultat. Aucune matrice
+intermédiaire n'est créée.
+
+Deux façons de l'activer :
+    paresseux(A) + paresseux(B) * 2 - paresseux(C)    # au cas par cas
+    with mode_paresseux():                             # pour tous les opérateurs du bloc
+        expr = A + B * 2 - C
+    resultat = expr.evaluer()
+"""
+from array import array
+from contextlib import contextmanager
+import backend
+
+# Lu par les opérateurs de Matrice et Vecteur : s'il est vrai, ils construisent des Expressions
+PARESSEUX = False
+
+# Fonctions fusionnées déjà compilées, indexées par leur code source
+_fonctions_compilees = {}
+
+
+@contextmanager
+def mode_paresseux(actif: bool = True):
+    """Bloc dans lequel les opérateurs +, -, * et - unaire de Matrice/Vecteur sont paresseux."""
+    global PARESSEUX
+    precedent = PARESSEUX
+    PARESSEUX = actif
+    try:
+        yield
+    finally:
+        PARESSEUX = precedent
+
+
+def paresseux(objet) -> "Expression":
+    """Enveloppe une Matrice ou un Vecteur dans une Expression (sans copie)."""
+    return objet if isinstance(objet, Expression) else Feuille(objet)
+
+
+class Expression:
+    """Noeud d'un arbre d'opérations élément par élément."""
+    __slots__ = ("forme",)
+
+    def _source(self, feuilles: list, constantes: list) -> str:
+        """Code Python de l'expression ; complète feuilles et constantes dans l'ordre de parcours."""
+        raise NotImplementedError
+
+    def _formule(self) -> str:
+        raise NotImplementedError
+
+    def __add__(self, other):
+        return Binaire("+", self, _operande(other))
+
+    def __radd__(self, other):
+        return Binaire("+", _operande(other), self)
+
+    def __sub__(self, other):
+        return Binaire("-", self, _operande(other))
+
+    def __rsub__(self, other):
+        return Binaire("-", _operande(other), self)
+
+    def __mul__(self, coef: int | float):
+        if not isinstance(coef, (int, float)):
+            raise TypeError("Le multiplicateur doit être un nombre")
+        return Echelle(self, coef)
+
+    def __rmul__(self, coef: int | float):
+        return self.__mul__(coef)
+
+    def __neg__(self):
+        return Echelle(self, -1)
+
+    def __str__(self):
+        return f"Expression {self._formule()}"
+
+    def evaluer(self, name: str | None = None):
+        """Évalue l'expression en un seul passage et retourne une Matrice ou un Vecteur.
+
+        Args:
+            name (str, optional): Le nom du résultat (par défaut, la formule)
+
+        Returns:
+            Matrice | Vecteur: Le résultat, du même type que la première opérande
+        """
+        feuilles = []
+        constantes = []
+        source = self._source(feuilles, constantes)
+        tampons = [feuille.valeurs() for feuille in feuilles]
+        taille = len(tampons[0])
+
+        if backend.utilise_numpy("matrice" if len(self.forme) == 2 else "vecteur", taille):
+            tampon, sortie = backend.nouveau_tampon(taille)
+            _evaluer_numpy(self, sortie, iter(tampons))
+        else:
+            fonction = _compiler(source, len(feuilles), len(constantes))(*constantes)
+            tampon = array("d", map(fonction, *tampons))
+
+        modele = feuilles[0].objet
+        if name is None:
+            name = self._formule()
+        if len(self.forme) == 2:
+            return type(modele)._depuis_tampon(name, tampon, *self.forme)
+        return type(modele)._depuis_tampon(name, tampon)
+
+
+class Feuille(Expression):
+    """Une Matrice ou un Vecteur existant."""
+    __slots__ = ("objet",)
+
+    def __init__(self, objet):
+        self.objet = objet
+        self.forme = (objet.num_ligne, objet.num_colonne) if hasattr(objet, "num_ligne") else (objet.taille,)
+
+    def valeurs(self):
+        """Les éléments en ligne-majeure (sans copie si possible)."""
+        return self.objet._valeurs() if hasattr(self.objet, "_valeurs") else self.objet.elements
+
+    def _source(self, feuilles: list, constantes: list) -> str:
+        feuilles.append(self)
+        return f"a{len(feuilles) - 1}"
+
+    def _formule(self) -> str:
+        return self.objet.name
+
+
+class Binaire(Expression):
+    """Somme ou différence élément par élément de deux expressions de même forme."""
+    __slots__ = ("operateur", "gauche", "droite")
+
+    def __init__(self, operateur: str, gauche: Expression, droite: Expression):
+        if gauche.forme != droite.forme:
+            raise ValueError(f"Formes incompatibles: {gauche.forme} et {droite.forme}")
+        self.operateur = operateur
+        self.gauche = gauche
+        self.droite = droite
+        self.forme = gauche.forme
+
+    def _source(self, feuilles: list, constantes: list) -> str:
+        return f"({self.gauche._source(feuilles, constantes)} {self.operateur} {self.droite._source(feuilles, constantes)})"
+
+    def _formule(self) -> str:
+        return f"({self.gauche._formule()} {self.operateur} {self.droite._formule()})"
+
+
+class Echelle(Expression):
+    """Multiplication d'une expression par un scalaire."""
+    __slots__ = ("operande", "coef")
+
+    def __init__(self, operande: Expression, coef: int | float):
+        self.operande = operande
+        self.coef = coef
+        self.forme = operande.forme
+
+    def _source(self, feuilles: list, constantes: list) -> str:
+        constantes.append(self.coef)
+        nom = f"c{len(constantes) - 1}"
+        return f"({self.operande._source(feuilles, constantes)} * {nom})"
+
+    def _formule(self) -> str:
+        return f"({self.operande._formule()} * {self.coef})"
+
+
+def _operande(other) -> Expression:
+    if isinstance(other, Expression):
+        return other
+    if hasattr(other, "_depuis_tampon"):
+        return Feuille(other)
+    raise TypeError(f"Opérande non supportée: {type(other).__name__}")
+
+
+def _compiler(source: str, nombre_feuilles: int, nombre_constantes: int):
+    """Compile l'arbre en une fabrique de fonctions scalaires fusionnées.
+
+    La fabrique reçoit les constantes et retourne la fonction appliquée ensuite élément par
+    élément. Le code ne contient que des noms générés (a0, a1, ..., c0, ...) et des opérateurs,
+    ce qui permet de le compiler une seule fois par forme d'expression.
+    """
+    cle = (source, nombre_feuilles, nombre_constantes)
+    fabrique = _fonctions_compilees.get(cle)
+    if fabrique is None:
+        constantes = ", ".join(f"c{i}" for i in range(nombre_constantes))
+        feuilles = ", ".join(f"a{i}" for i in range(nombre_feuilles))
+        fabrique = eval(f"lambda {constantes}: lambda {feuilles}: {source}", {})
+        if len(_fonctions_compilees) < 256:
+            _fonctions_compilees[cle] = fabrique
+    return fabrique
+
+
+def _evaluer_numpy(noeud: Expression, sortie, tampons) -> None:
+    """Évalue noeud dans sortie (ndarray 1-D) ; seuls les sous-arbres de droite non réduits
+    à une feuille nécessitent un tampon temporaire."""
+    np = backend.np
+    if isinstance(noeud, Feuille):
+        np.copyto(sortie, backend.vue(next(tampons)))
+    elif isinstance(noeud, Echelle):
+        _evaluer_numpy(noeud.operande, sortie, tampons)
+        np.multiply(sortie, noeud.coef, out=sortie)
+    else:
+        _evaluer_numpy(noeud.gauche, sortie, tampons)
+        if isinstance(noeud.droite, Feuille):
+            droite = backend.vue(next(tampons))
+        else:
+            droite = np.empty_like(sortie)
+            _evaluer_numpy(noeud.droite, droite, tampons)
+        (np.add if noeud.operateur == "+" else np.subtract)(sortie, droite, out=sortie)
@@ -0,0 +1,248 @@
+"""Méthodes itératives de résolution de A x = b : Jacobi, Gauss-Seidel, SOR et gradient conjugué.
+
+Contrairement à Pivot, elles ne modifient pas la matrice et ne la remplissent pas : une
+itération coûte un produit matrice-vecteur (O(nnz) pour une MatriceCreuse). Elles conviennent
+aux grands systèmes à diagonale dominante (Jacobi, Gauss-Seidel, SOR) ou symétriques définis
+positifs (gradient conjugué).
+
+Toutes s'arrêtent dès que le résidu relatif ||b - A x|| / ||b|| passe sous la tolérance, ou
+après iterations_max itérations, et retournent un ResultatIteratif. Le résidu de chaque
+itération est transmis au rappel éventuel rappel(iteration, residu) et au journal (niveau ETAPES).
+"""
+from array import array
+from math import sqrt
+from operator import mul
+from vecteur import Vecteur
+from creuse import MatriceCreuse
+import backend
+import journal
+
+
+class ResultatIteratif:
+    """Résultat d'une méthode itérative."""
+    __slots__ = ("methode", "solution", "iterations", "residus", "converge")
+
+    def __init__(self, methode: str, solution: Vecteur, iterations: int, residus: list, converge: bool):
+        """
+        Args:
+            methode (str): Le nom de la méthode
+            solution (Vecteur): La dernière approximation de x
+            iterations (int): Le nombre d'itérations effectuées
+            residus (list): Le résidu relatif initial puis celui de chaque itération
+            converge (bool): Vrai si la tolérance a été atteinte
+        """
+        self.methode = methode
+        self.solution = solution
+        self.iterations = iterations
+        self.residus = residus
+        self.converge = converge
+
+    @property
+    def residu(self) -> float:
+        """Le dernier résidu relatif."""
+        return self.residus[-1]
+
+    def __str__(self):
+        etat = "convergé" if self.converge else "non convergé"
+        return f"{self.methode} : {etat} en {self.iterations} itérations (résidu {self.residu:.3e})"
+
+
+def _preparer(matrice, second_membre, x0) -> tuple:
+    """Vérifie les dimensions et retourne (b, x, ||b||) avec b et x des Vecteurs (x est une copie)."""
+    if matrice.num_ligne != matrice.num_colonne:
+        raise ValueError("La matrice doit être carrée")
+    n = matrice.num_ligne
+    b = second_membre if isinstance(second_membre, Vecteur) else Vecteur("b", second_membre)
+    if b.taille != n:
+        raise ValueError("Le second membre doit avoir la même taille que la matrice")
+    x = Vecteur("x", [0.0] * n if x0 is None else list(x0))
+    if x.taille != n:
+        raise ValueError("Le point de départ doit avoir la même taille que la matrice")
+    norme_b = sqrt(b @ b)
+    return b, x, norme_b if norme_b != 0 else 1.0
+
+
+def _residu(matrice, b: Vecteur, x: Vecteur) -> Vecteur:
+    """r = b - A x (nouveau Vecteur)."""
+    r = matrice.mut_vec(x)
+    r *= -1
+    r += b
+    return r
+
+
+def _inverse_diagonale(matrice) -> Vecteur:
+    """1 / diag(A) ; la méthode n'est pas définie si un élément diagonal est nul."""
+    diagonale = matrice.diagonale()
+    if any(d == 0 for d in diagonale):
+        raise ValueError("Élément diagonal nul")
+    return Vecteur._depuis_tampon(f"diag({matrice.name})^-1", array("d", [1 / d for d in diagonale]))
+
+
+def _produit_terme_a_terme(u: Vecteur, v: Vecteur) -> Vecteur:
+    if backend.utilise_numpy("vecteur", u.taille):
+        tampon = backend.appliquer(backend.np.multiply, backend.vue(u.elements), backend.vue(v.elements),
+                                   taille=u.taille)
+    else:
+        tampon = array("d", map(mul, u.elements, v.elements))
+    return Vecteur._depuis_tampon(f"{u.name}*{v.name}", tampon)
+
+
+def _produit_ligne(matrice, i: int, x) -> float:
+    """Produit scalaire de la ligne i de la matrice par x (O(nnz de la ligne) si creuse)."""
+    if isinstance(matrice, MatriceCreuse):
+        return sum(v * x[j] for j, v in matrice._couples(i))
+    return sum(map(mul, matrice._ligne(i), x))
+
+
+def _suivre(methode: str, iteration: int, residu: float, residus: list, rappel) -> None:
+    residus.append(residu)
+    if rappel is not None:
+        rappel(iteration, residu)
+    if journal.NIVEAU >= journal.ETAPES:
+        journal.emettre(journal.ETAPES, "iteratif.iteration", f"{methode} itération {iteration}: résidu {residu:.3e}",
+                        methode=methode, iteration=iteration, residu=residu)
+
+
+def _terminer(methode: str, x: Vecteur, iteration: int, residus: list, tolerance: float) -> ResultatIteratif:
+    resultat = ResultatIteratif(methode, x, iteration, residus, residus[-1] <= tolerance)
+    if journal.NIVEAU >= journal.RESUME:
+        journal.emettre(journal.RESUME, "iteratif.fin", str(resultat), methode=methode,
+                        iterations=iteration, residu=residus[-1], converge=resultat.converge)
+    return resultat
+
+
+def jacobi(matrice, second_membre, x0=None, tolerance: float = 1e-10, iterations_max: int = 1000,
+           rappel=None) -> ResultatIteratif:
+    """Méthode de Jacobi : x <- x + D^-1 (b - A x).
+
+    N'accède à la matrice que par mut_vec et diagonale. Converge si A est à diagonale
+    strictement dominante.
+
+    Args:
+        matrice (Matrice | MatriceCreuse): La matrice carrée A
+        second_membre (list | Vecteur): Le second membre b
+        x0 (list | Vecteur, optional): Le point de départ (zéro par défaut)
+        tolerance (float): Le résidu relatif visé
+        iterations_max (int): Le nombre maximal d'itérations
+        rappel (callable, optional): Appelé avec (iteration, residu) à chaque itération
+
+    Returns:
+        ResultatIteratif: La solution approchée et l'historique des résidus
+
+    Raises:
+        ValueError: Si les dimensions sont incompatibles ou si un élément diagonal est nul
+    """
+    b, x, norme_b = _preparer(matrice, second_membre, x0)
+    inverse_d = _inverse_diagonale(matrice)
+    residus = []
+    iteration = 0
+    while True:
+        r = _residu(matrice, b, x)
+        _suivre("Jacobi", iteration, sqrt(r @ r) / norme_b, residus, rappel)
+        if residus[-1] <= tolerance or iteration == iterations_max:
+            return _terminer("Jacobi", x, iteration, residus, tolerance)
+        x += _produit_terme_a_terme(inverse_d, r)
+        iteration += 1
+
+
+def sor(matrice, second_membre, omega: float = 1.5, x0=None, tolerance: float = 1e-10,
+        iterations_max: int = 1000, rappel=None) -> ResultatIteratif:
+    """Sur-relaxation successive : balayage de Gauss-Seidel pondéré par omega.
+
+    Chaque balayage met à jour x composante par composante en utilisant les composantes
+    déjà mises à jour ; il lit donc la matrice ligne par ligne (sans copie pour une Matrice,
+    en O(nnz) pour une MatriceCreuse) en plus du produit mut_vec du résidu.
+
+    Args:
+        matrice (Matrice | MatriceCreuse): La matrice carrée A
+        second_membre (list | Vecteur): Le second membre b
+        omega (float): Le facteur de relaxation, dans ]0, 2[ (1 pour Gauss-Seidel)
+        x0 (list | Vecteur, optional): Le point de départ (zéro par défaut)
+        tolerance (float): Le résidu relatif visé
+        iterations_max (int): Le nombre maximal d'itérations
+        rappel (callable, optional): Appelé avec (iteration, residu) à chaque itération
+
+    Returns:
+        ResultatIteratif: La solution approchée et l'historique des résidus
+
+    Raises:
+        ValueError: Si les dimensions sont incompatibles, si omega n'est pas dans ]0, 2[
+                    ou si un élément diagonal est nul
+    """
+    if not 0 < omega < 2:
+        raise ValueError("Le facteur de relaxation doit être dans ]0, 2[")
+    methode = "Gauss-Seidel" if omega == 1 else f"SOR (omega={omega})"
+    b, x, norme_b = _preparer(matrice, second_membre, x0)
+    inverse_d = _inverse_diagonale(matrice)
+    valeurs = x.elements
+    iteration = 0
+    residus = []
+    while True:
+        r = _residu(matrice, b, x)
+        _suivre(methode, iteration, sqrt(r @ r) / norme_b, residus, rappel)
+        if residus[-1] <= tolerance or iteration == iterations_max:
+            return _terminer(methode, x, iteration, residus, tolerance)
+        for i in range(matrice.num_ligne):
+            valeurs[i] += omega * (b[i] - _produit_ligne(matrice, i, valeurs)) * inverse_d[i]
+        iteration += 1
+
+
+def gauss_seidel(matrice, second_membre, x0=None, tolerance: float = 1e-10, iterations_max: int = 1000,
+                 rappel=None) -> ResultatIteratif:
+    """Méthode de Gauss-Seidel (SOR avec omega = 1) ; voir sor."""
+    return sor(matrice, second_membre, 1, x0, tolerance, iterations_max, rappel)
+
+
+def gradient_conjugue(matrice, second_membre, x0=None, tolerance: float = 1e-10, iterations_max: int | None = None,
+                      preconditionner: bool = False, rappel=None) -> ResultatIteratif:
+    """Gradient conjugué, éventuellement préconditionné par la diagonale (Jacobi).
+
+    N'accède à la matrice que par mut_vec (et diagonale si preconditionner). En arithmétique
+    exacte, converge en au plus n itérations pour A symétrique définie positive.
+
+    Args:
+        matrice (Matrice | MatriceCreuse): La matrice A, symétrique définie positive
+        second_membre (list | Vecteur): Le second membre b
+        x0 (list | Vecteur, optional): Le point de départ (zéro par défaut)
+        tolerance (float): Le résidu relatif visé
+        iterations_max (int, optional): Le nombre maximal d'itérations (2n par défaut)
+        preconditionner (bool): Utilise M = diag(A) comme préconditionneur
+        rappel (callable, optional): Appelé avec (iteration, residu) à chaque itération
+
+    Returns:
+        ResultatIteratif: La solution approchée et l'historique des résidus
+
+    Raises:
+        ValueError: Si les dimensions sont incompatibles ou si la matrice n'est pas
+                    définie positive
+    """
+    methode = "Gradient conjugué préconditionné" if preconditionner else "Gradient conjugué"
+    b, x, norme_b = _preparer(matrice, second_membre, x0)
+    if iterations_max is None:
+        iterations_max = 2 * matrice.num_ligne
+    inverse_d = _inverse_diagonale(matrice) if preconditionner else None
+
+    r = _residu(matrice, b, x)
+    z = _produit_terme_a_terme(inverse_d, r) if preconditionner else r
+    direction = Vecteur._depuis_tampon("p", array("d", z.elements))
+    rz = r @ z
+    residus = []
+    iteration = 0
+    while True:
+        _suivre(methode, iteration, sqrt(r @ r) / norme_b, residus, rappel)
+        if residus[-1] <= tolerance or iteration == iterations_max:
+            return _terminer(methode, x, iteration, residus, tolerance)
+        q = matrice.mut_vec(direction)
+        courbure = direction @ q
+        if courbure <= 0:
+            raise ValueError("La matrice n'est pas définie positive")
+        alpha = rz / courbure
+        x.axpy(alpha, direction)
+        r.axpy(-alpha, q)
+        z = _produit_terme_a_terme(inverse_d, r) if preconditionner else r
+        rz_suivant = r @ z
+        # p <- z + beta p, en place
+        direction *= rz_suivant / rz
+        direction += z
+        rz = rz_suivant
+        iteration += 1
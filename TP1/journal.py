@@ -0,0 +1,84 @@
+"""Traces des calculs de vecteur, matrice, pivot et simplex.
+
+Quatre niveaux :
+    SILENCIEUX  aucune trace (par défaut)
+    RESUME      une ligne par résultat important (lecture, solution, fin de phase...)
+    ETAPES      le détail de chaque étape (pivot choisi, variables entrante/sortante...)
+    COMPLET     l'affichage complet des matrices et tableaux, et des destructions d'objets
+
+Les appels sont toujours protégés par un test sur NIVEAU :
+    if journal.NIVEAU >= journal.ETAPES:
+        journal.emettre(journal.ETAPES, "pivot.etape", f"Étape {i+1}", ligne=i)
+de sorte qu'une trace désactivée ne coûte qu'une comparaison d'entiers : le message
+n'est jamais construit.
+
+Chaque trace est transmise aux abonnés sous la forme (evenement, niveau, message, donnees).
+L'abonné par défaut, afficher, écrit le message sur la sortie standard.
+"""
+from contextlib import contextmanager
+
+SILENCIEUX = 0
+RESUME = 1
+ETAPES = 2
+COMPLET = 3
+
+# Lu directement par les modules instrumentés
+NIVEAU = SILENCIEUX
+
+
+def afficher(evenement: str, niveau: int, message: str, donnees: dict) -> None:
+    """Abonné par défaut : affiche le message."""
+    print(message)
+
+
+_abonnes = [afficher]
+_observateurs_niveau = []
+
+
+def configurer(niveau: int) -> None:
+    """Change le niveau de trace.
+
+    Raises:
+        ValueError: Si le niveau n'est pas l'un de SILENCIEUX, RESUME, ETAPES, COMPLET
+    """
+    global NIVEAU
+    if niveau not in (SILENCIEUX, RESUME, ETAPES, COMPLET):
+        raise ValueError(f"Niveau de trace inconnu: {niveau}")
+    NIVEAU = niveau
+    for observateur in _observateurs_niveau:
+        observateur(niveau)
+
+
+@contextmanager
+def niveau_temporaire(niveau: int):
+    """Bloc exécuté avec un autre niveau de trace."""
+    precedent = NIVEAU
+    configurer(niveau)
+    try:
+        yield
+    finally:
+        configurer(precedent)
+
+
+def abonner(fonction) -> None:
+    """Ajoute un abonné fonction(evenement, niveau, message, donnees)."""
+    if fonction not in _abonnes:
+        _abonnes.append(fonction)
+
+
+def desabonner(fonction) -> None:
+    """Retire un abonné (par exemple afficher, pour ne plus rien écrire à l'écran)."""
+    if fonction in _abonnes:
+        _abonnes.remove(fonction)
+
+
+def observer_niveau(fonction) -> None:
+    """Appelle fonction(niveau) à chaque changement de niveau (et immédiatement)."""
+    _observateurs_niveau.append(fonction)
+    fonction(NIVEAU)
+
+
+def emettre(niveau: int, evenement: str, message: str, **donnees) -> None:
+    """Transmet une trace aux abonnés ; à n'appeler que si NIVEAU >= niveau."""
+    for abonne in _abonnes:
+        abonne(evenement, niveau, message, donnees)
@@ -0,0 +1,261 @@
+"""Lecture rapide et silencieuse des fichiers de systèmes linéaires et de problèmes du simplexe.
+
+Le fichier est lu en binaire par blocs de TAILLE_BLOC octets et découpé en lignes au fil de
+l'eau : il n'est jamais chargé en entier en mémoire. Les coefficients sont convertis
+directement depuis les octets (float accepte bytes) et ajoutés au tampon array('d') final de
+la Matrice : aucune matrice intermédiaire, aucune liste de lignes.
+
+Toute erreur de format lève une ErreurLecture qui indique le fichier et le numéro de ligne.
+"""
+from array import array
+import warnings
+from matrice import Matrice
+from vecteur import Vecteur
+from creuse import MatriceCreuse
+import backend
+
+TAILLE_BLOC = 1 << 20
+
+
+class ErreurLecture(ValueError):
+    """Erreur de format dans un fichier, localisée par son numéro de ligne."""
+
+    def __init__(self, fichier, ligne: int | None, message: str):
+        position = "fin du fichier" if ligne is None else f"ligne {ligne}"
+        super().__init__(f"{fichier}, {position}: {message}")
+        self.fichier = fichier
+        self.ligne = ligne
+
+
+def lignes(fichier, taille_bloc: int = TAILLE_BLOC):
+    """Itère sur les lignes du fichier, lues par blocs.
+
+    Yields:
+        tuple: (numéro de ligne à partir de 1, contenu de la ligne en bytes sans le saut de ligne)
+    """
+    with open(fichier, "rb") as f:
+        numero = 0
+        reste = b""
+        while True:
+            bloc = f.read(taille_bloc)
+            if not bloc:
+                break
+            morceaux = (reste + bloc).split(b"\n")
+            reste = morceaux.pop()
+            for morceau in morceaux:
+                numero += 1
+                yield numero, morceau
+        if reste:
+            yield numero + 1, reste
+
+
+def _nombres(fichier, numero: int, ligne: bytes) -> array:
+    """Convertit une ligne de nombres séparés par des blancs.
+
+    Les longues lignes sont converties par NumPy si la couche de calcul le permet (voir
+    backend.SEUILS["lecture"]) ; le chemin Python sert aussi à localiser une valeur invalide.
+    """
+    if backend.utilise_numpy("lecture", len(ligne)):
+        try:
+            with warnings.catch_warnings():
+                # Les anciennes versions de NumPy tronquent la lecture avec un simple avertissement
+                warnings.simplefilter("error")
+                valeurs = backend.np.fromstring(ligne, sep=" ")
+        except (ValueError, DeprecationWarning):
+            pass
+        else:
+            tampon = array("d")
+            tampon.frombytes(valeurs.tobytes())
+            return tampon
+    champs = ligne.split()
+    try:
+        return array("d", map(float, champs))
+    except ValueError:
+        invalides = []
+        for champ in champs:
+            try:
+                float(champ)
+            except ValueError:
+                invalides.append(champ.decode(errors="replace"))
+        raise ErreurLecture(fichier, numero, f"nombre invalide: {', '.join(invalides)}") from None
+
+
+def _entier(fichier, numero: int, ligne: bytes, quoi: str) -> int:
+    try:
+        return int(ligne)
+    except ValueError:
+        raise ErreurLecture(fichier, numero, f"{quoi} attendu (entier), lu: {ligne.decode(errors='replace').strip()!r}") from None
+
+
+def _suivante(fichier, flux, quoi: str) -> tuple:
+    for numero, ligne in flux:
+        return numero, ligne
+    raise ErreurLecture(fichier, None, f"il manque {quoi}")
+
+
+def lire_systeme(fichier, name: str = "A") -> tuple:
+    """Lit un système au format de txt_en_matrice, en un seul passage.
+
+    Format :
+        nombre d'inconnues
+        noms des inconnues
+        nombre d'équations
+        une ligne de coefficients par équation
+        les composantes du second membre
+
+    Args:
+        fichier (str): Le chemin du fichier
+        name (str): Le nom de la matrice lue
+
+    Returns:
+        tuple: (Matrice, list, list) La matrice, le second membre et les noms des inconnues
+
+    Raises:
+        ErreurLecture: Si le fichier ne respecte pas le format (avec le numéro de ligne)
+    """
+    flux = lignes(fichier)
+    numero, ligne = _suivante(fichier, flux, "le nombre d'inconnues")
+    nombre_inconnues = _entier(fichier, numero, ligne, "nombre d'inconnues")
+
+    numero, ligne = _suivante(fichier, flux, "les noms des inconnues")
+    noms_inconnus = ligne.decode().split()
+    if len(noms_inconnus) != nombre_inconnues:
+        raise ErreurLecture(fichier, numero, f"Le nombre de noms d'inconnues ({len(noms_inconnus)}) ne correspond pas "
+                                             f"au nombre d'inconnues ({nombre_inconnues})")
+
+    numero, ligne = _suivante(fichier, flux, "le nombre d'équations")
+    nombre_equations = _entier(fichier, numero, ligne, "nombre d'équations")
+
+    tampon = array("d")
+    for i in range(nombre_equations):
+        numero, ligne = _suivante(fichier, flux, f"l'équation {i+1}")
+        coefficients = _nombres(fichier, numero, ligne)
+        if len(coefficients) != nombre_inconnues:
+            raise ErreurLecture(fichier, numero, f"Le nombre de coefficients pour l'équation {i+1} ({len(coefficients)}) "
+                                                 f"ne correspond pas au nombre d'inconnues ({nombre_inconnues})")
+        tampon.extend(coefficients)
+
+    numero, ligne = _suivante(fichier, flux, "le second membre")
+    second_membre = _nombres(fichier, numero, ligne)
+    if len(second_membre) != nombre_equations:
+        raise ErreurLecture(fichier, numero, f"Le nombre de valeurs du second membre ({len(second_membre)}) ne correspond "
+                                             f"pas au nombre d'équations ({nombre_equations})")
+    second_membre = second_membre.tolist()
+
+    matrice = Matrice._depuis_tampon(name, tampon, nombre_equations, nombre_inconnues)
+    return matrice, second_membre, noms_inconnus
+
+
+def _couples(fichier, numero: int, champs, nombre_colonnes: int) -> tuple:
+    """Convertit les champs « indice:valeur » d'une ligne creuse (indices de 1 à nombre_colonnes).
+
+    Returns:
+        tuple: (array('q'), array('d')) Les colonnes (à partir de 0) et les valeurs
+    """
+    colonnes = array("q")
+    valeurs = array("d")
+    for champ in champs:
+        indice, _, valeur = champ.partition(b":")
+        try:
+            j = int(indice)
+            v = float(valeur)
+        except ValueError:
+            raise ErreurLecture(fichier, numero, f"coefficient creux invalide: {champ.decode(errors='replace')!r} "
+                                                 f"(attendu indice:valeur)") from None
+        if not 1 <= j <= nombre_colonnes:
+            raise ErreurLecture(fichier, numero, f"indice {j} hors de 1..{nombre_colonnes}")
+        colonnes.append(j - 1)
+        valeurs.append(v)
+    return colonnes, valeurs
+
+
+def lire_probleme_simplex(fichier) -> tuple:
+    """Lit un problème au format de lire_simplex, en un seul passage.
+
+    Format : une première ligne de coûts, puis une contrainte par ligne
+    "a1 a2 ... an <= b" (ou >=, =). Les lignes vides et celles commençant par // sont ignorées.
+    Une contrainte peut aussi être écrite en creux, avec ses seuls coefficients non nuls
+    "j:aj ... <= b" (j de 1 à n, le nombre de coûts) : "1:2 7:-1.5 >= 4".
+
+    Dès qu'une contrainte est écrite en creux, A est une MatriceCreuse (les lignes denses y
+    sont converties) : la mémoire est alors proportionnelle au nombre de coefficients non nuls.
+
+    Args:
+        fichier (str): Le chemin du fichier
+
+    Returns:
+        tuple: (Matrice | MatriceCreuse, Vecteur, Vecteur, list) A, b, c et les types de contraintes
+
+    Raises:
+        ErreurLecture: Si le fichier ne respecte pas le format (avec le numéro de ligne)
+    """
+    couts = None
+    tampon = array("d")
+    # Triplets (ligne, colonne, valeur), utilisés à partir de la première contrainte creuse
+    creux = None
+    seconds_membres = array("d")
+    types = []
+    for numero, ligne in lignes(fichier):
+        if ligne.startswith(b"//"):
+            continue
+        champs = ligne.split()
+        if not champs:
+            continue
+        if couts is None:
+            couts = _nombres(fichier, numero, ligne)
+            continue
+
+        for position, champ in enumerate(champs):
+            if champ in (b"<=", b">=", b"="):
+                break
+        else:
+            raise ErreurLecture(fichier, numero, "Type de contrainte manquant")
+        if len(champs) != position + 2:
+            raise ErreurLecture(fichier, numero, "une seule valeur attendue après le type de contrainte")
+        try:
+            second_membre = float(champs[position + 1])
+        except ValueError:
+            _nombres(fichier, numero, champs[position + 1])
+            raise
+
+        i = len(types)
+        if b":" in ligne:
+            if creux is None:
+                creux = (array("q"), array("q"), array("d"))
+                n = len(couts)
+                for k, v in enumerate(tampon):
+                    if v != 0:
+                        creux[0].append(k // n)
+                        creux[1].append(k % n)
+                        creux[2].append(v)
+                tampon = None
+            colonnes, valeurs = _couples(fichier, numero, champs[:position], len(couts))
+            creux[0].extend([i] * len(colonnes))
+            creux[1].extend(colonnes)
+            creux[2].extend(valeurs)
+        else:
+            if position != len(couts):
+                raise ErreurLecture(fichier, numero, f"{position} coefficients, {len(couts)} attendus")
+            try:
+                coefficients = array("d", map(float, champs[:position]))
+            except ValueError:
+                _nombres(fichier, numero, b" ".join(champs[:position]))
+                raise
+            if creux is None:
+                tampon.extend(coefficients)
+            else:
+                for j, v in enumerate(coefficients):
+                    if v != 0:
+                        creux[0].append(i)
+                        creux[1].append(j)
+                        creux[2].append(v)
+        seconds_membres.append(second_membre)
+        types.append(champs[position].decode())
+
+    if couts is None:
+        raise ErreurLecture(fichier, None, "il manque les coûts de la fonction objectif")
+    if creux is not None:
+        A = MatriceCreuse("A", *creux, (len(types), len(couts)))
+    else:
+        A = Matrice._depuis_tampon("A", tampon, len(types), len(couts))
+    return A, Vecteur._depuis_tampon("b", seconds_membres), Vecteur._depuis_tampon("c", couts), types
@@ -0,0 +1,210 @@
+"""Résolution par lots de fichiers de systèmes linéaires et de problèmes du simplexe.
+
+    python lot.py donnees/ "autres/*.txt" --processus 8 --sortie resultats.jsonl
+
+Chaque argument est un fichier, un répertoire (tous ses fichiers .txt et .bin) ou un motif
+glob. Les fichiers sont résolus en parallèle par un groupe de processus et chaque résultat est
+écrit dès qu'il est prêt, sous forme d'une ligne JSON :
+    {"fichier": ..., "type": "systeme" | "simplex", "statut": ..., "duree": secondes, ...}
+Le statut vaut "ok" (système résolu), "sans_second_membre" (fichier binaire qui ne contient
+que la matrice), "optimal", "non_borne", "irrealisable" ou "max_iterations" (simplexe), ou
+"erreur" ; dans ce dernier cas, "erreur" donne le type et le message de l'exception. Pour un
+fichier binaire à plusieurs seconds membres, "solution" est la liste des solutions, une par
+colonne.
+"""
+import argparse
+import glob
+import json
+from multiprocessing import Pool
+import os
+import sys
+import time
+from matrice import Matrice
+import pivot
+import simplex
+
+EXTENSIONS = (".txt", ".bin")
+OPERATEURS = (b"<=", b">=", b"=")
+
+
+def fichiers(chemins) -> list:
+    """Développe fichiers, répertoires et motifs glob en une liste triée de fichiers, sans doublons."""
+    trouves = set()
+    for chemin in chemins:
+        if os.path.isdir(chemin):
+            for racine, _, noms in os.walk(chemin):
+                trouves.update(os.path.join(racine, nom) for nom in noms if nom.endswith(EXTENSIONS))
+        elif os.path.isfile(chemin):
+            trouves.add(chemin)
+        else:
+            trouves.update(f for f in glob.glob(chemin, recursive=True) if os.path.isfile(f))
+    return sorted(trouves)
+
+
+def type_fichier(chemin: str) -> str:
+    """Devine le format : binaire (pivot.sauvegarder), système (txt_en_matrice) ou simplexe (lire_simplex).
+
+    Un fichier système commence par le nombre d'inconnues, seul sur sa ligne, suivi des noms
+    des inconnues ; un fichier du simplexe commence par les coûts de la fonction objectif,
+    suivis des contraintes. Un problème du simplexe à une seule variable commence lui aussi
+    par un entier seul : c'est la deuxième ligne qui tranche (un opérateur de contrainte
+    <=, >= ou = désigne le simplexe).
+    """
+    if chemin.endswith(".bin"):
+        return "binaire"
+    premiere = None
+    with open(chemin, "rb") as f:
+        for ligne in f:
+            champs = ligne.split()
+            if not champs or ligne.startswith(b"//"):
+                continue
+            if premiere is None:
+                if not (len(champs) == 1 and champs[0].isdigit()):
+                    return "simplex"
+                premiere = champs
+                continue
+            return "simplex" if any(champ in OPERATEURS for champ in champs) else "systeme"
+    return "simplex"
+
+
+def resoudre_colonnes(matrice, seconds_membres) -> list:
+    """Résout A X = B pour plusieurs seconds membres (les colonnes de B).
+
+    Une matrice carrée est factorisée une seule fois, puis chaque colonne est résolue avec
+    la factorisation ; sinon, toutes les colonnes sont éliminées ensemble par pivot_de_gauss.
+
+    Returns:
+        list: Une solution (liste) par colonne de B
+    """
+    if matrice.num_ligne == matrice.num_colonne:
+        factorisation = pivot.Pivot().factoriser(matrice)
+        return [factorisation.resoudre(seconds_membres._colonne(j).tolist())
+                for j in range(seconds_membres.num_colonne)]
+    _, solutions = pivot.Pivot().pivot_de_gauss(matrice, seconds_membres)
+    return [solutions._colonne(j).tolist() for j in range(solutions.num_colonne)]
+
+
+def resoudre_fichier(tache: tuple) -> dict:
+    """Lit et résout un fichier ; ne lève jamais d'exception (l'erreur est dans le résultat)."""
+    chemin, type_force = tache
+    resultat = {"fichier": chemin, "type": type_force}
+    debut = time.perf_counter()
+    try:
+        genre = type_force if type_force != "auto" else type_fichier(chemin)
+        resultat["type"] = "simplex" if genre == "simplex" else "systeme"
+        if genre == "simplex":
+            A, b, c, types = simplex.lire_simplex(chemin)
+            probleme = simplex.Simplex(A, b, c, types)
+            probleme.resoudre()
+            resultat["statut"] = probleme.statistiques["statut"]
+            resultat["iterations"] = probleme.statistiques["iterations"]
+            if probleme.optimal:
+                resultat["solution"] = probleme.solution
+                resultat["valeur_optimale"] = probleme.valeur_optimale
+        else:
+            if genre == "binaire":
+                matrice, second_membre, noms = pivot.charger(chemin)
+            else:
+                matrice, second_membre, noms = pivot.txt_en_matrice(chemin)
+            resultat["noms"] = noms
+            if second_membre is None:
+                # Fichier binaire sans second membre : une matrice seule, rien à résoudre
+                resultat["statut"] = "sans_second_membre"
+            elif isinstance(second_membre, Matrice):
+                resultat["statut"] = "ok"
+                resultat["solution"] = resoudre_colonnes(matrice, second_membre)
+            else:
+                if matrice.num_ligne == matrice.num_colonne:
+                    solution = pivot.Pivot().resoudre(matrice, second_membre)
+                else:
+                    _, solution = pivot.Pivot().pivot_de_gauss(matrice, second_membre)
+                resultat["statut"] = "ok"
+                resultat["solution"] = solution
+    except Exception as erreur:
+        resultat["statut"] = "erreur"
+        resultat["erreur"] = f"{type(erreur).__name__}: {erreur}"
+    resultat["duree"] = time.perf_counter() - debut
+    return resultat
+
+
+def _en_json(valeur):
+    """Convertit les valeurs que json ne connaît pas (Vecteur, array, scalaires NumPy...)."""
+    if hasattr(valeur, "tolist"):
+        return valeur.tolist()
+    if hasattr(valeur, "__iter__"):
+        return list(valeur)
+    if hasattr(valeur, "__float__"):
+        return float(valeur)
+    raise TypeError(f"Valeur non sérialisable en JSON: {type(valeur).__name__}")
+
+
+def ligne_json(resultat: dict) -> str:
+    """Le résultat en une ligne JSON stricte.
+
+    Si une valeur ne peut pas être écrite, y compris un nombre infini ou NaN (une solution qui
+    déborde), que JSON ne représente pas, le résultat est remplacé (en place) par une erreur
+    plutôt que d'interrompre le lot.
+    """
+    try:
+        return json.dumps(resultat, ensure_ascii=False, default=_en_json, allow_nan=False)
+    except (TypeError, ValueError) as erreur:
+        conserves = {cle: resultat.get(cle) for cle in ("fichier", "type", "duree")}
+        resultat.clear()
+        resultat.update(conserves, statut="erreur", erreur=f"{type(erreur).__name__}: {erreur}")
+        return json.dumps(resultat, ensure_ascii=False)
+
+
+def resoudre_lot(chemins, type_force: str = "auto", processus: int | None = None):
+    """Résout tous les fichiers désignés par chemins.
+
+    Args:
+        chemins (list): Fichiers, répertoires ou motifs glob
+        type_force (str): "auto", "systeme", "binaire" ou "simplex"
+        processus (int, optional): Le nombre de processus (un par cœur par défaut ; 1 pour
+                                   tout résoudre dans le processus courant)
+
+    Yields:
+        dict: Le résultat de chaque fichier, dans l'ordre où ils sont terminés
+    """
+    taches = [(chemin, type_force) for chemin in fichiers(chemins)]
+    if processus is None:
+        processus = os.cpu_count() or 1
+    if processus == 1 or len(taches) <= 1:
+        yield from map(resoudre_fichier, taches)
+        return
+    # Des paquets de quelques fichiers amortissent la communication entre processus
+    paquet = max(1, len(taches) // (4 * processus))
+    with Pool(min(processus, len(taches))) as groupe:
+        yield from groupe.imap_unordered(resoudre_fichier, taches, chunksize=paquet)
+
+
+def main(arguments=None) -> int:
+    analyseur = argparse.ArgumentParser(description="Résolution par lots de systèmes linéaires et de problèmes du simplexe.")
+    analyseur.add_argument("chemins", nargs="+", help="fichiers, répertoires ou motifs glob")
+    analyseur.add_argument("--type", dest="type_force", default="auto",
+                           choices=("auto", "systeme", "binaire", "simplex"), help="format des fichiers (deviné par défaut)")
+    analyseur.add_argument("-j", "--processus", type=int, default=None, help="nombre de processus (un par cœur par défaut)")
+    analyseur.add_argument("-o", "--sortie", default=None, help="fichier JSON lines (sortie standard par défaut)")
+    options = analyseur.parse_args(arguments)
+    if options.processus is not None and options.processus < 1:
+        analyseur.error("le nombre de processus doit être au moins 1")
+
+    sortie = open(options.sortie, "w") if options.sortie else sys.stdout
+    debut = time.perf_counter()
+    total = erreurs = 0
+    try:
+        for resultat in resoudre_lot(options.chemins, options.type_force, options.processus):
+            ligne = ligne_json(resultat)
+            sortie.write(ligne + "\n")
+            sortie.flush()
+            total += 1
+            erreurs += resultat["statut"] == "erreur"
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+    print(f"{total} fichiers, {erreurs} erreurs, {time.perf_counter() - debut:.2f} s", file=sys.stderr)
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
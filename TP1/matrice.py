@@ -1,131 +1,632 @@
-from vecteur import Vecteur
+from array import array
+from collections.abc import Sequence
+from operator import mul
+from vecteur import Vecteur, _axpy_tampon, _multiplier_tampon, _diviser_tampon
 from typing import *
+import backend
+import expression
+import journal
 from vecteur import ieme_canonique
 
-class Matrice : 
+# Taille (en octets) d'un bloc de colonnes réutilisé pendant le produit matriciel : ~ cache L2
+TAILLE_BLOC_OCTETS = 1 << 18
+
+class LignesMatrice(Sequence):
+    """Les lignes d'une Matrice (vues Vecteur sur son tampon), en lecture seule.
+
+    elements[i][j] = v modifie la matrice ; elements[i] = ligne lève une TypeError plutôt que
+    d'être perdu : pour remplacer une ligne, écrire matrice[i] = ligne.
+    """
+    __slots__ = ("_lignes",)
+
+    def __init__(self, lignes):
+        self._lignes = tuple(lignes)
+
+    def __len__(self) -> int:
+        return len(self._lignes)
+
+    def __getitem__(self, i):
+        return self._lignes[i]
+
+    def __iter__(self):
+        return iter(self._lignes)
+
+    def __setitem__(self, i, valeur):
+        raise TypeError("matrice.elements est en lecture seule : utiliser matrice[i] = ligne pour remplacer une ligne")
+
+
+class Matrice :
+    # Stockage : un seul tampon array('d') en ligne-majeure, décrit par sa forme
+    # (num_ligne, num_colonne), ses pas (_pas_ligne, _pas_colonne) et un décalage.
+    __slots__ = ("name", "taille", "num_ligne", "num_colonne",
+                 "_data", "_pas_ligne", "_pas_colonne", "_decalage", "_lignes")
+
     def __init__(self, name: str, elements: List[List[int]]):
         taille = len(elements[0])
         self.name = name
         for liste in elements:
             if len(liste) != taille:
                 raise ValueError("Les vecteurs n'ont pas la même taille")
-        liste_vecteurs= []
-        i = 0
-        for liste in elements:
-            liste_vecteurs.append(Vecteur(f"{name}_{i}", liste))
-            i += 1 
+        tampon = array("d")
+        try:
+            for liste in elements:
+                tampon.extend(liste)
+        except TypeError:
+            raise TypeError("Tous les éléments doivent être des int ou des float.") from None
         self.taille = taille
-        self.elements = liste_vecteurs[:]
         self.num_colonne = taille
-        self.num_ligne = len(liste_vecteurs)
-        
+        self.num_ligne = len(elements)
+        self._data = tampon
+        self._pas_ligne = taille
+        self._pas_colonne = 1
+        self._decalage = 0
+        self._lignes = None
+
+    @classmethod
+    def _depuis_tampon(cls, name: str, tampon, num_ligne: int, num_colonne: int,
+                       pas_ligne: int | None = None, pas_colonne: int = 1, decalage: int = 0) -> "Matrice":
+        """Constructeur interne de confiance : ni copie ni validation.
+
+        Args:
+            name (str): Le nom de la matrice
+            tampon: Un array('d') ou une memoryview de format 'd', partagé avec la matrice
+            num_ligne (int): Le nombre de lignes
+            num_colonne (int): Le nombre de colonnes
+            pas_ligne (int, optional): L'écart dans le tampon entre deux lignes (num_colonne par défaut)
+            pas_colonne (int): L'écart dans le tampon entre deux colonnes
+            decalage (int): La position de l'élément (0, 0) dans le tampon
+        """
+        matrice = cls.__new__(cls)
+        matrice.name = name
+        matrice.taille = num_colonne
+        matrice.num_colonne = num_colonne
+        matrice.num_ligne = num_ligne
+        matrice._data = tampon
+        matrice._pas_ligne = num_colonne if pas_ligne is None else pas_ligne
+        matrice._pas_colonne = pas_colonne
+        matrice._decalage = decalage
+        matrice._lignes = None
+        return matrice
+
+    def _est_contigue(self) -> bool:
+        """Vrai si les éléments se suivent en ligne-majeure dans le tampon."""
+        return self._pas_colonne == 1 and (self._pas_ligne == self.num_colonne or self.num_ligne <= 1)
+
+    def _ligne(self, i: int) -> memoryview:
+        """Vue memoryview (sans copie) sur la ligne i."""
+        debut = self._decalage + i * self._pas_ligne
+        fin = debut + (self.num_colonne - 1) * self._pas_colonne + 1
+        return memoryview(self._data)[debut:fin:self._pas_colonne]
+
+    def _colonne(self, j: int) -> memoryview:
+        """Vue memoryview (sans copie) sur la colonne j."""
+        debut = self._decalage + j * self._pas_colonne
+        fin = debut + (self.num_ligne - 1) * self._pas_ligne + 1
+        return memoryview(self._data)[debut:fin:self._pas_ligne]
+
+    def _valeurs(self):
+        """Tous les éléments en ligne-majeure : une vue si la matrice est contiguë, une copie sinon."""
+        if self._est_contigue():
+            debut = self._decalage
+            return memoryview(self._data)[debut:debut + self.num_ligne * self.num_colonne]
+        valeurs = array("d")
+        for i in range(self.num_ligne):
+            valeurs.extend(self._ligne(i))
+        return valeurs
+
+    def _ecrire(self, valeurs) -> None:
+        """Recopie valeurs (en ligne-majeure) dans le tampon existant.
+
+        Un array('d') ou une memoryview de format 'd' est recopié directement, sans conversion.
+        """
+        if not isinstance(valeurs, (array, memoryview)):
+            valeurs = array("d", valeurs)
+        if self._est_contigue():
+            self._valeurs()[:] = valeurs
+        else:
+            valeurs = memoryview(valeurs)
+            n = self.num_colonne
+            for i in range(self.num_ligne):
+                self._ligne(i)[:] = valeurs[i * n:(i + 1) * n]
+
+    def _ndarray(self):
+        """Vue ndarray 2-D (sans copie) sur la matrice ; réservé au chemin NumPy."""
+        return backend.vue_2d(self._data, self.num_ligne, self.num_colonne,
+                              self._pas_ligne, self._pas_colonne, self._decalage)
+
+    def _numpy(self, operation: str = "matrice") -> bool:
+        return backend.utilise_numpy(operation, self.num_ligne * self.num_colonne)
+
+    def _verifier_forme(self, other) -> None:
+        if self.num_ligne != other.num_ligne or self.num_colonne != other.num_colonne:
+            raise ValueError("Les matrices n'ont pas la meme taille")
+
+    @property
+    def elements(self) -> "LignesMatrice":
+        """Les lignes de la matrice, sous forme de Vecteurs partageant la mémoire de la matrice.
+
+        La séquence est construite au premier accès puis réutilisée : matrice.elements[i][j]
+        coûte O(1). Elle est en lecture seule (voir LignesMatrice).
+        """
+        if self._lignes is None:
+            self._lignes = LignesMatrice(self.ligne(i) for i in range(self.num_ligne))
+        return self._lignes
+
+    def ligne(self, i: int) -> Vecteur:
+        """Retourne la ligne i sous forme de Vecteur (vue, sans copie)."""
+        return Vecteur._depuis_tampon(f"{self.name}_{i}", self._ligne(i))
+
+    def colonne(self, j: int) -> Vecteur:
+        """Retourne la colonne j sous forme de Vecteur (vue, sans copie)."""
+        return Vecteur._depuis_tampon(f"{self.name}_c{j}", self._colonne(j))
+
+    def diagonale(self) -> Vecteur:
+        """Retourne la diagonale sous forme de Vecteur (vue, sans copie)."""
+        debut = self._decalage
+        pas = self._pas_ligne + self._pas_colonne
+        taille = min(self.num_ligne, self.num_colonne)
+        return Vecteur._depuis_tampon(f"diag({self.name})", memoryview(self._data)[debut::pas][:taille])
+
+    def paresseux(self) -> "expression.Expression":
+        """Retourne la matrice enveloppée dans une Expression paresseuse (voir le module expression)."""
+        return expression.Feuille(self)
+
+    def copie(self, name: str | None = None) -> "Matrice":
+        """Retourne une copie contiguë de la matrice."""
+        return Matrice._depuis_tampon(name or self.name, array("d", self._valeurs()),
+                                      self.num_ligne, self.num_colonne)
+
+    def __len__(self) -> int:
+        return self.num_ligne
+
+    def __iter__(self):
+        return (self.ligne(i) for i in range(self.num_ligne))
+
+    def __getitem__(self, index):
+        """matrice[i] retourne la ligne i (vue), matrice[i, j] retourne l'élément (i, j)."""
+        if isinstance(index, tuple):
+            i, j = index
+            return self._data[self._decalage + i * self._pas_ligne + j * self._pas_colonne]
+        return self.ligne(index)
+
+    def __setitem__(self, index, valeur) -> None:
+        """matrice[i, j] = valeur modifie un élément, matrice[i] = liste remplace une ligne."""
+        if isinstance(index, tuple):
+            i, j = index
+            self._data[self._decalage + i * self._pas_ligne + j * self._pas_colonne] = valeur
+        else:
+            self._ligne(index)[:] = array("d", valeur)
+
     def __str__(self):
-        rows = "\n".join(str(vecteur.elements) for vecteur in self.elements)
+        rows = "\n".join(str(self._ligne(i).tolist()) for i in range(self.num_ligne))
         return f"Matrice {self.name}:\n[{rows}]"
 
     def __add__(self, other):
-        if self.taille != other.taille:
-            raise "Les matrices n'ont pas la meme taille"
-        new_elements = [[v1.elements[i] + v2.elements[i] for i in range(self.taille)]
-                   for v1, v2 in zip(self.elements, other.elements)]
-        return Matrice(f"{self.name} + {other.name}", new_elements)
-    
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        if expression.PARESSEUX:
+            return expression.Feuille(self) + other
+        self._verifier_forme(other)
+        if self._numpy():
+            new_elements = backend.somme(self._valeurs(), other._valeurs())
+        else:
+            new_elements = array("d", [x + y for x, y in zip(self._valeurs(), other._valeurs())])
+        return Matrice._depuis_tampon(f"{self.name} + {other.name}", new_elements,
+                                      self.num_ligne, self.num_colonne)
+
     def __neg__(self):
-        new_elements = [[-element for element in vecteur.elements] for vecteur in self.elements]
-        return Matrice(f"-{self.name}", new_elements)
+        if expression.PARESSEUX:
+            return -expression.Feuille(self)
+        if self._numpy():
+            new_elements = backend.oppose(self._valeurs())
+        else:
+            new_elements = array("d", [-x for x in self._valeurs()])
+        return Matrice._depuis_tampon(f"-{self.name}", new_elements, self.num_ligne, self.num_colonne)
 
     def __sub__(self, other):
-        if self.taille != other.taille:
-            raise "Les matrices n'ont pas la meme taille"
-        return self + (-other)
-    
-    def __mul__(self, entier: int | float): 
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        if expression.PARESSEUX:
+            return expression.Feuille(self) - other
+        self._verifier_forme(other)
+        if self._numpy():
+            new_elements = backend.difference(self._valeurs(), other._valeurs())
+        else:
+            new_elements = array("d", [x - y for x, y in zip(self._valeurs(), other._valeurs())])
+        return Matrice._depuis_tampon(f"{self.name} - {other.name}", new_elements,
+                                      self.num_ligne, self.num_colonne)
+
+    def __mul__(self, entier: int | float):
         """Multiplie une matrice par un scalaire"""
         if not isinstance(entier, (int, float)):
             raise TypeError("Le multiplicateur doit être un nombre")
-        new_elements = [[element * entier for element in vecteur.elements] 
-                   for vecteur in self.elements]
-        return Matrice(f"{self.name} * {entier}", new_elements)
+        if expression.PARESSEUX:
+            return expression.Feuille(self) * entier
+        if self._numpy():
+            new_elements = backend.produit(self._valeurs(), entier)
+        else:
+            new_elements = array("d", [x * entier for x in self._valeurs()])
+        return Matrice._depuis_tampon(f"{self.name} * {entier}", new_elements,
+                                      self.num_ligne, self.num_colonne)
 
     def __rmul__(self, entier: int | float):
         """Permet la multiplication scalaire * matrice"""
         return self.__mul__(entier)
-    
+
+    def __iadd__(self, other):
+        """Addition en place (+=)"""
+        self._verifier_forme(other)
+        if self._est_contigue() and self._numpy():
+            backend.en_place("add", self._valeurs(), other._valeurs())
+        else:
+            for i in range(self.num_ligne):
+                _axpy_tampon(self._ligne(i), 1.0, other._ligne(i))
+        return self
+
+    def __isub__(self, other):
+        """Soustraction en place (-=)"""
+        self._verifier_forme(other)
+        if self._est_contigue() and self._numpy():
+            backend.en_place("subtract", self._valeurs(), other._valeurs())
+        else:
+            for i in range(self.num_ligne):
+                _axpy_tampon(self._ligne(i), -1.0, other._ligne(i))
+        return self
+
+    def __imul__(self, entier: int | float):
+        """Multiplication en place (*=) par un scalaire"""
+        if not isinstance(entier, (int, float)):
+            raise TypeError("Le multiplicateur doit être un nombre")
+        if self._est_contigue() and self._numpy():
+            backend.en_place("multiply", self._valeurs(), entier)
+        else:
+            for i in range(self.num_ligne):
+                _multiplier_tampon(self._ligne(i), entier)
+        return self
+
+    def __itruediv__(self, entier: int | float):
+        """Division en place (/=) par un scalaire"""
+        if not isinstance(entier, (int, float)):
+            raise TypeError("Le diviseur doit être un nombre")
+        if entier == 0:
+            raise ZeroDivisionError("Division d'une matrice par zéro")
+        if self._est_contigue() and self._numpy():
+            backend.en_place("divide", self._valeurs(), entier)
+        else:
+            for i in range(self.num_ligne):
+                _diviser_tampon(self._ligne(i), entier)
+        return self
+
+    def axpy_ligne(self, cible: int, alpha: int | float, source: int) -> None:
+        """Opération élémentaire en place : ligne[cible] <- ligne[cible] + alpha * ligne[source]
+
+        Args:
+            cible (int): L'index de la ligne modifiée
+            alpha (int | float): Le coefficient appliqué à la ligne source
+            source (int): L'index de la ligne ajoutée
+        """
+        ligne_cible = self._ligne(cible)
+        if backend.utilise_numpy("vecteur", self.num_colonne):
+            backend.axpy(ligne_cible, alpha, self._ligne(source))
+        else:
+            _axpy_tampon(ligne_cible, alpha, self._ligne(source))
+
+    def multiplier_ligne(self, num_ligne: int, coef: int | float) -> None:
+        """Opération élémentaire en place : ligne[num_ligne] <- coef * ligne[num_ligne]"""
+        ligne = self._ligne(num_ligne)
+        if backend.utilise_numpy("vecteur", self.num_colonne):
+            backend.en_place("multiply", ligne, coef)
+        else:
+            _multiplier_tampon(ligne, coef)
+
+    def diviser_ligne(self, num_ligne: int, coef: int | float) -> None:
+        """Opération élémentaire en place : ligne[num_ligne] <- ligne[num_ligne] / coef"""
+        if coef == 0:
+            raise ZeroDivisionError("Division d'une ligne par zéro")
+        ligne = self._ligne(num_ligne)
+        if backend.utilise_numpy("vecteur", self.num_colonne):
+            backend.en_place("divide", ligne, coef)
+        else:
+            _diviser_tampon(ligne, coef)
+
+    def permuter_lignes(self, i: int, j: int) -> None:
+        """Opération élémentaire en place : échange les lignes i et j"""
+        if i != j:
+            ligne_i, ligne_j = self._ligne(i), self._ligne(j)
+            temporaire = array("d", ligne_i)
+            ligne_i[:] = ligne_j
+            ligne_j[:] = temporaire
+
+    def transposee(self) -> "Matrice":
+        """Retourne la transposée sous forme de vue (sans copie) : seuls les pas sont échangés."""
+        return Matrice._depuis_tampon(f"{self.name}^T", self._data, self.num_colonne, self.num_ligne,
+                                      self._pas_colonne, self._pas_ligne, self._decalage)
+
     def __matmul__(self, other):
-        """Multiplication matricielle (@)
-        
+        """Multiplication matricielle (@) d'une matrice (m x k) par une matrice (k x n)
+
+        Chaque coefficient est un produit scalaire entre une ligne de self et une colonne
+        de other. Les colonnes de other sont d'abord rendues contiguës (une seule copie
+        en O(k.n), évitée si other est déjà une vue transposée), puis traitées par blocs
+        tenant dans le cache : chaque bloc de colonnes est réutilisé pour toutes les
+        lignes de self avant de passer au suivant.
+
         Args:
-            other (Matrice): La matrice à multiplier
-            
+            other (Matrice | Vecteur): La matrice à multiplier (un Vecteur est délégué à mut_vec)
+
         Returns:
             Matrice: Le produit des deux matrices
-            
+
         Raises:
             ValueError: Si les dimensions ne sont pas compatibles
         """
-        if self.taille != other.taille:
+        if isinstance(other, Vecteur):
+            return self.mut_vec(other)
+        if not isinstance(other, Matrice):
+            return NotImplemented
+        if self.num_colonne != other.num_ligne:
             raise ValueError("Les matrices ne peuvent pas être multipliées: dimensions incompatibles")
-            
-        new_elements = []
-        for i in range(self.taille):
-            # Calculate each row of the resulting matrix
-            row_elements = []
-            for k in range(self.taille):
-                element = sum(self.elements[i].elements[j] * other.elements[j].elements[k] 
-                            for j in range(self.taille))
-                row_elements.append(element)
-            new_elements.append(row_elements)  # Append the raw list instead of Vecteur
-        
-        return Matrice(f"{self.name}@{other.name}", new_elements)
-    
+
+        m, k, n = self.num_ligne, self.num_colonne, other.num_colonne
+        if backend.utilise_numpy("matmul", m * k * n):
+            return Matrice._depuis_tampon(f"{self.name}@{other.name}",
+                                          backend.produit_matriciel(self._ndarray(), other._ndarray()), m, n)
+
+        # Lignes de self contiguës
+        gauche = self if self._pas_colonne == 1 else self.copie()
+        lignes = [gauche._ligne(i) for i in range(m)]
+
+        # Colonnes de other contiguës : vue directe si other est une transposée, copie sinon
+        if other._pas_ligne == 1:
+            colonnes = [other._colonne(j) for j in range(n)]
+        else:
+            transposee = array("d")
+            for j in range(n):
+                transposee.extend(other._colonne(j))
+            vue = memoryview(transposee)
+            colonnes = [vue[j * k:(j + 1) * k] for j in range(n)]
+
+        new_elements = array("d", [0.0]) * (m * n)
+        bloc = max(1, TAILLE_BLOC_OCTETS // (8 * max(k, 1)))
+        for j0 in range(0, n, bloc):
+            bloc_colonnes = colonnes[j0:j0 + bloc]
+            j1 = j0 + len(bloc_colonnes)
+            for i in range(m):
+                ligne = lignes[i]
+                new_elements[i * n + j0:i * n + j1] = array("d", [sum(map(mul, ligne, colonne))
+                                                                   for colonne in bloc_colonnes])
+
+        return Matrice._depuis_tampon(f"{self.name}@{other.name}", new_elements, m, n)
+
     def mut_vec(self, vecteur: Vecteur) -> Vecteur:
         """Multiplication élément par élément du vecteur avec chaque ligne de la matrice
-        
+
         Args:
             vecteur (Vecteur): Le vecteur à multiplier avec chaque ligne de la matrice
-            
+
         Returns:
             Vecteur: Le vecteur résultant contenant les produits élément par élément
         """
-        if self.elements[0].taille == vecteur.taille:
-            
-            new_elements = []
-            for elt in self.elements:
-                valeur = 0
-                for i in range(elt.taille):
-                    valeur += elt.elements[i] * vecteur.elements[i]
-                new_elements.append(valeur)
-            return Vecteur(f"{self.name}@{vecteur.name}", new_elements)
+        if self.num_colonne == vecteur.taille:
+            x = vecteur.elements
+            if self._numpy("mut_vec"):
+                new_elements = backend.produit_matrice_vecteur(self._ndarray(), x)
+            else:
+                new_elements = array("d", [sum(map(mul, self._ligne(i), x)) for i in range(self.num_ligne)])
+            return Vecteur._depuis_tampon(f"{self.name}@{vecteur.name}", new_elements)
 
         else:
-            raise ValueError(f"Dimensions incompatibles: matrice ({self.taille}x{self.elements[0].taille}) et vecteur ({vecteur.taille})")
-    
+            raise ValueError(f"Dimensions incompatibles: matrice ({self.num_ligne}x{self.num_colonne}) et vecteur ({vecteur.taille})")
+
+    def mut_vec_lot(self, vecteurs, taille_lot: int | None = None):
+        """Applique la matrice à un bloc de vecteurs, en un seul passage sur la matrice par lot
+
+        Args:
+            vecteurs (Matrice | Iterable[Vecteur]): Soit une matrice dont les colonnes sont les
+                vecteurs à multiplier, soit un itérable (éventuellement un flux) de Vecteurs
+            taille_lot (int, optional): Nombre de vecteurs traités ensemble. Par défaut, autant
+                que de vecteurs tenant dans TAILLE_BLOC_OCTETS
+
+        Returns:
+            Matrice: self @ vecteurs si vecteurs est une Matrice
+            Iterator[Vecteur]: sinon, les produits self @ v, dans l'ordre, calculés lot par lot
+
+        Raises:
+            ValueError: Si un vecteur n'a pas la taille attendue
+        """
+        if isinstance(vecteurs, Matrice):
+            return self @ vecteurs
+        if taille_lot is None:
+            taille_lot = max(1, TAILLE_BLOC_OCTETS // (8 * max(self.num_colonne, 1)))
+        elif taille_lot < 1:
+            raise ValueError("La taille de lot doit être au moins 1")
+        return self._mut_vec_flux(iter(vecteurs), taille_lot)
+
+    def _mut_vec_flux(self, vecteurs, taille_lot: int):
+        """Générateur de mut_vec_lot : l'itérable n'est consommé qu'un lot à la fois."""
+        n = self.num_colonne
+        transposee = self.transposee()
+        while True:
+            lot = []
+            bloc = array("d")
+            for vecteur in vecteurs:
+                if vecteur.taille != n:
+                    raise ValueError(f"Dimensions incompatibles: matrice ({self.num_ligne}x{n}) et vecteur ({vecteur.taille})")
+                lot.append(vecteur)
+                bloc.extend(vecteur.elements)
+                if len(lot) == taille_lot:
+                    break
+            if not lot:
+                return
+            # (lot x n) @ (n x m) : les colonnes de la transposée sont les lignes de self,
+            # donc chaque ligne de self est réutilisée pour tout le lot tant qu'elle est en cache
+            produit = Matrice._depuis_tampon("lot", bloc, len(lot), n) @ transposee
+            for j, vecteur in enumerate(lot):
+                yield Vecteur._depuis_tampon(f"{self.name}@{vecteur.name}", produit._ligne(j))
+
+    def largeurs_de_bande(self) -> Tuple[int, int]:
+        """Retourne (p, q) tels que tout élément non nul (i, j) vérifie -p <= j - i <= q.
+
+        Une matrice diagonale a (0, 0), une tridiagonale (1, 1), une triangulaire
+        supérieure (0, q).
+        """
+        if self._numpy():
+            np = backend.np
+            lignes, colonnes = np.nonzero(self._ndarray())
+            if len(lignes) == 0:
+                return 0, 0
+            ecarts = colonnes - lignes
+            return max(0, int(-ecarts.min())), max(0, int(ecarts.max()))
+
+        inferieure = superieure = 0
+        for i in range(self.num_ligne):
+            ligne = self._ligne(i)
+            # Seules les colonnes hors de la bande déjà trouvée peuvent l'élargir
+            fin = i - inferieure
+            if fin > 0 and any(ligne[:fin]):
+                inferieure = i - next(j for j in range(fin) if ligne[j] != 0)
+            debut = i + superieure + 1
+            if debut < self.num_colonne and any(ligne[debut:]):
+                superieure = next(j for j in range(self.num_colonne - 1, debut - 1, -1) if ligne[j] != 0) - i
+        return inferieure, superieure
+
+    def est_symetrique(self, tolerance: float = 0.0) -> bool:
+        """Vrai si la matrice est carrée et égale à sa transposée (à tolerance près)."""
+        if self.num_ligne != self.num_colonne:
+            return False
+        if self._numpy():
+            a = self._ndarray()
+            return bool(backend.np.all(backend.np.abs(a - a.T) <= tolerance))
+        for i in range(self.num_ligne):
+            ligne = self._ligne(i)[i + 1:]
+            colonne = self._colonne(i)[i + 1:]
+            if tolerance == 0:
+                if ligne != colonne:
+                    return False
+            elif any(abs(a - b) > tolerance for a, b in zip(ligne, colonne)):
+                return False
+        return True
+
+    def structure(self) -> dict:
+        """Détecte la structure de la matrice.
+
+        Returns:
+            dict: {"forme": voir forme_de_bande, "bande": (p, q), "symetrique": bool}
+        """
+        bande = self.largeurs_de_bande()
+        return {
+            "forme": forme_de_bande(self.num_ligne, self.num_colonne, *bande),
+            "bande": bande,
+            "symetrique": self.est_symetrique(),
+        }
+
+    def _factorisation(self):
+        """La factorisation LU de la matrice, prise dans le cache partagé de pivot."""
+        # Import différé : pivot dépend de ce module
+        import pivot
+        return pivot.cache_factorisations.factorisation(self)
+
+    def det(self) -> float:
+        """Déterminant, déduit de la factorisation LU (en cache) : O(n³) la première fois, O(n) ensuite.
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée
+        """
+        if self.num_ligne != self.num_colonne:
+            raise ValueError("La matrice doit être carrée")
+        try:
+            return self._factorisation().determinant()
+        except ValueError:
+            # Pivot nul : matrice singulière
+            return 0.0
+
+    def inverse(self) -> "Matrice":
+        """Inverse, calculée à partir de la factorisation LU (en cache) en un seul passage O(n³).
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        return self._factorisation().inverse()
+
+    def conditionnement(self) -> float:
+        """Estimation du conditionnement κ₁ (voir FactorisationLU.conditionnement), O(n²) une fois
+        la factorisation en cache ; infini pour une matrice singulière.
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée
+        """
+        if self.num_ligne != self.num_colonne:
+            raise ValueError("La matrice doit être carrée")
+        try:
+            return self._factorisation().conditionnement()
+        except ValueError:
+            return float("inf")
+
     def __eq__(self, other) -> bool:
-        if self.taille != other.taille:
+        if self.taille != other.taille or self.num_ligne != other.num_ligne:
             return False
-        for i in range(self.taille):
-            if self.elements[i] != other.elements[i]:
+        for i in range(self.num_ligne):
+            if self.ligne(i) != other.ligne(i):
                 return False
         return True
-    
-    def __del__(self) -> None:
-        print(f"La matrice {self.name} a été supprimée")
-        del self
 
-    
+    def _tracer_suppression(self) -> None:
+        """Trace la suppression de la matrice (installée comme __del__ au niveau COMPLET seulement)"""
+        journal.emettre(journal.COMPLET, "matrice.suppression", f"La matrice {self.name} a été supprimée",
+                        name=self.name)
+
+
+def _suivre_niveau_trace(niveau: int) -> None:
+    if niveau >= journal.COMPLET:
+        Matrice.__del__ = Matrice._tracer_suppression
+    elif "__del__" in Matrice.__dict__:
+        del Matrice.__del__
+
+
+journal.observer_niveau(_suivre_niveau_trace)
+
+
+def forme_de_bande(num_ligne: int, num_colonne: int, inferieure: int, superieure: int) -> str:
+    """Nomme la forme d'une matrice d'après ses largeurs de bande.
+
+    Returns:
+        str: "rectangulaire", "diagonale", "triangulaire inférieure", "triangulaire supérieure",
+             "tridiagonale", "bande" (bande étroite devant la taille) ou "pleine"
+    """
+    if num_ligne != num_colonne:
+        return "rectangulaire"
+    if inferieure == 0 and superieure == 0:
+        return "diagonale"
+    if superieure == 0:
+        return "triangulaire inférieure"
+    if inferieure == 0:
+        return "triangulaire supérieure"
+    if inferieure == 1 and superieure == 1:
+        return "tridiagonale"
+    # Le stockage bande (avec pivot partiel : 2p + q + 1 colonnes) doit rester petit devant n
+    if 2 * (2 * inferieure + superieure + 1) <= num_ligne:
+        return "bande"
+    return "pleine"
+
+
+def matrice_nulle(num_ligne: int, num_colonne: int, name: str = "0") -> Matrice:
+    """Retourne une matrice num_ligne x num_colonne remplie de zéros."""
+    return Matrice._depuis_tampon(name, array("d", [0.0]) * (num_ligne * num_colonne), num_ligne, num_colonne)
+
+
 def ieme_canonique_matrice(taille: int, name=" ") -> Matrice:
     if name == " ":
         name = f"canonique_{taille}"
-    elements = [[0]*taille for _ in range(taille)]
+    matrice = matrice_nulle(taille, taille, name)
     for i in range(taille):
-        elements[i][i] = 1
-    return Matrice(name, elements)
+        matrice[i, i] = 1
+    return matrice
 
 if __name__ == "__main__":
+    journal.configurer(journal.COMPLET)
     m1 = ieme_canonique_matrice(3, "m1")
     m2 = ieme_canonique_matrice(3, "m2")
     m3 = m1 + m2
     print(m3)
     m4 = m3 @ m3
     print(m4)
-    
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Élimination de Gauss-Jordan répartie sur plusieurs processus.
+
+À chaque étape, la mise à jour des lignes non pivot (Pivot.standardiser) est indépendante
+d'une ligne à l'autre. La matrice augmentée est recopiée une seule fois dans un segment de
+mémoire partagée (multiprocessing.shared_memory) : le processus principal choisit le pivot
+et normalise sa ligne, puis chaque processus du groupe standardise sa tranche de lignes
+directement dans ce segment. Rien n'est sérialisé d'une étape à l'autre hormis les indices
+(étape, première ligne, dernière ligne).
+
+Démarrer les processus coûte plus cher que l'élimination d'un petit système : en dessous de
+SEUIL lignes, ou avec un seul processus, Pivot reste sur l'élimination séquentielle.
+"""
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import os
+from matrice import Matrice
+import backend
+import journal
+
+# Nombre de processus (None : un par cœur disponible)
+PROCESSUS = None
+# Nombre minimal de lignes à partir duquel l'élimination est répartie
+SEUIL = 256
+
+# État des processus du groupe, fixé par _attacher
+_memoire = None
+_tampon = None
+_largeur = 0
+_numpy = False
+
+
+def configurer(processus: int | None = None, seuil: int | None = None) -> None:
+    """Modifie le nombre de processus et/ou le seuil de bascule vers l'élimination parallèle.
+
+    Raises:
+        ValueError: Si le nombre de processus est inférieur à 1 ou si le seuil est négatif
+    """
+    global PROCESSUS, SEUIL
+    if processus is not None and processus < 1:
+        raise ValueError("Le nombre de processus doit être au moins 1")
+    if seuil is not None and seuil < 0:
+        raise ValueError("Le seuil doit être positif")
+    if processus is not None:
+        PROCESSUS = processus
+    if seuil is not None:
+        SEUIL = seuil
+
+
+def nombre_processus() -> int:
+    return PROCESSUS if PROCESSUS is not None else (os.cpu_count() or 1)
+
+
+def utilise_parallele(num_ligne: int) -> bool:
+    """Décide si une élimination sur num_ligne lignes doit être répartie."""
+    return num_ligne >= SEUIL and nombre_processus() > 1
+
+
+def _tranches(num_ligne: int, processus: int) -> list:
+    """Découpe les lignes en tranches contiguës de tailles voisines, une par processus."""
+    taille, reste = divmod(num_ligne, processus)
+    tranches = []
+    debut = 0
+    for p in range(processus):
+        fin = debut + taille + (p < reste)
+        if fin > debut:
+            tranches.append((debut, fin))
+        debut = fin
+    return tranches
+
+
+def _attacher(nom: str, largeur: int, numpy: bool) -> None:
+    """Initialisation d'un processus du groupe : s'attache au segment de mémoire partagée."""
+    global _memoire, _tampon, _largeur, _numpy
+    _memoire = SharedMemory(name=nom)
+    _tampon = _memoire.buf.cast("d")
+    _largeur = largeur
+    _numpy = numpy
+
+
+def _standardiser(tache: tuple) -> None:
+    """ligne_i <- ligne_i - a[i, k] * ligne_k pour les lignes i != k de la tranche [debut, fin).
+
+    Les colonnes avant k sont nulles dans la ligne pivot : seules les colonnes k et suivantes
+    sont mises à jour.
+    """
+    k, debut, fin = tache
+    w = _largeur
+    if _numpy:
+        np = backend.np
+        a = backend.vue_2d(_tampon, len(_tampon) // w, w, w, 1, 0)
+        for bas, haut in ((debut, min(fin, k)), (max(debut, k + 1), fin)):
+            if bas < haut:
+                a[bas:haut, k:] -= np.outer(a[bas:haut, k], a[k, k:])
+        return
+    ligne_pivot = _tampon[k * w + k:(k + 1) * w]
+    for i in range(debut, fin):
+        if i != k:
+            coeff = _tampon[i * w + k]
+            if coeff != 0:
+                ligne = _tampon[i * w + k:(i + 1) * w]
+                ligne[:] = array("d", [x - coeff * y for x, y in zip(ligne, ligne_pivot)])
+
+
+def _pivoter(augmentee: Matrice, k: int, n: int) -> bool:
+    """Choisit le pivot de l'étape k (premier non nul de la colonne), puis normalise sa ligne.
+
+    Returns:
+        bool: Faux si la colonne est nulle sous la diagonale (pivot nul partout)
+    """
+    if augmentee[k, k] == 0:
+        for j in range(k + 1, n):
+            if augmentee[j, k] != 0:
+                if journal.NIVEAU >= journal.ETAPES:
+                    journal.emettre(journal.ETAPES, "pivot.permutation",
+                                    f"Étape {k+1}: Permutation des lignes {k+1} et {j+1}", lignes=(k, j))
+                augmentee.permuter_lignes(k, j)
+                break
+        else:
+            return False
+    pivot = augmentee[k, k]
+    if journal.NIVEAU >= journal.ETAPES:
+        journal.emettre(journal.ETAPES, "pivot.etape",
+                        f"Étape {k+1}: Ligne de travail {k+1}\n  - Normalisation par le pivot {pivot}\n"
+                        f"  - Standardisation des autres lignes par rapport à la ligne {k+1}",
+                        etape=k, pivot=pivot)
+    augmentee.diviser_ligne(k, pivot)
+    return True
+
+
+def eliminer(augmentee: Matrice, n: int, processus: int | None = None) -> None:
+    """Gauss-Jordan en place sur une matrice augmentée [A | B] contiguë, A de taille n x n.
+
+    Même choix de pivot et mêmes traces (hors affichage des états intermédiaires) que
+    Pivot.pivot_de_gauss.
+
+    Args:
+        augmentee (Matrice): La matrice augmentée, modifiée en place
+        n (int): Le nombre de lignes (et de colonnes de A)
+        processus (int, optional): Le nombre de processus (nombre_processus() par défaut)
+
+    Raises:
+        ValueError: Si le système est impossible à résoudre (pivot nul partout)
+    """
+    if n == 0:
+        return
+    largeur = augmentee.num_colonne
+    if processus is None:
+        processus = nombre_processus()
+    tranches = _tranches(n, processus)
+    numpy = backend.utilise_numpy("matrice", n * largeur)
+
+    complete = False
+    memoire = SharedMemory(create=True, size=max(8, 8 * n * largeur))
+    try:
+        tampon = memoire.buf.cast("d")
+        partagee = Matrice._depuis_tampon(augmentee.name, tampon[:n * largeur], n, largeur)
+        try:
+            partagee._ecrire(augmentee._valeurs())
+            with Pool(len(tranches), initializer=_attacher, initargs=(memoire.name, largeur, numpy)) as groupe:
+                for k in range(n):
+                    if not _pivoter(partagee, k, n):
+                        break
+                    groupe.map(_standardiser, [(k, debut, fin) for debut, fin in tranches], chunksize=1)
+                else:
+                    augmentee._ecrire(partagee._valeurs())
+                    complete = True
+        finally:
+            # Les vues sur le segment doivent disparaître avant sa fermeture
+            partagee = None
+            tampon.release()
+    finally:
+        try:
+            memoire.close()
+        except BufferError:
+            # Vue encore référencée (par la trace d'une exception) : libérée avec elle
+            pass
+        memoire.unlink()
+    if not complete:
+        raise ValueError("Système impossible à résoudre (pivot nul partout)")
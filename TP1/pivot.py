@@ -1,15 +1,550 @@
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from operator import mul
+import mmap
+import os
+import struct
+import sys
 from vecteur import *
 from matrice import *
+from creuse import MatriceCreuse, en_dense
+import backend
+import bande
+import iteratif
+import journal
+import lecture
+import parallele
 
 def inverse(a):
     return 1/a
 
 
+def en_colonne(valeurs) -> str:
+    """Met en forme un second membre, une valeur par ligne, pour les traces."""
+    return "\n".join(f"[{val}]" for val in valeurs)
+
+
+class FactorisationLU:
+    """Factorisation PA = LU d'une matrice carrée, avec pivot partiel.
+
+    L (triangulaire inférieure à diagonale unité) et U (triangulaire supérieure) sont
+    rangées ensemble dans un seul tampon ligne-majeure : U sur et au-dessus de la
+    diagonale, les multiplicateurs de L en dessous. La factorisation coûte O(n³) une
+    seule fois ; chaque résolution coûte ensuite O(n²).
+
+    La matrice d'origine n'est pas modifiée. En précision "f", les facteurs sont rangés en
+    float32 : deux fois moins de mémoire, au prix d'une solution précise à 1e-7 près environ
+    (voir Pivot.resoudre_precision_mixte pour retrouver la précision double).
+    """
+    __slots__ = ("name", "taille", "precision", "norme_1", "_lu", "permutation", "signe")
+
+    def __init__(self, matrice: Matrice, name: str | None = None, precision: str = "d"):
+        """
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée à factoriser
+            name (str, optional): Le nom de la factorisation (par défaut, celui de la matrice)
+            precision (str): "d" (float64) ou "f" (float32), le type des facteurs stockés
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée, si elle est singulière ou si la
+                        précision est inconnue
+        """
+        if precision not in ("d", "f"):
+            raise ValueError(f"Précision inconnue: {precision} (attendu: d ou f)")
+        matrice = en_dense(matrice)
+        if matrice.num_ligne != matrice.num_colonne:
+            raise ValueError("La matrice doit être carrée")
+        self.name = matrice.name if name is None else name
+        self.taille = n = matrice.num_ligne
+        self.precision = precision
+        # ||A||_1, gardée pour estimer le conditionnement sans la matrice d'origine
+        self.norme_1 = max((sum(map(abs, matrice._colonne(j))) for j in range(n)), default=0.0)
+        # Copie : l'élimination se fait dans ce tampon
+        self._lu = array(precision, matrice._valeurs())
+        # permutation[i] : ligne de la matrice d'origine placée en i-ème position
+        self.permutation = list(range(n))
+        self.signe = 1
+
+        if backend.utilise_numpy("matrice", n * n):
+            self._factoriser_numpy()
+        else:
+            self._factoriser()
+
+    def _permuter(self, i: int, j: int) -> None:
+        self.permutation[i], self.permutation[j] = self.permutation[j], self.permutation[i]
+        self.signe = -self.signe
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "lu.permutation",
+                            f"Étape {i+1}: Permutation des lignes {i+1} et {j+1}", lignes=(i, j))
+
+    def _factoriser(self) -> None:
+        n = self.taille
+        lu = self._lu
+        tampon = memoryview(lu)
+        for k in range(n):
+            # Pivot partiel : le plus grand élément (en valeur absolue) de la colonne k, sous la diagonale
+            colonne = tampon[k * n + k::n]
+            p = max(range(len(colonne)), key=lambda r: abs(colonne[r])) + k
+            if lu[p * n + k] == 0:
+                raise ValueError("Système impossible à résoudre (matrice singulière)")
+            if p != k:
+                ligne_k = array(lu.typecode, tampon[k * n:(k + 1) * n])
+                tampon[k * n:(k + 1) * n] = tampon[p * n:(p + 1) * n]
+                tampon[p * n:(p + 1) * n] = ligne_k
+                self._permuter(k, p)
+
+            pivot = lu[k * n + k]
+            reste_pivot = tampon[k * n + k + 1:(k + 1) * n]
+            for i in range(k + 1, n):
+                facteur = lu[i * n + k] / pivot
+                lu[i * n + k] = facteur
+                if facteur != 0:
+                    reste = tampon[i * n + k + 1:(i + 1) * n]
+                    reste[:] = array(lu.typecode, [x - facteur * y for x, y in zip(reste, reste_pivot)])
+
+    def _factoriser_numpy(self) -> None:
+        n = self.taille
+        np = backend.np
+        a = backend.vue_2d(self._lu, n, n, n, 1, 0)
+        for k in range(n):
+            p = k + int(np.argmax(np.abs(a[k:, k])))
+            if a[p, k] == 0:
+                raise ValueError("Système impossible à résoudre (matrice singulière)")
+            if p != k:
+                a[[k, p]] = a[[p, k]]
+                self._permuter(k, p)
+            a[k + 1:, k] /= a[k, k]
+            # Mise à jour de rang 1 du bloc restant
+            a[k + 1:, k + 1:] -= np.outer(a[k + 1:, k], a[k, k + 1:])
+
+    def resoudre(self, second_membre):
+        """Résout A x = b par substitutions avant (L) et arrière (U).
+
+        Args:
+            second_membre (list | Vecteur): Le second membre b
+
+        Returns:
+            list | Vecteur: La solution x, du même type que le second membre
+
+        Raises:
+            ValueError: Si le second membre n'a pas la taille de la matrice
+        """
+        if len(second_membre) != self.taille:
+            raise ValueError("Le second membre doit avoir la même taille que la matrice")
+        x = self._substituer([float(second_membre[p]) for p in self.permutation])
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "lu.resolution",
+                            f"Solution ({self.name}):\n{en_colonne(x)}", solution=x)
+        if isinstance(second_membre, Vecteur):
+            return Vecteur(f"{self.name}^-1 {second_membre.name}", x)
+        return x
+
+    def _substituer(self, y: list) -> list:
+        """Résout L U x = y en place (y déjà permuté) et retourne x."""
+        n = self.taille
+        lu = memoryview(self._lu)
+        # L z = y
+        for i in range(1, n):
+            y[i] -= sum(map(mul, lu[i * n:i * n + i], y[:i]))
+        # U x = z
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - sum(map(mul, lu[i * n + i + 1:(i + 1) * n], y[i + 1:]))) / lu[i * n + i]
+        return y
+
+    def resoudre_transposee(self, second_membre) -> list:
+        """Résout Aᵀ x = b avec les mêmes facteurs (P A = L U donne Aᵀ Pᵀ = Uᵀ Lᵀ), en O(n²).
+
+        Args:
+            second_membre (Sequence[float]): Le second membre b
+
+        Returns:
+            list: La solution x
+
+        Raises:
+            ValueError: Si le second membre n'a pas la taille de la matrice
+        """
+        n = self.taille
+        if len(second_membre) != n:
+            raise ValueError("Le second membre doit avoir la même taille que la matrice")
+        lu = memoryview(self._lu)
+        w = [float(v) for v in second_membre]
+        # Uᵀ w = b : la ligne i de Uᵀ est la colonne i de U, au-dessus de la diagonale
+        for i in range(n):
+            w[i] = (w[i] - sum(map(mul, lu[i:i * n:n], w[:i]))) / lu[i * n + i]
+        # Lᵀ v = w : la ligne i de Lᵀ est la colonne i de L, sous la diagonale
+        for i in range(n - 2, -1, -1):
+            w[i] -= sum(map(mul, lu[(i + 1) * n + i::n], w[i + 1:]))
+        # x = Pᵀ v
+        x = [0.0] * n
+        for i, p in enumerate(self.permutation):
+            x[p] = w[i]
+        return x
+
+    def determinant(self) -> float:
+        """det(A) = ±(produit de la diagonale de U), le signe venant des permutations, en O(n)."""
+        n = self.taille
+        det = float(self.signe)
+        for u in self._lu[::n + 1]:
+            det *= u
+        return det
+
+    def inverse(self, name: str | None = None) -> Matrice:
+        """Calcule A⁻¹ en résolvant A X = I avec les facteurs : O(n³) une seule fois.
+
+        Args:
+            name (str, optional): Le nom de l'inverse (par défaut "<nom>^-1")
+
+        Returns:
+            Matrice: L'inverse de A
+        """
+        n = self.taille
+        name = f"{self.name}^-1" if name is None else name
+        if backend.utilise_numpy("matrice", n * n):
+            np = backend.np
+            a = backend.vue_2d(self._lu, n, n, n, 1, 0)
+            tampon, x = backend.nouveau_tampon(n * n)
+            x = x.reshape(n, n)
+            # P I, puis les n seconds membres traités ensemble, ligne par ligne
+            x[np.arange(n), self.permutation] = 1.0
+            for i in range(1, n):
+                x[i] -= a[i, :i] @ x[:i]
+            for i in range(n - 1, -1, -1):
+                x[i] = (x[i] - a[i, i + 1:] @ x[i + 1:]) / a[i, i]
+            return Matrice._depuis_tampon(name, tampon, n, n)
+
+        tampon = array("d", [0.0]) * (n * n)
+        colonnes = memoryview(tampon)
+        position = [0] * n
+        for i, p in enumerate(self.permutation):
+            position[p] = i
+        for j in range(n):
+            # P e_j : le 1 est sur la ligne où la ligne j de A a été placée
+            y = [0.0] * n
+            y[position[j]] = 1.0
+            colonnes[j::n] = array("d", self._substituer(y))
+        return Matrice._depuis_tampon(name, tampon, n, n)
+
+    def conditionnement(self, iterations_max: int = 5) -> float:
+        """Estime le conditionnement κ₁(A) = ||A||_1 ||A⁻¹||_1 sans former A⁻¹.
+
+        ||A⁻¹||_1 est estimée par la méthode de Hager (améliorée par Higham, comme
+        dans LAPACK xGECON) : quelques résolutions avec A et Aᵀ, soit O(n²) par itération.
+        L'estimation est une borne inférieure, en pratique presque toujours à un facteur
+        3 près de la valeur exacte.
+
+        Args:
+            iterations_max (int): Le nombre maximal d'itérations de Hager
+
+        Returns:
+            float: L'estimation de κ₁(A)
+        """
+        n = self.taille
+        if n == 0:
+            return 0.0
+        x = [1.0 / n] * n
+        estimation = 0.0
+        j_precedent = -1
+        for _ in range(iterations_max):
+            y = self._substituer([x[p] for p in self.permutation])
+            estimation = sum(map(abs, y))
+            z = self.resoudre_transposee([1.0 if v >= 0 else -1.0 for v in y])
+            j = max(range(n), key=lambda i: abs(z[i]))
+            # Optimum local atteint : le gradient ne permet plus de progresser
+            if abs(z[j]) <= sum(map(mul, z, x)) or j == j_precedent:
+                break
+            j_precedent = j
+            x = [0.0] * n
+            x[j] = 1.0
+        # Second membre alterné de Higham, qui rattrape les cas défavorables à Hager
+        if n > 1:
+            b = [(-1) ** i * (1 + i / (n - 1)) for i in range(n)]
+            alterne = self._substituer([b[p] for p in self.permutation])
+            estimation = max(estimation, 2 * sum(map(abs, alterne)) / (3 * n))
+        conditionnement = self.norme_1 * estimation
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "lu.conditionnement",
+                            f"Conditionnement estimé de {self.name}: {conditionnement:.3e}",
+                            conditionnement=conditionnement)
+        return conditionnement
+
+    def nombre_octets(self) -> int:
+        """Place occupée par les facteurs L, U et la permutation."""
+        return self._lu.itemsize * len(self._lu) + 8 * self.taille
+
+    def __str__(self):
+        n = self.taille
+        return (f"Factorisation LU {self.name} (permutation {self.permutation})\n"
+                + "\n".join(str(self._lu[i * n:(i + 1) * n].tolist()) for i in range(n)))
+
+
+class _Singuliere:
+    """Entrée du cache pour une matrice dont la factorisation a échoué (matrice singulière) :
+    l'erreur est relevée à chaque accès sans refactoriser."""
+    __slots__ = ("name", "message")
+    # Place comptée dans le budget : de quoi borner le nombre d'entrées sans facteurs
+    OCTETS = 64
+
+    def __init__(self, name: str, message: str):
+        self.name = name
+        self.message = message
+
+    def nombre_octets(self) -> int:
+        return self.OCTETS
+
+
+class CacheFactorisations:
+    """Cache LRU des factorisations LU, indexé par le contenu des matrices.
+
+    Deux matrices de même forme et de mêmes éléments partagent la même entrée, quelle que
+    soit leur provenance (fichier relu, copie...). Les entrées les moins récemment utilisées
+    sont évincées dès que la place occupée par les facteurs dépasse budget_octets.
+
+    L'échec d'une factorisation (matrice singulière) est gardé aussi : det() ou
+    conditionnement() répétés sur la même matrice singulière ne refactorisent pas.
+    """
+
+    def __init__(self, budget_octets: int = 64 * 1024 * 1024):
+        """
+        Args:
+            budget_octets (int): La place maximale occupée par les factorisations gardées
+        """
+        self._entrees = OrderedDict()
+        self.octets = 0
+        self.succes = 0
+        self.echecs = 0
+        self.configurer(budget_octets)
+
+    @staticmethod
+    def cle(matrice: Matrice) -> str:
+        """Empreinte du contenu de la matrice (forme et éléments)."""
+        matrice = en_dense(matrice)
+        empreinte = blake2b(struct.pack("<qq", matrice.num_ligne, matrice.num_colonne), digest_size=16)
+        empreinte.update(matrice._valeurs())
+        return empreinte.hexdigest()
+
+    def configurer(self, budget_octets: int) -> None:
+        """Change le budget mémoire et évince aussitôt ce qui dépasse.
+
+        Raises:
+            ValueError: Si le budget est négatif
+        """
+        if budget_octets < 0:
+            raise ValueError("Le budget mémoire doit être positif")
+        self.budget_octets = budget_octets
+        self._evincer(0)
+
+    def factorisation(self, matrice: Matrice, precision: str = "d") -> FactorisationLU:
+        """Retourne la factorisation de la matrice, calculée seulement si elle n'est pas en cache.
+
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée à factoriser
+            precision (str): "d" ou "f" (voir FactorisationLU) ; chaque précision a son entrée
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        cle = self.cle(matrice)
+        factorisation = self._entrees.get((cle, precision))
+        if factorisation is not None:
+            self._entrees.move_to_end((cle, precision))
+            self.succes += 1
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "lu.cache.succes",
+                                f"Factorisation de {matrice.name} trouvée en cache", cle=cle)
+            if isinstance(factorisation, _Singuliere):
+                raise ValueError(factorisation.message)
+            return factorisation
+
+        self.echecs += 1
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "lu.cache.echec",
+                            f"Factorisation de {matrice.name} absente du cache", cle=cle)
+        try:
+            factorisation = FactorisationLU(matrice, precision=precision)
+        except ValueError as erreur:
+            # Seul l'échec de l'élimination est gardé (pas une forme ou une précision invalides)
+            if matrice.num_ligne == matrice.num_colonne and precision in ("d", "f"):
+                self._garder(cle, precision, _Singuliere(matrice.name, str(erreur)))
+            raise
+        self._garder(cle, precision, factorisation)
+        return factorisation
+
+    def _garder(self, cle: str, precision: str, factorisation) -> None:
+        """Ajoute une entrée si elle tient dans le budget, en évinçant les plus anciennes."""
+        octets = factorisation.nombre_octets()
+        if octets <= self.budget_octets:
+            self._evincer(octets)
+            self._entrees[cle, precision] = factorisation
+            self.octets += octets
+
+    def _evincer(self, place: int) -> None:
+        """Retire les entrées les plus anciennes jusqu'à libérer place octets dans le budget."""
+        while self._entrees and self.octets + place > self.budget_octets:
+            (cle, precision), factorisation = self._entrees.popitem(last=False)
+            self.octets -= factorisation.nombre_octets()
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "lu.cache.eviction",
+                                f"Factorisation de {factorisation.name} évincée du cache", cle=cle,
+                                precision=precision)
+
+    def vider(self) -> None:
+        """Retire toutes les entrées (les compteurs sont conservés)."""
+        self._entrees.clear()
+        self.octets = 0
+
+    def statistiques(self) -> dict:
+        """Retourne le nombre d'entrées, la place occupée, le budget et les compteurs succès/échecs."""
+        return {
+            "entrees": len(self._entrees),
+            "octets": self.octets,
+            "budget_octets": self.budget_octets,
+            "succes": self.succes,
+            "echecs": self.echecs,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+    def __contains__(self, matrice) -> bool:
+        cle = self.cle(matrice)
+        return (cle, "d") in self._entrees or (cle, "f") in self._entrees
+
+
+# Cache partagé par défaut entre toutes les instances de Pivot
+cache_factorisations = CacheFactorisations()
 
 
 class Pivot:
-    def __init__(self):
-        pass
+    def __init__(self, cache: CacheFactorisations | None = None):
+        """
+        Args:
+            cache (CacheFactorisations, optional): Le cache utilisé par resoudre
+                                                   (par défaut, le cache partagé du module)
+        """
+        self.cache = cache_factorisations if cache is None else cache
+
+    def resoudre(self, matrice: Matrice, second_membre):
+        """Résout A x = b avec le solveur adapté à la structure de A.
+
+        La forme est déduite des largeurs de bande de la matrice (matrice.largeurs_de_bande(),
+        sans le test de symétrie de structure(), inutile ici) :
+            diagonale, triangulaire   substitution directe (module bande)
+            tridiagonale              algorithme de Thomas
+            bande                     LU bande avec pivot partiel
+            pleine                    LU avec pivot partiel, réutilisée si elle est en cache
+
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée A (non modifiée)
+            second_membre (list | Vecteur): Le second membre b
+
+        Returns:
+            list | Vecteur: La solution x, du même type que le second membre
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        largeurs = matrice.largeurs_de_bande()
+        forme = forme_de_bande(matrice.num_ligne, matrice.num_colonne, *largeurs)
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "pivot.structure",
+                            f"Matrice {matrice.name} {forme} (bande {largeurs})", forme=forme, bande=largeurs)
+        if forme == "diagonale":
+            return bande.resoudre_diagonale(matrice, second_membre)
+        if forme == "triangulaire inférieure":
+            return bande.resoudre_triangulaire(matrice, second_membre, True, largeurs[0])
+        if forme == "triangulaire supérieure":
+            return bande.resoudre_triangulaire(matrice, second_membre, False, largeurs[1])
+        if forme == "tridiagonale":
+            return bande.resoudre_tridiagonale(matrice, second_membre)
+        if forme == "bande":
+            return bande.FactorisationBande(matrice, *largeurs).resoudre(second_membre)
+        return self.cache.factorisation(matrice).resoudre(second_membre)
+
+    def factoriser(self, matrice: Matrice) -> FactorisationLU:
+        """Factorise la matrice (PA = LU, pivot partiel) sans la modifier.
+
+        La factorisation retournée résout ensuite autant de seconds membres que voulu :
+            lu = Pivot().factoriser(A)
+            x1 = lu.resoudre(b1)
+            x2 = lu.resoudre(b2)
+
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée à factoriser
+
+        Returns:
+            FactorisationLU: La factorisation
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        return FactorisationLU(matrice)
+
+    def resoudre_precision_mixte(self, matrice: Matrice, second_membre, tolerance: float | None = None,
+                                 iterations_max: int = 10, rappel=None) -> "iteratif.ResultatIteratif":
+        """Résout A x = b avec une factorisation float32, raffinée jusqu'à la précision double.
+
+        La factorisation (O(n³)) est faite et gardée en float32 ; chaque pas de raffinement
+        calcule le résidu r = b - A x en float64 avec mut_vec, résout A d = r avec la
+        factorisation float32 (O(n²)) et corrige x <- x + d. Le raffinement s'arrête quand
+        l'erreur inverse ||r|| / (||A|| ||x|| + ||b||) (normes infinies) passe sous la
+        tolérance, ou quand le résidu ne diminue plus assez (matrice trop mal conditionnée
+        pour la simple précision).
+
+        Args:
+            matrice (Matrice | MatriceCreuse): La matrice carrée A (non modifiée)
+            second_membre (list | Vecteur): Le second membre b
+            tolerance (float, optional): L'erreur inverse visée (n * 2^-53 par défaut)
+            iterations_max (int): Le nombre maximal de pas de raffinement
+            rappel (callable, optional): Appelé avec (pas, erreur inverse) à chaque pas
+
+        Returns:
+            iteratif.ResultatIteratif: La solution, le nombre de pas de raffinement et
+                                       l'erreur inverse après chaque pas (converge indique si
+                                       la tolérance a été atteinte)
+
+        Raises:
+            ValueError: Si la matrice n'est pas carrée ou si elle est singulière
+        """
+        n = matrice.num_ligne
+        if tolerance is None:
+            tolerance = max(n, 1) * 2.0 ** -53
+        b = second_membre if isinstance(second_membre, Vecteur) else Vecteur("b", second_membre)
+        factorisation = self.cache.factorisation(matrice, precision="f")
+        methode = "Précision mixte (float32 + raffinement)"
+
+        norme_a = max((sum(map(abs, ligne)) for ligne in matrice), default=0.0)
+        norme_b = max(map(abs, b), default=0.0)
+        x = Vecteur._depuis_tampon("x", array("d", factorisation.resoudre(b.elements)))
+        erreurs = []
+        precedente = None
+        pas = 0
+        while True:
+            r = matrice.mut_vec(x)
+            r *= -1
+            r += b
+            norme_r = max(map(abs, r), default=0.0)
+            denominateur = norme_a * max(map(abs, x), default=0.0) + norme_b
+            erreur = norme_r / denominateur if denominateur else norme_r
+            erreurs.append(erreur)
+            if rappel is not None:
+                rappel(pas, erreur)
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "pivot.raffinement",
+                                f"Raffinement pas {pas}: résidu {norme_r:.3e}, erreur inverse {erreur:.3e}",
+                                pas=pas, residu=norme_r, erreur=erreur)
+            # Arrêt : précision atteinte, budget épuisé, ou le résidu ne diminue plus de moitié
+            if erreur <= tolerance or pas == iterations_max or (precedente is not None and norme_r > precedente / 2):
+                break
+            precedente = norme_r
+            x += Vecteur._depuis_tampon("d", array("d", factorisation.resoudre(r.elements)))
+            pas += 1
+
+        resultat = iteratif.ResultatIteratif(methode, x, pas, erreurs, erreurs[-1] <= tolerance)
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "pivot.precision_mixte", str(resultat), pas=pas,
+                            erreur=erreurs[-1], converge=resultat.converge)
+        return resultat
 
     def normaliser(self, matrice: Matrice, num_lignes=0, num_colonnes=0) -> Matrice:
         """Normalise une ligne de la matrice par rapport à un pivot
@@ -25,15 +560,14 @@ class Pivot:
         Raises:
             ValueError: Si le pivot est nul
         """
-        # Access the pivot through the elements attribute of Vecteur
-        pivot = matrice.elements[num_lignes].elements[num_colonnes]
+        # Access the pivot directly in the matrix storage
+        pivot = matrice[num_lignes, num_colonnes]
         
         if pivot == 0:
             raise ValueError("Pivot nul")
             
-        # Divide each element in the row by the pivot
-        new_elements = [elt/pivot for elt in matrice.elements[num_lignes].elements]
-        matrice.elements[num_lignes] = Vecteur(f"{matrice.name}_{num_lignes}", new_elements)
+        # Divide each element in the row by the pivot, in place
+        matrice.diviser_ligne(num_lignes, pivot)
 
         
         return matrice
@@ -52,118 +586,149 @@ class Pivot:
         for i in range(matrice.num_ligne):
             if i != num_lignes:
                 
-                coeff = matrice.elements[i].elements[num_colonnes]
+                coeff = matrice[i, num_colonnes]
                 
-                new_elements = []
-                for j in range(matrice.taille):
-                    element = (matrice.elements[i].elements[j] - 
-                            coeff * matrice.elements[num_lignes].elements[j])
-                    new_elements.append(element)
-
-                matrice.elements[i] = Vecteur(f"{matrice.name}_{i}", new_elements)
+                # ligne_i -= coeff * ligne_pivot, en place
+                if coeff != 0:
+                    matrice.axpy_ligne(i, -coeff, num_lignes)
 
         
         return matrice
 
-    def pivot_de_gauss(self, matrice: Matrice, second_membre=None) -> tuple:
+    def pivot_de_gauss(self, matrice: Matrice, second_membre=None, en_parallele: bool = False) -> tuple:
         """Applique l'élimination de Gauss pour mettre la matrice sous forme échelonnée
         
+        Plusieurs seconds membres (AX = B) sont éliminés dans le même parcours : les
+        opérations sur les lignes portent sur la matrice augmentée [A | B].
+        
         Args:
-            matrice (Matrice): La matrice à transformer
-            second_membre (list, optional): Le vecteur du second membre sous forme [x, y, z]. 
-                                           Defaults to None.
+            matrice (Matrice | MatriceCreuse): La matrice à transformer (une matrice creuse
+                                               est d'abord convertie en Matrice dense)
+            second_membre (list | Vecteur | Matrice, optional): Le vecteur du second membre
+                                           sous forme [x, y, z], ou plusieurs seconds membres
+                                           en colonnes d'une Matrice ou d'une liste de lignes
+                                           [[x1, x2], [y1, y2], [z1, z2]]. Defaults to None.
+            en_parallele (bool): Répartit la standardisation des lignes sur plusieurs processus
+                                 (module parallele) si le système dépasse parallele.SEUIL lignes ;
+                                 les états intermédiaires ne sont alors pas affichés
             
         Returns:
             tuple: (Matrice, list) La matrice sous forme échelonnée et le second membre transformé
+                   (du même type que le second membre fourni)
             
         Raises:
             ValueError: Si le système est impossible à résoudre (pivot nul partout)
         """
-        print("Matrice initiale:")
-        print(matrice)
-        
+        # L'élimination remplit la matrice : elle se fait sur le stockage dense
+        matrice = en_dense(matrice)
+
         n = matrice.num_ligne
         
         # Si aucun second membre n'est fourni, on utilise un vecteur de zéros
         if second_membre is None:
             second_membre = [0] * n
-        else:
-            print("Second membre initial:")
-            for i in range(n):
-                print(f"[{second_membre[i]}]")
 
         if len(second_membre) != n:
             raise ValueError("Le second membre doit avoir la même taille que la matrice")
+
+        # Seconds membres en colonnes : une Matrice, ou une liste de lignes
+        plusieurs = isinstance(second_membre, Matrice) or (
+            n > 0 and isinstance(second_membre, list) and isinstance(second_membre[0], (list, tuple)))
+        if plusieurs and not isinstance(second_membre, Matrice):
+            seconds = Matrice("B", second_membre)
+        elif plusieurs:
+            seconds = second_membre
+        else:
+            seconds = Matrice._depuis_tampon("b", array("d", second_membre), n, 1)
+        p = seconds.num_colonne
+
+        # Matrice augmentée [A | B] dans un seul tampon, et vues sur chacune des deux parties
+        tampon = array("d", [0.0]) * (n * (matrice.num_colonne + p))
+        largeur = matrice.num_colonne + p
+        augmentee = Matrice._depuis_tampon(f"[{matrice.name} | {seconds.name}]", tampon, n, largeur)
+        partie_a = Matrice._depuis_tampon(matrice.name, tampon, n, matrice.num_colonne, largeur)
+        partie_b = Matrice._depuis_tampon(seconds.name, tampon, n, p, largeur, 1, matrice.num_colonne)
+        partie_a._ecrire(matrice._valeurs())
+        partie_b._ecrire(seconds._valeurs())
+
+        def afficher_second_membre():
+            return str(partie_b) if plusieurs else en_colonne(partie_b._colonne(0).tolist())
+
+        if journal.NIVEAU >= journal.COMPLET:
+            journal.emettre(journal.COMPLET, "pivot.initial",
+                            f"Matrice initiale:\n{matrice}\nSecond membre initial:\n{afficher_second_membre()}",
+                            matrice=matrice, second_membre=second_membre)
             
         # Suivi des opérations sur le système
-        print("\nRésolution du système d'équations:")
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "pivot.debut", "\nRésolution du système d'équations:",
+                            taille=n, seconds_membres=p)
         
-        for i in range(n):
-            # Vérifier si le pivot est nul et permuter les lignes si nécessaire
-            if matrice.elements[i].elements[i] == 0:
-                for j in range(i + 1, n):
-                    if matrice.elements[j].elements[i] != 0:
-                        print(f"Étape {i+1}: Permutation des lignes {i+1} et {j+1}")
-                        # Permuter les lignes dans la matrice
-                        matrice.elements[i], matrice.elements[j] = matrice.elements[j], matrice.elements[i]
-                        # Permuter également les éléments correspondants dans le second membre
-                        second_membre[i], second_membre[j] = second_membre[j], second_membre[i]
-                        break
-                else:
-                    raise ValueError("Système impossible à résoudre (pivot nul partout)")
-            
-            print(f"Étape {i+1}: Ligne de travail {i+1}")
-            
-            # Normaliser la ligne du pivot
-            pivot = matrice.elements[i].elements[i]
-            if pivot != 0:
-                print(f"  - Normalisation par le pivot {pivot}")
-                # Normaliser la matrice
-                self.normaliser(matrice, i, i)
-                
-                # Normaliser le second membre
-                second_membre[i] = second_membre[i] / pivot
-            
-            # Standardiser les autres lignes par rapport à la ligne du pivot
-            print(f"  - Standardisation des autres lignes par rapport à la ligne {i+1}")
-            
-            # Sauvegarde des coefficients avant standardisation
-            coeffs = []
-            for k in range(n):
-                if k != i:
-                    coeffs.append((k, matrice.elements[k].elements[i]))
-            
-            self.standardiser(matrice, i, i)
+        if en_parallele and parallele.utilise_parallele(n):
+            # Standardisation répartie sur un groupe de processus (voir le module parallele)
+            parallele.eliminer(augmentee, n)
+        else:
+            for i in range(n):
+                # Vérifier si le pivot est nul et permuter les lignes si nécessaire
+                if augmentee[i, i] == 0:
+                    for j in range(i + 1, n):
+                        if augmentee[j, i] != 0:
+                            if journal.NIVEAU >= journal.ETAPES:
+                                journal.emettre(journal.ETAPES, "pivot.permutation",
+                                                f"Étape {i+1}: Permutation des lignes {i+1} et {j+1}", lignes=(i, j))
+                            # Permuter les lignes de la matrice augmentée (seconds membres compris)
+                            augmentee.permuter_lignes(i, j)
+                            break
+                    else:
+                        raise ValueError("Système impossible à résoudre (pivot nul partout)")
             
-            # Standardiser le second membre en utilisant les coefficients sauvegardés
-            for k, coeff in coeffs:
-                second_membre[k] -= coeff * second_membre[i]
+                # Normaliser la ligne du pivot
+                pivot = augmentee[i, i]
+                if journal.NIVEAU >= journal.ETAPES:
+                    journal.emettre(journal.ETAPES, "pivot.etape",
+                                    f"Étape {i+1}: Ligne de travail {i+1}\n  - Normalisation par le pivot {pivot}\n"
+                                    f"  - Standardisation des autres lignes par rapport à la ligne {i+1}",
+                                    etape=i, pivot=pivot)
+                if pivot != 0:
+                    # Normaliser la ligne, seconds membres compris
+                    self.normaliser(augmentee, i, i)
             
-            print("État actuel:")
-            print(matrice)
-            print("Second membre:")
-            for val in second_membre:
-                print(f"[{val}]")
+                # Standardiser les autres lignes (et les seconds membres) par rapport à la ligne du pivot
+                self.standardiser(augmentee, i, i)
             
-        
+                if journal.NIVEAU >= journal.COMPLET:
+                    journal.emettre(journal.COMPLET, "pivot.etat",
+                                    f"État actuel:\n{partie_a}\nSecond membre:\n{afficher_second_membre()}",
+                                    etape=i, matrice=partie_a, second_membre=partie_b)
+
+        # La matrice d'entrée reçoit sa forme échelonnée, comme le second membre
+        matrice._ecrire(partie_a._valeurs())
+
+        if isinstance(second_membre, (Matrice, Vecteur)):
+            second_membre._ecrire(partie_b._valeurs())
+            return matrice, second_membre
+
         # Convertir les valeurs du second membre en entiers si possible
-        for i in range(n):
-            if second_membre[i] == int(second_membre[i]):
-                second_membre[i] = int(second_membre[i])
+        valeurs = [int(val) if val == int(val) else val for val in partie_b._valeurs()]
+        if plusieurs:
+            second_membre[:] = [valeurs[i * p:(i + 1) * p] for i in range(n)]
+        else:
+            second_membre[:] = valeurs
         
         return matrice, second_membre
     
-    def realiser_pivot(self, matrice, second_membre, nom_inconnues=None):
-        matrice_echelonnee, solution = self.pivot_de_gauss(matrice, second_membre)
-        print("\nRésultat final:")
-        print("Matrice échelonnée:")
-        print(matrice_echelonnee)
-        print("Second membre transformé:")
-        for i in range(len(solution)):
-            if nom_inconnues is not None:
-                print(f"{nom_inconnues[i]} = {solution[i]}")
-            else:
-                print(f"x{i+1} = {solution[i]}")
+    def realiser_pivot(self, matrice, second_membre, nom_inconnues=None, en_parallele: bool = False):
+        matrice_echelonnee, solution = self.pivot_de_gauss(matrice, second_membre, en_parallele)
+        if journal.NIVEAU >= journal.COMPLET:
+            journal.emettre(journal.COMPLET, "pivot.echelonnee",
+                            f"\nMatrice échelonnée:\n{matrice_echelonnee}", matrice=matrice_echelonnee)
+        if journal.NIVEAU >= journal.RESUME:
+            noms = nom_inconnues if nom_inconnues is not None else [f"x{i+1}" for i in range(len(solution))]
+            # Plusieurs seconds membres : une ligne de solutions par inconnue
+            valeurs = [ligne.tolist() if isinstance(ligne, Vecteur) else ligne for ligne in solution]
+            lignes = "\n".join(f"{nom} = {valeur}" for nom, valeur in zip(noms, valeurs))
+            journal.emettre(journal.RESUME, "pivot.solution", f"\nRésultat final:\nSecond membre transformé:\n{lignes}",
+                            solution=solution, noms=noms)
         return matrice_echelonnee, solution, nom_inconnues
     
 def utilisateur_matrice():
@@ -175,15 +740,13 @@ def utilisateur_matrice():
         noms_inconnus.append(nom)
     nombre_equations = int(input("Entrez le nombre d'équations: "))
     nombre_ligne = nombre_equations
-    matrice = Matrice("A", [[0]*nombre_inconnues for _ in range(nombre_ligne)])
+    matrice = matrice_nulle(nombre_ligne, nombre_inconnues, "A")
     for i in range(nombre_ligne):
         print(f"Entrez les coefficients de l'équation {i+1} avec des espaces entre les valeurs:")
         coefficients = list(map(int, input().split()))
         if len(coefficients) != nombre_inconnues:
             raise ValueError("Le nombre de coefficients ne correspond pas au nombre d'inconnues")
-        nom = "l" + str(i+1)
-        vecteur = Vecteur(nom, coefficients)
-        matrice.elements[i] = vecteur
+        matrice[i] = coefficients
     print("Entrez les valeurs du second membre avec des espaces entre les valeurs:")
     second_membre = list(map(int, input().split()))
     if len(second_membre) != nombre_ligne:
@@ -198,47 +761,30 @@ def utilisateur_matrice():
     return matrice, second_membre, noms_inconnus
 
 def txt_en_matrice(File):
-    with open(File, "r") as f:
-        # Première ligne: nombre d'inconnues
-        nombre_inconnues = int(f.readline().strip())
-        
-        # Deuxième ligne: noms des inconnues
-        noms_inconnus = f.readline().strip().split()
-        if len(noms_inconnus) != nombre_inconnues:
-            raise ValueError(f"Le nombre de noms d'inconnues ({len(noms_inconnus)}) ne correspond pas au nombre d'inconnues ({nombre_inconnues})")
-        
-        # Troisième ligne: nombre d'équations
-        nombre_equations = int(f.readline().strip())
-        nombre_ligne = nombre_equations
-        
-        # Initialisation de la matrice
-        matrice = Matrice("A", [[0]*nombre_inconnues for _ in range(nombre_ligne)])
-        
-        # Lecture des coefficients des équations
-        for i in range(nombre_ligne):
-            coefficients = list(map(float, f.readline().strip().split()))
-            if len(coefficients) != nombre_inconnues:
-                raise ValueError(f"Le nombre de coefficients pour l'équation {i+1} ({len(coefficients)}) ne correspond pas au nombre d'inconnues ({nombre_inconnues})")
-            nom = "l" + str(i+1)
-            vecteur = Vecteur(nom, coefficients)
-            matrice.elements[i] = vecteur
-        
-        # Ligne n+2: composants du second membre
-        second_membre = list(map(float, f.readline().strip().split()))
-        if len(second_membre) != nombre_equations:
-            raise ValueError(f"Le nombre de valeurs du second membre ({len(second_membre)}) ne correspond pas au nombre d'équations ({nombre_equations})")
-        
-        print("Lecture du fichier terminée avec succès!")
-        print(f"Nombre d'inconnues: {nombre_inconnues}")
-        print(f"Noms des inconnues: {noms_inconnus}")
-        print(f"Nombre d'équations: {nombre_equations}")
-        print("Matrice A:")
-        print(matrice)
-        print(f"Second membre:")
-        for val in second_membre:
-            print(f"[{val}]")
-        
-        return matrice, second_membre, noms_inconnus
+    """Lit un système linéaire depuis un fichier texte (voir lecture.lire_systeme pour le format).
+
+    Le fichier est lu par blocs et la matrice construite en un seul passage, sans affichage.
+
+    Returns:
+        tuple: (Matrice, list, list) La matrice, le second membre et les noms des inconnues
+
+    Raises:
+        lecture.ErreurLecture: Si le fichier est mal formé (le message donne le numéro de ligne)
+    """
+    matrice, second_membre, noms_inconnus = lecture.lire_systeme(File)
+    nombre_equations, nombre_inconnues = matrice.num_ligne, matrice.num_colonne
+
+    if journal.NIVEAU >= journal.RESUME:
+        journal.emettre(journal.RESUME, "pivot.lecture",
+                        f"Lecture du fichier terminée avec succès!\nNombre d'inconnues: {nombre_inconnues}\n"
+                        f"Noms des inconnues: {noms_inconnus}\nNombre d'équations: {nombre_equations}",
+                        fichier=File, forme=(nombre_equations, nombre_inconnues))
+    if journal.NIVEAU >= journal.COMPLET:
+        journal.emettre(journal.COMPLET, "pivot.lecture.contenu",
+                        f"Matrice A:\n{matrice}\nSecond membre:\n{en_colonne(second_membre)}",
+                        matrice=matrice, second_membre=second_membre)
+
+    return matrice, second_membre, noms_inconnus
     
 
 def matrice_en_txt(matrice, second_membre, noms_inconnus, file):
@@ -247,9 +793,107 @@ def matrice_en_txt(matrice, second_membre, noms_inconnus, file):
         f.write(" ".join(noms_inconnus) + "\n")
         f.write(f"{matrice.num_ligne}\n")
         for i in range(matrice.num_ligne):
-            f.write(" ".join(map(str, matrice.elements[i].elements)) + "\n")
+            f.write(" ".join(map(str, matrice.ligne(i))) + "\n")
         f.write(" ".join(map(str, second_membre)) + "\n")
-        print(f"Matrice et second membre écrits dans le fichier {file}")
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "pivot.ecriture", f"Matrice et second membre écrits dans le fichier {file}",
+                            fichier=file)
+
+
+# Format binaire : une en-tête de taille fixe, les noms des inconnues (UTF-8, séparés par des
+# sauts de ligne), complétés à un multiple de 8 octets, puis les éléments de A et ceux du second
+# membre, en float64 petit-boutiste, ligne par ligne.
+MAGIQUE = b"MNSYSTM\0"
+VERSION = 1
+_ENTETE = struct.Struct("<8sI4sqqqq")  # magique, version, type, lignes, colonnes, colonnes du second membre, octets des noms
+
+
+def sauvegarder(matrice, second_membre, noms_inconnus, fichier):
+    """Écrit un système au format binaire (relu sans conversion par charger).
+
+    Args:
+        matrice (Matrice | MatriceCreuse): La matrice A
+        second_membre (list | Vecteur | Matrice | None): Le second membre (une Matrice pour
+                                                        plusieurs seconds membres en colonnes)
+        noms_inconnus (list | None): Les noms des inconnues
+        fichier (str): Le chemin du fichier
+    """
+    matrice = en_dense(matrice)
+    if second_membre is None:
+        seconds = array("d")
+        colonnes_second_membre = 0
+    elif isinstance(second_membre, Matrice):
+        seconds = second_membre._valeurs()
+        colonnes_second_membre = second_membre.num_colonne
+    else:
+        seconds = array("d", second_membre)
+        colonnes_second_membre = 1
+    if len(seconds) != matrice.num_ligne * colonnes_second_membre:
+        raise ValueError("Le second membre doit avoir la même taille que la matrice")
+    noms = "\n".join(noms_inconnus or []).encode()
+
+    with open(fichier, "wb") as f:
+        f.write(_ENTETE.pack(MAGIQUE, VERSION, b"<f8", matrice.num_ligne, matrice.num_colonne,
+                             colonnes_second_membre, len(noms)))
+        f.write(noms + b"\0" * (-len(noms) % 8))
+        for valeurs in (matrice._valeurs(), seconds):
+            if sys.byteorder == "big":
+                valeurs = array("d", valeurs)
+                valeurs.byteswap()
+            f.write(valeurs)
+    if journal.NIVEAU >= journal.RESUME:
+        journal.emettre(journal.RESUME, "pivot.sauvegarde", f"Système écrit au format binaire dans le fichier {fichier}",
+                        fichier=fichier, forme=(matrice.num_ligne, matrice.num_colonne))
+
+
+def charger(fichier):
+    """Ouvre un système écrit par sauvegarder, en projetant le fichier en mémoire.
+
+    L'ouverture est en O(1) : seules les pages effectivement lues sont chargées depuis le
+    disque. La projection est en copie sur écriture (mmap.ACCESS_COPY) : la matrice retournée
+    peut être modifiée (par pivot_de_gauss par exemple) sans que le fichier ne change.
+
+    Returns:
+        tuple: (Matrice, list | Matrice | None, list) La matrice, le second membre (une liste
+               s'il n'y en a qu'un, une Matrice vue sur le fichier s'il y en a plusieurs) et
+               les noms des inconnues
+
+    Raises:
+        ValueError: Si le fichier n'est pas au format attendu
+    """
+    with open(fichier, "rb") as f:
+        entete = f.read(_ENTETE.size)
+        if len(entete) < _ENTETE.size or entete[:8] != MAGIQUE:
+            raise ValueError(f"{fichier}: ce n'est pas un système au format binaire")
+        _, version, type_elements, num_ligne, num_colonne, colonnes_second_membre, octets_noms = _ENTETE.unpack(entete)
+        if version != VERSION:
+            raise ValueError(f"{fichier}: version {version} du format binaire non supportée")
+        if type_elements.rstrip(b"\0") != b"<f8":
+            raise ValueError(f"{fichier}: type d'éléments non supporté: {type_elements!r}")
+        debut = _ENTETE.size + octets_noms + (-octets_noms % 8)
+        taille = debut + 8 * num_ligne * (num_colonne + colonnes_second_membre)
+        if os.fstat(f.fileno()).st_size < taille:
+            raise ValueError(f"{fichier}: fichier tronqué")
+        noms_inconnus = f.read(octets_noms).decode().split("\n") if octets_noms else []
+        projection = mmap.mmap(f.fileno(), taille, access=mmap.ACCESS_COPY)
+
+    elements = memoryview(projection)[debut:taille].cast("d")
+    if sys.byteorder == "big":
+        elements = array("d", elements)
+        elements.byteswap()
+    fin_a = num_ligne * num_colonne
+    matrice = Matrice._depuis_tampon("A", elements[:fin_a], num_ligne, num_colonne)
+    if colonnes_second_membre == 0:
+        second_membre = None
+    elif colonnes_second_membre == 1:
+        second_membre = elements[fin_a:].tolist()
+    else:
+        second_membre = Matrice._depuis_tampon("B", elements[fin_a:], num_ligne, colonnes_second_membre)
+
+    if journal.NIVEAU >= journal.RESUME:
+        journal.emettre(journal.RESUME, "pivot.chargement", f"Système {num_ligne}x{num_colonne} projeté depuis le fichier {fichier}",
+                        fichier=fichier, forme=(num_ligne, num_colonne))
+    return matrice, second_membre, noms_inconnus
 
 
 
@@ -287,6 +931,9 @@ if __name__=="__main__":
     #matrice, vecteur, noms_inconnus = utilisateur_matrice()
     #Pivot.realiser_pivot(matrice, vecteur, noms_inconnus)
 
+    # Affichage pédagogique de toutes les étapes (journal.SILENCIEUX pour aller à pleine vitesse)
+    journal.configurer(journal.COMPLET)
+
     # Mettez le chemin complet d'acces au fichier
     chemin_fichier = "c:/Users/User/OneDrive - Institut Catholique de Lille/Bureau/L3 SDN/S2/Method_Num_&_Sim/TP1/test.txt"
     matrice, vecteur, noms_inconnus = txt_en_matrice(chemin_fichier)
@@ -1,37 +1,68 @@
+from array import array
 from vecteur import *
 from matrice import *
+from creuse import MatriceCreuse
+from time import perf_counter
+import backend
+import journal
+import lecture
+import simplex_revise
+import tarification
+
+METHODES = ("tableau", "revise")
+# Un élément de la colonne pivot plus petit est considéré comme nul (bruit d'arrondi)
+TOLERANCE_PIVOT = 1e-9
 
 class Simplex:
-    def __init__(self, A=None, b=None, c=None, constraint_types=None):
+    def __init__(self, A=None, b=None, c=None, constraint_types=None, methode=None, regle="dantzig"):
         """Initialise un problème de programmation linéaire pour la méthode du Simplex.
         
         Args:
-            A (Matrice, optional): Matrice des coefficients des contraintes. Default is None.
+            A (Matrice | MatriceCreuse, optional): Matrice des coefficients des contraintes. Default is None.
             b (Vecteur, optional): Vecteur du second membre (contraintes). Default is None.
             c (Vecteur, optional): Vecteur des coûts (fonction objectif). Default is None.
             constraint_types (list, optional): Types de contraintes ("<=", ">=", "="). Default is None.
+            methode (str, optional): "tableau" (tableau complet, affichable) ou "revise" (simplexe
+                révisé à base factorisée, voir simplex_revise ; conseillé quand n >> m). Default is None :
+                "revise" si A est une MatriceCreuse (mémoire et temps en O(nnz)), "tableau" sinon.
+            regle (str | tarification.Regle, optional): Règle de choix de la variable entrante : "dantzig",
+                "bland", "devex", "plus_forte_pente", "partielle" ou une instance (voir tarification).
+                Default is "dantzig".
+
+        Raises:
+            ValueError: Si la méthode ou la règle est inconnue
         """
+        if methode is None:
+            methode = "revise" if isinstance(A, MatriceCreuse) else "tableau"
+        if methode not in METHODES:
+            raise ValueError(f"Méthode inconnue: {methode} (attendu: {', '.join(METHODES)})")
+        self.methode = methode
+        self.regle = tarification.regle(regle)
         self.A = A  # Matrice des coefficients des contraintes
         self.b = b  # Vecteur des contraintes (second membre)
         self.c = c  # Vecteur des coûts (fonction objectif)
         self.constraint_types = constraint_types or []  # Types de contraintes
         
         # Variables pour stocker l'état du simplex
-        self.tableau = None  # Tableau du simplex
+        self.tableau = None  # Tableau du simplex (Matrice, une ligne par contrainte puis z et w)
         self.base = None  # Indices des variables de base
         self.non_base = None  # Indices des variables hors base
         self.optimal = False  # Indique si une solution optimale a été trouvée
         self.unbounded = False  # Indique si le problème est non borné
+        self.irrealisable = False  # Indique si le problème n'a pas de solution réalisable
         self.solution = None  # Solution optimale
         self.valeur_optimale = None  # Valeur de la fonction objectif
         self.var_artificielles = []  # Indices des variables artificielles
+        self.colonnes_artificielles = []  # Indices des variables artificielles, conservés en Phase II
+        self.revise = None  # Moteur du simplexe révisé (methode="revise")
+        self.statistiques = None  # Itérations et durée de la dernière résolution
     
     def initialiser(self):
         """Initialise le tableau du simplex et les ensembles de base et hors base."""
         if self.A is None or self.b is None or self.c is None:
             raise ValueError("Les données du problème ne sont pas complètes")
         
-        m = len(self.A.elements)  # Nombre de contraintes
+        m = self.A.num_ligne  # Nombre de contraintes
         n = len(self.c.elements)  # Nombre de variables de décision
         
         # Si aucun type de contrainte n'est spécifié, supposer "<=" pour toutes
@@ -45,58 +76,60 @@ class Simplex:
         
         # Taille totale du tableau
         total_vars = n + num_slack + num_surplus + num_artificial
+        self.total = total_vars
         
-        # Initialiser le tableau avec les contraintes et les variables additionnelles
-        tableau = []
+        # Le tableau est une seule Matrice : m lignes de contraintes, la ligne z, puis la ligne w
+        # s'il y a des variables artificielles ; la dernière colonne est le second membre
+        largeur = total_vars + 1
+        tableau = matrice_nulle(m + 1 + (1 if num_artificial > 0 else 0), largeur, "T")
         slack_index = n
         surplus_index = n + num_slack
         artificial_index = n + num_slack + num_surplus
         self.var_artificielles = []
         
+        creuse = isinstance(self.A, MatriceCreuse)
         for i in range(m):
-            ligne = self.A.elements[i].elements.copy() + [0] * (total_vars - n) + [self.b.elements[i]]
+            if creuse:
+                for j, v in self.A._couples(i):
+                    tableau[i, j] = v
+            else:
+                tableau._ligne(i)[:n] = array("d", self.A._ligne(i))
+            tableau[i, total_vars] = self.b.elements[i]
             
             # Traiter selon le type de contrainte
             if self.constraint_types[i] == "<=":
                 # Ajouter variable d'écart (slack)
-                ligne[slack_index] = 1
+                tableau[i, slack_index] = 1
                 slack_index += 1
             elif self.constraint_types[i] == ">=":
                 # Ajouter variable de surplus (négative)
-                ligne[surplus_index] = -1
+                tableau[i, surplus_index] = -1
                 surplus_index += 1
                 # Ajouter variable artificielle
-                ligne[artificial_index] = 1
+                tableau[i, artificial_index] = 1
                 self.var_artificielles.append(artificial_index)
                 artificial_index += 1
             elif self.constraint_types[i] == "=":
                 # Ajouter variable artificielle
-                ligne[artificial_index] = 1
+                tableau[i, artificial_index] = 1
                 self.var_artificielles.append(artificial_index)
                 artificial_index += 1
-            
-            tableau.append(ligne)
+        self.colonnes_artificielles = list(self.var_artificielles)
         
-        # Ajouter la ligne de la fonction objectif (z)
+        # Ligne de la fonction objectif (z)
         # Négation des coefficients objectifs car on maximise
-        ligne_objectif = [-x for x in self.c.elements] + [0] * (total_vars - n) + [0]
-        tableau.append(ligne_objectif)
+        tableau._ligne(m)[:n] = array("d", [-x for x in self.c.elements])
         
-        # Si des variables artificielles sont présentes, ajouter la fonction objectif auxiliaire (w)
+        # Si des variables artificielles sont présentes, ligne de la fonction objectif auxiliaire (w)
         if num_artificial > 0:
-            ligne_w = [0] * (total_vars + 1)  # +1 pour inclure la colonne b
-            
             # Ajouter les coefficients pour les variables artificielles dans w
             for idx in self.var_artificielles:
-                ligne_w[idx] = 1
+                tableau[m + 1, idx] = 1
             
             # Ajouter les rangs pour rendre w = 0
-            for i, idx in enumerate(self.var_artificielles):
-                row_idx = next(r for r, row in enumerate(tableau[:-1]) if row[idx] == 1)
-                for j in range(total_vars + 1):
-                    ligne_w[j] -= tableau[row_idx][j]
-            
-            tableau.append(ligne_w)
+            for idx in self.var_artificielles:
+                row_idx = next(r for r in range(m) if tableau[r, idx] == 1)
+                tableau.axpy_ligne(m + 1, -1, row_idx)
         
         self.tableau = tableau
         
@@ -120,89 +153,97 @@ class Simplex:
                 art_idx += 1
         
         # Variables hors base
-        self.non_base = [j for j in range(total_vars) if j not in self.base]
+        dans_base = set(self.base)
+        self.non_base = [j for j in range(total_vars) if j not in dans_base]
         
         # Réinitialiser les autres attributs
         self.optimal = False
         self.unbounded = False
+        self.irrealisable = False
         self.solution = None
         self.valeur_optimale = None
         
-        print("Tableau initial du simplex:")
-        self.afficher_tableau()
+        self._tracer_tableau("Tableau initial du simplex:")
     
-    def afficher_tableau(self):
-        """Affiche le tableau actuel du simplex."""
+    def tableau_en_texte(self) -> str:
+        """Met en forme le tableau actuel du simplex."""
         if self.tableau is None:
-            print("Le tableau n'a pas encore été initialisé")
-            return
+            return "Le tableau n'a pas encore été initialisé"
+        
+        tableau = self.tableau
+        num_lignes, num_colonnes = tableau.num_ligne, tableau.num_colonne
         
         # Déterminer la largeur des colonnes
-        largeur = max(len(f"{self.tableau[i][j]:.2f}") for i in range(len(self.tableau)) for j in range(len(self.tableau[0]))) + 2
-        
-        # Afficher les numéros de colonnes
-        print("    |", end="")
-        for j in range(len(self.tableau[0]) - 1):
-            print(f" x{j+1}".ljust(largeur), end="")
-        print(" b")
-        
-        # Afficher une ligne de séparation
-        print("-" * (largeur * (len(self.tableau[0]) + 1) + 5))
-        
-        # Afficher les variables de base et les lignes du tableau
-        for i in range(len(self.tableau) - 1 - (1 if self.var_artificielles else 0)):
-            var_base = f"x{self.base[i]+1}"
-            print(f"{var_base} |", end="")
-            for val in self.tableau[i]:
-                print(f" {val:.2f}".ljust(largeur), end="")
-            print()
-        
-        # Afficher la ligne de la fonction objectif
-        print("z  |", end="")
-        for val in self.tableau[-1 - (1 if self.var_artificielles else 0)]:
-            print(f" {val:.2f}".ljust(largeur), end="")
-        print()
-        
-        # Afficher la ligne de la fonction objectif auxiliaire si présente
+        largeur = max(len(f"{val:.2f}") for i in range(num_lignes) for val in tableau._ligne(i)) + 2
+        
+        def formater(i):
+            return "".join(f" {val:.2f}".ljust(largeur) for val in tableau._ligne(i))
+        
+        # Numéros de colonnes et ligne de séparation
+        lignes = ["    |" + "".join(f" x{j+1}".ljust(largeur) for j in range(num_colonnes - 1)) + " b",
+                  "-" * (largeur * (num_colonnes + 1) + 5)]
+        
+        # Variables de base et lignes du tableau
+        nombre_contraintes = self._nombre_contraintes()
+        for i in range(nombre_contraintes):
+            lignes.append(f"x{self.base[i]+1} |" + formater(i))
+        
+        # Ligne de la fonction objectif
+        lignes.append("z  |" + formater(nombre_contraintes))
+        
+        # Ligne de la fonction objectif auxiliaire si présente
         if self.var_artificielles:
-            print("w  |", end="")
-            for val in self.tableau[-1]:
-                print(f" {val:.2f}".ljust(largeur), end="")
-            print()
+            lignes.append("w  |" + formater(num_lignes - 1))
+        return "\n".join(lignes)
+    
+    def afficher_tableau(self):
+        """Affiche le tableau actuel du simplex."""
+        print(self.tableau_en_texte())
+    
+    def _tracer_tableau(self, titre: str) -> None:
+        """Trace le tableau complet (niveau COMPLET uniquement)."""
+        if journal.NIVEAU >= journal.COMPLET:
+            journal.emettre(journal.COMPLET, "simplex.tableau", f"{titre}\n{self.tableau_en_texte()}",
+                            tableau=self.tableau, base=self.base)
+    
+    def _nombre_contraintes(self) -> int:
+        """Nombre de lignes de contraintes du tableau (hors lignes des fonctions objectif)."""
+        return self.tableau.num_ligne - 1 - (1 if self.var_artificielles else 0)
+    
+    def couts_reduits(self, debut=0, fin=None):
+        """Coûts réduits des colonnes debut à fin - 1 pour la phase en cours (voir tarification).
+        
+        La fonction objectif de la phase en cours (w en Phase I, z ensuite) est la dernière ligne
+        du tableau ; elle contient -d_j.
+        """
+        fin = self.total if fin is None else fin
+        return [-v for v in self.tableau._ligne(self.tableau.num_ligne - 1)[debut:fin]]
+    
+    def ligne_pivot(self, ligne):
+        """La ligne de contrainte du tableau, c'est-à-dire la ligne de B⁻¹ A (voir tarification)."""
+        return self.tableau._ligne(ligne)[:self.total].tolist()
+    
+    def produits_colonnes(self, v):
+        """Les produits de chaque colonne du tableau (hors lignes objectif) par v (voir tarification)."""
+        produits = Vecteur("p", [0.0] * self.total)
+        for i in range(self._nombre_contraintes()):
+            if v[i] != 0:
+                produits.axpy(v[i], self.tableau.ligne(i).vue(0, self.total))
+        return produits.tolist()
     
     def trouver_variable_entrante(self):
-        """Trouve l'indice de la variable entrante (colonne pivot).
+        """Trouve l'indice de la variable entrante (colonne pivot) selon la règle de choix.
+        
+        Les variables artificielles ne peuvent pas entrer : en Phase II, elles doivent rester nulles.
         
         Returns:
-            int: Indice de la variable entrante, ou -1 si toutes les valeurs sont >= 0 (solution optimale).
+            int: Indice de la variable entrante, ou -1 si aucun coût réduit n'est améliorant (solution optimale).
         """
-        # Fonction objectif z est l'avant-dernière ligne si w est présente, sinon la dernière
-        ligne_z = -1 - (1 if self.var_artificielles else 0)
-        derniere_ligne = self.tableau[ligne_z]
-        
-        # Recherche de la valeur la plus négative dans la dernière ligne (hors dernière colonne)
-        min_val = 0
-        min_idx = -1
-        for j in range(len(derniere_ligne) - 1):
-            if derniere_ligne[j] < min_val:
-                min_val = derniere_ligne[j]
-                min_idx = j
-        
-        return min_idx  # Retourne -1 si la solution est optimale
+        return self.regle.choisir(self, set(self.colonnes_artificielles))
     
     def trouver_variable_entrante_phase_i(self):
-        """Trouve l'indice de la variable entrante pour la Phase I."""
-        # Dernière ligne = fonction objectif w
-        derniere_ligne = self.tableau[-1]
-        
-        min_val = 0
-        min_idx = -1
-        for j in range(len(derniere_ligne) - 1):
-            if derniere_ligne[j] < min_val:
-                min_val = derniere_ligne[j]
-                min_idx = j
-        
-        return min_idx  # Retourne -1 si la solution est optimale
+        """Trouve l'indice de la variable entrante pour la Phase I (fonction objectif w)."""
+        return self.regle.choisir(self)
     
     def trouver_variable_sortante(self, colonne_entrante):
         """Trouve l'indice de la variable sortante (ligne pivot) en utilisant le test du quotient minimum.
@@ -216,16 +257,34 @@ class Simplex:
         if colonne_entrante == -1:
             return -1  # Pas de pivot nécessaire
         
+        # Test du quotient sur les lignes de contraintes, en ignorant les éléments <= 0 de la colonne
+        nombre_contraintes = self._nombre_contraintes()
+        # Règle de Bland : à quotient égal, la variable de base de plus petit indice sort
+        bland = self.regle.departage_par_indice
+        
+        if self.tableau._numpy():
+            np = backend.np
+            t = self.tableau._ndarray()
+            colonne = t[:nombre_contraintes, colonne_entrante]
+            masque = colonne > TOLERANCE_PIVOT
+            if not masque.any():
+                return -1
+            quotients = np.full(nombre_contraintes, np.inf)
+            np.divide(t[:nombre_contraintes, self.total], colonne, out=quotients, where=masque)
+            ligne_sortante = int(np.argmin(quotients))
+            if bland:
+                ex_aequo = np.flatnonzero(quotients == quotients[ligne_sortante])
+                ligne_sortante = min(ex_aequo.tolist(), key=lambda i: self.base[i])
+            return ligne_sortante
+        
         min_ratio = float('inf')
         ligne_sortante = -1
-        
-        # Nombre de lignes à considérer (exclut les lignes des fonctions objectif)
-        num_contraintes = len(self.tableau) - 1 - (1 if self.var_artificielles else 0)
-        
-        for i in range(num_contraintes):  # Toutes les lignes sauf les fonctions objectif
-            if self.tableau[i][colonne_entrante] > 0:
-                ratio = self.tableau[i][-1] / self.tableau[i][colonne_entrante]
-                if ratio < min_ratio:
+        colonne = self.tableau._colonne(colonne_entrante)
+        second_membre = self.tableau._colonne(self.total)
+        for i in range(nombre_contraintes):  # Toutes les lignes sauf les fonctions objectif
+            if colonne[i] > TOLERANCE_PIVOT:
+                ratio = second_membre[i] / colonne[i]
+                if ratio < min_ratio or (bland and ratio == min_ratio and self.base[i] < self.base[ligne_sortante]):
                     min_ratio = ratio
                     ligne_sortante = i
         
@@ -238,17 +297,23 @@ class Simplex:
             ligne (int): Indice de la ligne pivot.
             colonne (int): Indice de la colonne pivot.
         """
+        tableau = self.tableau
         # Normaliser la ligne pivot
-        element_pivot = self.tableau[ligne][colonne]
-        for j in range(len(self.tableau[0])):
-            self.tableau[ligne][j] /= element_pivot
-        
-        # Mettre à jour les autres lignes
-        for i in range(len(self.tableau)):
-            if i != ligne:
-                facteur = self.tableau[i][colonne]
-                for j in range(len(self.tableau[0])):
-                    self.tableau[i][j] -= facteur * self.tableau[ligne][j]
+        tableau.diviser_ligne(ligne, tableau[ligne, colonne])
+        
+        # Mise à jour de rang 1 des autres lignes : ligne_i -= facteur_i * ligne_pivot, en place ;
+        # les lignes de facteur nul ne sont pas touchées
+        if tableau._numpy():
+            np = backend.np
+            t = tableau._ndarray()
+            facteurs = t[:, colonne].copy()
+            facteurs[ligne] = 0
+            lignes = np.flatnonzero(facteurs)
+            t[lignes] -= np.outer(facteurs[lignes], t[ligne])
+        else:
+            for i, facteur in enumerate(tableau._colonne(colonne).tolist()):
+                if i != ligne and facteur != 0:
+                    tableau.axpy_ligne(i, -facteur, ligne)
         
         # Mettre à jour les ensembles de base et hors base
         var_sortante = self.base[ligne]
@@ -263,108 +328,205 @@ class Simplex:
         # Trier les variables hors base pour faciliter la lecture
         self.non_base.sort()
     
+    def _pivoter(self, ligne, colonne, compteur):
+        """Pivot d'une itération : prévient la règle de choix, pivote et compte l'itération."""
+        alpha = self.tableau._colonne(colonne)[:self._nombre_contraintes()].tolist()
+        self.regle.avant_pivot(self, ligne, colonne, alpha)
+        self.pivot(ligne, colonne)
+        if self.statistiques is not None:
+            self.statistiques[compteur] += 1
+    
     def verifier_solution_phase_i(self):
         """Vérifie si la solution de Phase I est réalisable (w = 0)."""
         # La valeur de w est dans le coin inférieur droit du tableau
-        w_value = self.tableau[-1][-1]
+        w_value = self.tableau[self.tableau.num_ligne - 1, self.total]
         
         # Si w est presque zéro (tolérance numérique)
         if abs(w_value) < 1e-10:
-            print("Solution réalisable trouvée en Phase I (w ≈ 0).")
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.phase_i.realisable", "Solution réalisable trouvée en Phase I (w ≈ 0).")
             return True
         else:
-            print(f"Solution non réalisable en Phase I (w = {w_value}).")
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.phase_i.irrealisable",
+                                f"Solution non réalisable en Phase I (w = {w_value}).", w=w_value)
             return False
     
     def preparer_phase_ii(self):
         """Prépare le tableau pour la Phase II en supprimant les variables artificielles."""
-        # Supprimer la ligne w
-        self.tableau.pop()
+        # Supprimer la ligne w : le tableau devient la vue de ses premières lignes (sans copie)
+        t = self.tableau
+        self.tableau = Matrice._depuis_tampon(t.name, t._data, t.num_ligne - 1, t.num_colonne,
+                                              t._pas_ligne, t._pas_colonne, t._decalage)
         
         # Les variables artificielles sont maintenant inutiles on les laisse dans le tableau mais on ne les utilisera plus
+        # (trouver_variable_entrante les exclut grâce à colonnes_artificielles)
         self.var_artificielles = []
         
-        print("Tableau préparé pour la Phase II:")
-        self.afficher_tableau()
+        # Une artificielle restée en base (à zéro) est remplacée par une autre variable de sa ligne :
+        # sinon un pivot de Phase II pourrait la rendre positive. Si sa ligne est nulle hors
+        # artificielles, la contrainte est redondante et l'artificielle reste nulle.
+        artificielles = set(self.colonnes_artificielles)
+        for ligne, variable in enumerate(self.base):
+            if variable in artificielles:
+                for j in range(self.total):
+                    if j not in artificielles and j not in self.base and abs(self.tableau[ligne, j]) > TOLERANCE_PIVOT:
+                        self.pivot(ligne, j)
+                        break
+        
+        self._tracer_tableau("Tableau préparé pour la Phase II:")
     
-    def phase_i(self):
-        """Effectue la Phase I de l'algorithme du simplex (élimination des variables artificielles)."""
+    def _iterations_max(self, iterations_max):
+        """Le nombre maximal d'itérations par phase : 10 (m + n) par défaut, comme SimplexRevise."""
+        if iterations_max is None:
+            return 10 * (self.A.num_ligne + len(self.c))
+        return iterations_max
+
+    def phase_i(self, iterations_max=None):
+        """Effectue la Phase I de l'algorithme du simplex (élimination des variables artificielles).
+        
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations (10 (m + n) par défaut).
+        
+        Returns:
+            str: "optimal" (w minimal atteint), "non_borne" ou "max_iterations".
+        """
         iteration = 0
-        max_iterations = 100
+        max_iterations = self._iterations_max(iterations_max)
+        self.regle.demarrer(self)
         
         while iteration < max_iterations:
             iteration += 1
-            print(f"\nItération {iteration} (Phase I):")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.iteration", f"\nItération {iteration} (Phase I):",
+                                phase="phase_i", iteration=iteration)
             
             # Fonction objectif w est la dernière ligne du tableau en phase I
             colonne_entrante = self.trouver_variable_entrante_phase_i()
             
             if colonne_entrante == -1:
-                print("Phase I terminée.")
-                break
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.phase_i.fin", "Phase I terminée.", iterations=iteration)
+                return "optimal"
             
-            print(f"Variable entrante: x{colonne_entrante+1}")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.entrante", f"Variable entrante: x{colonne_entrante+1}",
+                                colonne=colonne_entrante)
             
             ligne_sortante = self.trouver_variable_sortante(colonne_entrante)
             
             if ligne_sortante == -1:
                 self.unbounded = True
-                print("Le problème est non borné (Phase I).")
-                return False
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.non_borne", "Le problème est non borné (Phase I).")
+                return "non_borne"
             
-            print(f"Variable sortante: x{self.base[ligne_sortante]+1}")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.sortante", f"Variable sortante: x{self.base[ligne_sortante]+1}",
+                                ligne=ligne_sortante, variable=self.base[ligne_sortante])
             
-            self.pivot(ligne_sortante, colonne_entrante)
+            self._pivoter(ligne_sortante, colonne_entrante, "iterations_phase_i" if self.var_artificielles else "iterations_phase_ii")
             
-            print("Tableau après pivot:")
-            self.afficher_tableau()
+            self._tracer_tableau("Tableau après pivot:")
         
-        return True
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.max_iterations", "Nombre maximum d'itérations atteint en Phase I.")
+        return "max_iterations"
     
-    def phase_ii(self):
-        """Effectue la Phase II de l'algorithme du simplex (optimisation)."""
+    def phase_ii(self, iterations_max=None):
+        """Effectue la Phase II de l'algorithme du simplex (optimisation).
+        
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations (10 (m + n) par défaut).
+        
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon.
+        """
         iteration = 0
-        max_iterations = 100
+        max_iterations = self._iterations_max(iterations_max)
+        self.regle.demarrer(self)
         
         while iteration < max_iterations:
             iteration += 1
-            print(f"\nItération {iteration} (Phase II):")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.iteration", f"\nItération {iteration} (Phase II):",
+                                phase="phase_ii", iteration=iteration)
             
             colonne_entrante = self.trouver_variable_entrante()
             
             if colonne_entrante == -1:
                 self.optimal = True
-                print("Solution optimale trouvée.")
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.optimal", "Solution optimale trouvée.", iterations=iteration)
                 break
             
-            print(f"Variable entrante: x{colonne_entrante+1}")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.entrante", f"Variable entrante: x{colonne_entrante+1}",
+                                colonne=colonne_entrante)
             
             ligne_sortante = self.trouver_variable_sortante(colonne_entrante)
             
             if ligne_sortante == -1:
                 self.unbounded = True
-                print("Le problème est non borné (valeur optimale: +inf)")
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.non_borne", "Le problème est non borné (valeur optimale: +inf)")
                 break
             
-            print(f"Variable sortante: x{self.base[ligne_sortante]+1}")
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.sortante", f"Variable sortante: x{self.base[ligne_sortante]+1}",
+                                ligne=ligne_sortante, variable=self.base[ligne_sortante])
             
-            self.pivot(ligne_sortante, colonne_entrante)
+            self._pivoter(ligne_sortante, colonne_entrante, "iterations_phase_i" if self.var_artificielles else "iterations_phase_ii")
             
-            print("Tableau après pivot:")
-            self.afficher_tableau()
+            self._tracer_tableau("Tableau après pivot:")
         
         # Extraire la solution optimale si elle existe
         if self.optimal:
             self.extraire_solution()
             return True
         elif iteration >= max_iterations:
-            print("Nombre maximum d'itérations atteint sans convergence.")
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.max_iterations", "Nombre maximum d'itérations atteint sans convergence.")
         
         return False
     
-    def resoudre(self):
+    def resoudre(self, iterations_max=None):
         """Résout le problème de programmation linéaire en utilisant la méthode du simplex.
         
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations par phase (10 (m + n) par défaut).
+        
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon.
+        """
+        debut = perf_counter()
+        self.statistiques = {"methode": self.methode, "regle": str(self.regle),
+                             "iterations_phase_i": 0, "iterations_phase_ii": 0}
+        if self.methode == "revise":
+            resultat = self.resoudre_revise(iterations_max)
+        else:
+            resultat = self.resoudre_tableau(iterations_max)
+        self._conclure_statistiques(debut)
+        return resultat
+
+    def _conclure_statistiques(self, debut: float) -> None:
+        """Complète les statistiques (total des itérations, durée, statut) et les trace."""
+        self.statistiques["iterations"] = (self.statistiques["iterations_phase_i"] + self.statistiques.get("iterations_duales", 0)
+                                           + self.statistiques["iterations_phase_ii"])
+        self.statistiques["duree"] = perf_counter() - debut
+        self.statistiques["statut"] = ("optimal" if self.optimal else "non_borne" if self.unbounded
+                                       else "irrealisable" if self.irrealisable else "max_iterations")
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.statistiques",
+                            f"Règle {self.regle}: {self.statistiques['iterations']} itérations en "
+                            f"{self.statistiques['duree']:.3f} s", **self.statistiques)
+    
+    def resoudre_tableau(self, iterations_max=None):
+        """Résout le problème par la méthode du tableau (Phase I si nécessaire, puis Phase II).
+        
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations par phase (10 (m + n) par défaut).
+        
         Returns:
             bool: True si une solution optimale a été trouvée, False sinon.
         """
@@ -372,20 +534,111 @@ class Simplex:
         
         # Si des variables artificielles sont présentes, effectuer la Phase I
         if self.var_artificielles:
-            print("\n=== PHASE I: Élimination des variables artificielles ===")
-            self.phase_i()
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.phase_i", "\n=== PHASE I: Élimination des variables artificielles ===")
+            # Phase I interrompue : on ne sait pas encore si le problème est réalisable
+            if self.phase_i(iterations_max) != "optimal":
+                return False
             
             # Vérifier si la solution de Phase I est réalisable
             if not self.verifier_solution_phase_i():
-                print("Le problème n'a pas de solution réalisable.")
+                self.irrealisable = True
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.irrealisable", "Le problème n'a pas de solution réalisable.")
                 return False
             
             # Préparer pour la Phase II
             self.preparer_phase_ii()
         
         # Phase II: Résoudre le problème original
-        print("\n=== PHASE II: Optimisation du problème original ===")
-        return self.phase_ii()
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.phase_ii", "\n=== PHASE II: Optimisation du problème original ===")
+        return self.phase_ii(iterations_max)
+    
+    def resoudre_revise(self, iterations_max=None):
+        """Résout le problème par le simplexe révisé et en recopie le résultat (base, solution...).
+        
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations par phase (10 (m + n) par défaut).
+        
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon.
+        """
+        if self.A is None or self.b is None or self.c is None:
+            raise ValueError("Les données du problème ne sont pas complètes")
+        self.revise = simplex_revise.SimplexRevise(self.A, self.b, self.c, self.constraint_types, regle=self.regle)
+        resultat = self.revise.resoudre(iterations_max)
+        self._recopier_revise()
+        return resultat
+
+    def resoudre_a_nouveau(self, b=None, c=None, contraintes=None):
+        """Résout à nouveau le problème après un changement du second membre ou des coûts, ou
+        l'ajout de contraintes (études paramétriques, scénarios).
+
+        Si la résolution précédente a atteint l'optimum par le simplexe révisé, sa base finale
+        est reprise (voir SimplexRevise.resoudre_a_nouveau) : simplexe dual après un changement
+        de b ou des contraintes ajoutées, simplexe primal après un changement de c, en général
+        quelques pivots seulement. Sinon (première résolution, méthode du tableau, problème non
+        borné ou irréalisable), le problème modifié est résolu depuis le début par le simplexe
+        révisé. Les données A, b, c et constraint_types sont mises à jour dans les deux cas.
+
+        Args:
+            b (Vecteur | list, optional): Le nouveau second membre des contraintes existantes. Default is None.
+            c (Vecteur | list, optional): Les nouveaux coûts. Default is None.
+            contraintes (list, optional): Les contraintes ajoutées, triplets (coefficients, type, second membre) ;
+                les coefficients sont n valeurs ou un dictionnaire {colonne: valeur}. Default is None.
+
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon.
+
+        Raises:
+            ValueError: Si les données du problème sont incomplètes ou si les modifications sont incorrectes
+        """
+        if self.A is None or self.b is None or self.c is None:
+            raise ValueError("Les données du problème ne sont pas complètes")
+        debut = perf_counter()
+        contraintes = list(contraintes or [])
+        types = list(self.constraint_types) or ["<="] * self.A.num_ligne
+        seconds_membres = list(self.b if b is None else b) + [valeur for _, _, valeur in contraintes]
+        types += [type_contrainte for _, type_contrainte, _ in contraintes]
+        self.statistiques = {"methode": "revise", "regle": str(self.regle), "iterations_phase_i": 0,
+                             "iterations_duales": 0, "iterations_phase_ii": 0}
+
+        if self.revise is not None and self.revise.optimal:
+            self.statistiques["demarrage"] = "a_chaud"
+            resultat = self.revise.resoudre_a_nouveau(b, c, contraintes)
+            self.A = self.revise.A
+            self.b = Vecteur("b", seconds_membres)
+            self.c = self.c if c is None else Vecteur("c", list(c))
+            self.constraint_types = types
+            self._recopier_revise()
+        else:
+            self.statistiques["demarrage"] = "a_froid"
+            if b is not None and len(b) != self.A.num_ligne:
+                raise ValueError(f"Le second membre doit avoir {self.A.num_ligne} composantes")
+            if contraintes:
+                self.A = simplex_revise.ajouter_lignes(self.A, [coefficients for coefficients, _, _ in contraintes])
+            self.b = Vecteur("b", seconds_membres)
+            self.c = self.c if c is None else Vecteur("c", list(c))
+            self.constraint_types = types
+            resultat = self.resoudre_revise()
+        self._conclure_statistiques(debut)
+        return resultat
+
+    def _recopier_revise(self):
+        """Recopie l'état du moteur révisé (base, statut, solution, itérations)."""
+        if self.statistiques is not None:
+            self.statistiques["iterations_phase_i"] = self.revise.iterations_phase_i
+            self.statistiques["iterations_phase_ii"] = (self.revise.iterations - self.revise.iterations_phase_i
+                                                        - self.revise.iterations_duales)
+            if "iterations_duales" in self.statistiques:
+                self.statistiques["iterations_duales"] = self.revise.iterations_duales
+        self.base = self.revise.base
+        self.optimal = self.revise.optimal
+        self.unbounded = self.revise.unbounded
+        self.irrealisable = self.revise.irrealisable
+        self.solution = self.revise.solution
+        self.valeur_optimale = self.revise.valeur_optimale
     
     def extraire_solution(self):
         """Extrait la solution optimale du tableau final."""
@@ -398,10 +651,10 @@ class Simplex:
         # Récupérer les valeurs des variables de base
         for i, var_idx in enumerate(self.base):
             if var_idx < n:  # Si la variable de base est une variable originale
-                self.solution[var_idx] = self.tableau[i][-1]
+                self.solution[var_idx] = self.tableau[i, self.total]
         
         # Valeur optimale de la fonction objectif
-        self.valeur_optimale = self.tableau[-1][-1]
+        self.valeur_optimale = self.tableau[self.tableau.num_ligne - 1, self.total]
     
     def afficher_solution(self):
         """Affiche la solution du problème."""
@@ -417,71 +670,62 @@ class Simplex:
             print("\nAucune solution optimale n'a été trouvée.")
 
 
+def comparer_regles(A, b, c, constraint_types=None, regles=None, methode=None):
+    """Résout le même problème avec chaque règle de choix et retourne leurs statistiques.
+    
+    Args:
+        A (Matrice | MatriceCreuse): Matrice des coefficients des contraintes.
+        b (Vecteur): Vecteur du second membre.
+        c (Vecteur): Vecteur des coûts.
+        constraint_types (list, optional): Types de contraintes. Default is None ("<=" partout).
+        regles (list, optional): Noms ou instances de règles. Default is None (toutes celles de tarification.REGLES).
+        methode (str, optional): "tableau" ou "revise". Default is None (selon A, voir Simplex).
+    
+    Returns:
+        list: Les statistiques de chaque résolution (voir Simplex.statistiques), de la plus rapide à la plus lente.
+    """
+    resultats = []
+    for regle in regles or list(tarification.REGLES):
+        simplex = Simplex(A, b, c, list(constraint_types) if constraint_types else None, methode=methode, regle=regle)
+        simplex.resoudre()
+        resultats.append(dict(simplex.statistiques, valeur_optimale=simplex.valeur_optimale))
+    return sorted(resultats, key=lambda s: s["duree"])
+
+
 def lire_simplex(filename):
     """Lit un fichier de données pour le problème du simplexe avec types de contraintes.
     
+    Le fichier est lu par blocs et les données construites en un seul passage
+    (voir lecture.lire_probleme_simplex pour le format). Les contraintes peuvent être
+    écrites en creux, « j:aj ... <= b » : la matrice des coefficients est alors une
+    MatriceCreuse et Simplex utilise par défaut le simplexe révisé.
+
     Args:
         filename (str): Le nom du fichier à lire.
 
     Returns:
-        tuple: Un tuple contenant la matrice des coefficients, le vecteur des contraintes,
-               le vecteur des coûts et les types de contraintes.
+        tuple: Un tuple contenant la matrice des coefficients (Matrice ou MatriceCreuse), le
+               vecteur des contraintes, le vecteur des coûts et les types de contraintes.
+
+    Raises:
+        lecture.ErreurLecture: Si le fichier est mal formé (le message donne le numéro de ligne)
     """
-    with open(filename, 'r') as f:
-        lines = [line.strip() for line in f.readlines() if not line.startswith('//')]
-    
-    # Première ligne : coefficients de la fonction objectif
-    c_values = list(map(float, lines[0].split()))
-    
-    # Lignes suivantes : contraintes
-    A_values = []
-    b_values = []
-    constraint_types = []
-    
-    for i in range(1, len(lines)):
-        parts = lines[i].split()
-        
-        # Trouver l'index du type de contrainte
-        type_idx = -1
-        for j, part in enumerate(parts):
-            if part in ["<=", ">=", "="]:
-                type_idx = j
-                break
-        
-        if type_idx == -1:
-            raise ValueError(f"Type de contrainte manquant à la ligne {i+1}")
-        
-        # Extraire les coefficients (tout avant le type de contrainte)
-        coeffs = list(map(float, parts[:type_idx]))
-        
-        # Extraire le type de contrainte
-        constraint_type = parts[type_idx]
-        
-        # Extraire la valeur du second membre (après le type de contrainte)
-        b_value = float(parts[type_idx + 1])
-        
-        A_values.append(coeffs)
-        b_values.append(b_value)
-        constraint_types.append(constraint_type)
-    
-    # Créer les objets Matrice et Vecteur
-    A = Matrice("A", A_values)
-    b = Vecteur("b", b_values)
-    c = Vecteur("c", c_values)
+    A, b, c, constraint_types = lecture.lire_probleme_simplex(filename)
     
     # Afficher les données pour vérification
-    print("Données lues:")
-    print("Fonction objectif (c):", c.elements)
-    print("Matrice des contraintes (A):")
-    for row in A.elements:
-        print(row.elements)
-    print("Second membre (b):", b.elements)
-    print("Types de contraintes:", constraint_types)
+    if journal.NIVEAU >= journal.COMPLET:
+        lignes_A = "\n".join(str(row.tolist()) for row in A)
+        journal.emettre(journal.COMPLET, "simplex.lecture",
+                        f"Données lues:\nFonction objectif (c): {c.tolist()}\nMatrice des contraintes (A):\n{lignes_A}\n"
+                        f"Second membre (b): {b.tolist()}\nTypes de contraintes: {constraint_types}",
+                        fichier=filename, A=A, b=b, c=c, constraint_types=constraint_types)
     
     return A, b, c, constraint_types
 
 
 if __name__ == "__main__":
+    # Affichage pédagogique de toutes les étapes (journal.SILENCIEUX pour aller à pleine vitesse)
+    journal.configurer(journal.COMPLET)
     try:
         # Mettez bien le chemin de votre fichier ici
         A, b, c, constraint_types = lire_simplex("c:/Users/User/OneDrive - Institut Catholique de Lille/Bureau/L3 SDN/S2/Method_Num_&_Sim/TP1/simplex.txt")
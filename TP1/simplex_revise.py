@@ -0,0 +1,612 @@
+"""Méthode du simplexe révisé : la base est factorisée, le tableau n'est jamais formé.
+
+Le simplexe en tableau (Simplex) réécrit à chaque pivot les (m + 1) x (n + m + 1) éléments
+du tableau. Le simplexe révisé ne garde que la base B (m x m), sous forme d'une
+factorisation LU suivie de mises à jour en forme produit (une matrice êta par pivot) :
+    B⁻¹ = E_k ... E_1 B_0⁻¹
+Chaque itération coûte deux résolutions avec la base (BTRAN pour les multiplicateurs y,
+FTRAN pour la colonne entrante), soit O(m²), plus le calcul des coûts réduits
+d = c - Aᵀ y, soit O(nnz(A)). Les colonnes d'écart, de surplus et artificielles sont des
+colonnes unité : elles ne sont jamais stockées. Toutes les REFACTORISATION mises à jour,
+la base est refactorisée pour borner le coût des êtas et les erreurs d'arrondi.
+
+Si A est une MatriceCreuse, rien n'est stocké en m x m : les coûts réduits et la
+ligne pivot sont calculés sur les seuls non-nuls des lignes de A, les colonnes sont lues
+dans une copie CSC (la transposée), et la base n'est pas factorisée en LU mais réinversée
+en forme produit à partir de l'identité (B_0 = I) : les colonnes unité des écarts et des
+artificielles ne coûtent rien et chaque colonne de décision ajoute un êta creux. La
+mémoire et le temps d'une itération sont alors proportionnels au nombre de non-nuls.
+
+Les variables sont numérotées comme dans Simplex (décision, écarts, surplus, puis
+artificielles), de sorte que base et solution se lisent de la même façon (la réinversion
+d'une matrice creuse peut toutefois changer l'ordre des lignes de base).
+
+Après une résolution optimale, resoudre_a_nouveau reprend la base finale pour un problème
+modifié : simplexe dual après un changement de b ou l'ajout de contraintes (la base reste
+duale-réalisable), simplexe primal après un changement de c (elle reste primale-réalisable).
+"""
+from array import array
+from bisect import bisect_left
+from operator import mul
+from vecteur import Vecteur
+from matrice import Matrice
+from creuse import MatriceCreuse
+import journal
+import pivot
+import tarification
+
+# Nombre de mises à jour êta entre deux refactorisations de la base
+REFACTORISATION = 50
+# Seuils numériques : coût réduit « positif », élément de pivot « non nul »
+TOLERANCE_COUT = tarification.TOLERANCE
+TOLERANCE_PIVOT = 1e-9
+
+
+class SimplexRevise:
+    """Simplexe révisé en deux phases pour max cᵀx sous A x (<=, >=, =) b, x >= 0."""
+
+    def __init__(self, A, b, c, constraint_types=None, refactorisation: int | None = None, regle=None):
+        """
+        Args:
+            A (Matrice | MatriceCreuse): Matrice des coefficients des contraintes (non modifiée)
+            b (Vecteur): Vecteur du second membre
+            c (Vecteur): Vecteur des coûts (fonction objectif)
+            constraint_types (list, optional): Types de contraintes ("<=", ">=", "="), "<=" par défaut
+            refactorisation (int, optional): Le nombre de mises à jour êta entre deux
+                                             refactorisations (REFACTORISATION par défaut)
+
+        Raises:
+            ValueError: Si les dimensions sont incompatibles ou si un type de contrainte est inconnu
+        """
+        if A is None or b is None or c is None:
+            raise ValueError("Les données du problème ne sont pas complètes")
+        m, n = A.num_ligne, A.num_colonne
+        if len(b) != m or len(c) != n:
+            raise ValueError("Les dimensions de A, b et c ne sont pas compatibles")
+        types = list(constraint_types) if constraint_types else ["<="] * m
+        if len(types) != m:
+            raise ValueError("Il faut un type de contrainte par ligne de A")
+        if any(t not in ("<=", ">=", "=") for t in types):
+            raise ValueError(f"Type de contrainte inconnu: {next(t for t in types if t not in ('<=', '>=', '='))}")
+        if refactorisation is None:
+            refactorisation = REFACTORISATION
+        if refactorisation < 1:
+            raise ValueError("La période de refactorisation doit être au moins 1")
+
+        self.A = A
+        # Colonnes de A creuse : la transposée au format CSR est A au format CSC
+        self._colonnes = A.transposee() if isinstance(A, MatriceCreuse) else None
+        self._lu = None
+        self.m = m
+        self.n = n
+        self.refactorisation = refactorisation
+        self.regle = tarification.regle("dantzig" if regle is None else regle)
+        # Une ligne de second membre négatif est multipliée par -1 (et son inégalité inversée)
+        # pour que la base initiale d'écarts et d'artificielles soit réalisable
+        self._signes = array("d", [-1.0 if v < 0 else 1.0 for v in b])
+        self._b = array("d", [s * v for s, v in zip(self._signes, b)])
+        inverse = {"<=": ">=", ">=": "<=", "=": "="}
+        self.types = [inverse[t] if s < 0 else t for t, s in zip(types, self._signes)]
+        self.c = array("d", c)
+
+        # Colonnes auxiliaires, numérotées comme dans Simplex.initialiser : (ligne, coefficient)
+        ecarts = [(i, 1.0) for i, t in enumerate(self.types) if t == "<="]
+        surplus = [(i, -1.0) for i, t in enumerate(self.types) if t == ">="]
+        artificielles = [(i, 1.0) for i, t in enumerate(self.types) if t != "<="]
+        self._auxiliaires = ecarts + surplus + artificielles
+        self.total = n + len(self._auxiliaires)
+        self.var_artificielles = list(range(self.total - len(artificielles), self.total))
+
+        # Base initiale : l'écart ou l'artificielle de chaque ligne
+        position = {i: n + k for k, (i, _) in enumerate(ecarts)}
+        position.update((i, self.total - len(artificielles) + k) for k, (i, _) in enumerate(artificielles))
+        self.base = [position[i] for i in range(m)]
+
+        self.iterations = 0
+        self.iterations_phase_i = 0
+        self.iterations_duales = 0
+        self.optimal = False
+        self.unbounded = False
+        self.irrealisable = False
+        self.solution = None
+        self.valeur_optimale = None
+
+    def _colonne(self, j: int) -> list:
+        """La colonne j de la matrice des contraintes complète, en dense (lignes de b < 0 inversées)."""
+        if j < self.n and self._colonnes is None:
+            return list(map(mul, self.A._colonne(j), self._signes))
+        colonne = [0.0] * self.m
+        if j < self.n:
+            for i, v in self._colonnes._couples(j):
+                colonne[i] = v * self._signes[i]
+            return colonne
+        i, coefficient = self._auxiliaires[j - self.n]
+        colonne[i] = coefficient
+        return colonne
+
+    def _factoriser(self) -> None:
+        """Refactorise la base courante, vide les êtas et recalcule x_B = B⁻¹ b."""
+        if self._colonnes is not None:
+            self._reinverser()
+            return
+        m = self.m
+        tampon = array("d", [0.0]) * (m * m)
+        colonnes = memoryview(tampon)
+        for k, j in enumerate(self.base):
+            colonnes[k::m] = array("d", self._colonne(j))
+        self._lu = pivot.FactorisationLU(Matrice._depuis_tampon("B", tampon, m, m))
+        self._etas = []
+        self._etas_base = 0
+        self._x = self._ftran(list(self._b))
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "simplex.refactorisation",
+                            f"Refactorisation de la base (itération {self.iterations})", iteration=self.iterations)
+
+    def _reinverser(self) -> None:
+        """Réinversion en forme produit de la base courante (A creuse), à partir de B_0 = I.
+
+        Les colonnes auxiliaires sont placées sur leur ligne (un êta seulement pour un
+        surplus), puis chaque colonne de décision, de la plus creuse à la plus dense, pivote
+        sur la ligne encore libre où B⁻¹ a_j est le plus grand. La base est réordonnée selon
+        les lignes de pivot.
+
+        Raises:
+            ValueError: Si la base est numériquement singulière
+        """
+        self._lu = None
+        self._etas = []
+        base = [-1] * self.m
+        decisions = []
+        for j in self.base:
+            if j < self.n:
+                decisions.append(j)
+                continue
+            i, coefficient = self._auxiliaires[j - self.n]
+            base[i] = j
+            if coefficient != 1.0:
+                self._etas.append((i, array("q", [i]), array("d", [coefficient])))
+        debuts = self._colonnes._debuts
+        decisions.sort(key=lambda j: debuts[j + 1] - debuts[j])
+        for j in decisions:
+            alpha = self._ftran(self._colonne(j))
+            r, pivot_max = -1, TOLERANCE_PIVOT
+            for i, a in enumerate(alpha):
+                if a != 0 and base[i] == -1 and abs(a) > pivot_max:
+                    r, pivot_max = i, abs(a)
+            if r == -1:
+                raise ValueError("Base singulière lors de la réinversion")
+            base[r] = j
+            indices = array("q", [r])
+            valeurs = array("d", [alpha[r]])
+            for i, a in enumerate(alpha):
+                if a != 0 and i != r:
+                    indices.append(i)
+                    valeurs.append(a)
+            self._etas.append((r, indices, valeurs))
+        self.base[:] = base
+        self._etas_base = len(self._etas)
+        self._x = self._ftran(list(self._b))
+        if journal.NIVEAU >= journal.ETAPES:
+            journal.emettre(journal.ETAPES, "simplex.refactorisation",
+                            f"Réinversion de la base ({len(self._etas)} êtas, itération {self.iterations})",
+                            iteration=self.iterations)
+
+    def _ftran(self, a: list) -> list:
+        """Retourne B⁻¹ a : résolution avec B_0, puis les êtas dans l'ordre."""
+        x = list(a) if self._lu is None else self._lu._substituer([a[p] for p in self._lu.permutation])
+        for r, indices, valeurs in self._etas:
+            t = x[r] / valeurs[0]
+            if t != 0:
+                for i, v in zip(indices[1:], valeurs[1:]):
+                    x[i] -= v * t
+            x[r] = t
+        return x
+
+    def _btran(self, c: list) -> list:
+        """Retourne yᵀ = cᵀ B⁻¹ : les êtas en ordre inverse, puis résolution avec B_0ᵀ."""
+        y = list(c)
+        for r, indices, valeurs in reversed(self._etas):
+            y[r] = (y[r] - sum(map(mul, map(y.__getitem__, indices[1:]), valeurs[1:]))) / valeurs[0]
+        return y if self._lu is None else self._lu.resoudre_transposee(y)
+
+    def _mettre_a_jour(self, r: int, entrante: int, alpha: list) -> None:
+        """Remplace la r-ième variable de base par entrante, alpha = B⁻¹ a_entrante."""
+        theta = self._x[r] / alpha[r]
+        x = self._x
+        for i, a in enumerate(alpha):
+            if a != 0:
+                x[i] -= theta * a
+        x[r] = theta
+        self.base[r] = entrante
+        # Êta creux : le pivot en tête, puis les autres éléments non nuls de alpha
+        indices = array("q", [r])
+        valeurs = array("d", [alpha[r]])
+        for i, a in enumerate(alpha):
+            if a != 0 and i != r:
+                indices.append(i)
+                valeurs.append(a)
+        self._etas.append((r, indices, valeurs))
+        if len(self._etas) - self._etas_base >= self.refactorisation:
+            self._factoriser()
+
+    def _produits(self, w: list, debut: int, fin: int) -> list:
+        """Les produits a_j · w pour les colonnes debut à fin - 1.
+
+        Les colonnes de A sont traitées ligne par ligne (Σ w_i A_i) : les lignes où w est
+        nul, par exemple celles dont l'écart est en base, sont sautées.
+        """
+        if self._colonnes is not None:
+            return self._produits_creux(w, debut, fin)
+        produits = Vecteur("p", [0.0] * max(0, min(fin, self.n) - debut))
+        if produits.taille:
+            for i, (wi, signe) in enumerate(zip(w, self._signes)):
+                if wi != 0:
+                    produits.axpy(wi * signe, self.A.ligne(i).vue(debut, min(fin, self.n)))
+        produits = produits.tolist()
+        for k in range(max(debut, self.n), fin):
+            i, coefficient = self._auxiliaires[k - self.n]
+            produits.append(coefficient * w[i])
+        return produits
+
+    def _produits_creux(self, w: list, debut: int, fin: int) -> list:
+        """_produits pour A creuse : seuls les non-nuls des colonnes debut à fin - 1 sont lus."""
+        fin_a = min(fin, self.n)
+        produits = [0.0] * max(0, fin_a - debut)
+        if produits:
+            A = self.A
+            indices, valeurs, debuts = A._indices, A._valeurs, A._debuts
+            partiel = debut > 0 or fin_a < self.n
+            for i, (wi, signe) in enumerate(zip(w, self._signes)):
+                if wi != 0:
+                    f = wi * signe
+                    a, b = debuts[i], debuts[i + 1]
+                    if partiel:
+                        a = bisect_left(indices, debut, a, b)
+                        b = bisect_left(indices, fin_a, a, b)
+                    for k in range(a, b):
+                        produits[indices[k] - debut] += f * valeurs[k]
+        for k in range(max(debut, self.n), fin):
+            i, coefficient = self._auxiliaires[k - self.n]
+            produits.append(coefficient * w[i])
+        return produits
+
+    def couts_reduits(self, debut: int = 0, fin: int | None = None) -> list:
+        """d_j = c_j - yᵀ a_j pour les colonnes debut à fin - 1 (0 pour les variables de base),
+        avec les coûts et les multiplicateurs y de l'itération en cours (voir tarification)."""
+        fin = self.total if fin is None else fin
+        d = [cj - p for cj, p in zip(self._couts[debut:fin], self._produits(self._y, debut, fin))]
+        for j in self.base:
+            if debut <= j < fin:
+                d[j - debut] = 0.0
+        return d
+
+    def ligne_pivot(self, r: int) -> list:
+        """La ligne r de B⁻¹ A : ρ = B⁻ᵀ e_r, puis ρ · a_j pour toutes les colonnes."""
+        e_r = [0.0] * self.m
+        e_r[r] = 1.0
+        return self._produits(self._btran(e_r), 0, self.total)
+
+    def produits_colonnes(self, v) -> list:
+        """(B⁻¹ a_j) · v = a_j · (B⁻ᵀ v) pour toutes les colonnes."""
+        return self._produits(self._btran(list(v)), 0, self.total)
+
+    def _variable_sortante(self, alpha: list) -> int:
+        """Test du quotient minimum sur x_B / alpha (la première ligne en cas d'égalité, ou la
+        variable de plus petit indice si la règle l'exige)."""
+        bland = self.regle.departage_par_indice
+        meilleur, sortante = float("inf"), -1
+        for i, a in enumerate(alpha):
+            if a > TOLERANCE_PIVOT:
+                quotient = self._x[i] / a
+                if quotient < meilleur or (bland and quotient == meilleur and self.base[i] < self.base[sortante]):
+                    meilleur, sortante = quotient, i
+        return sortante
+
+    def _iterer(self, phase: str, couts: list, exclues: set, iterations_max: int) -> str:
+        """Itère jusqu'à l'optimum de la phase.
+
+        Returns:
+            str: "optimal", "non_borne" ou "max_iterations"
+        """
+        self._couts = couts
+        self._y = self._btran([couts[j] for j in self.base])
+        self.regle.demarrer(self)
+        for _ in range(iterations_max):
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.iteration", f"\nItération {self.iterations + 1} ({phase}):",
+                                phase=phase, iteration=self.iterations + 1)
+            entrante = self.regle.choisir(self, exclues)
+            if entrante == -1:
+                return "optimal"
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.entrante", f"Variable entrante: x{entrante+1}",
+                                colonne=entrante)
+            alpha = self._ftran(self._colonne(entrante))
+            sortante = self._variable_sortante(alpha)
+            if sortante == -1:
+                return "non_borne"
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.sortante", f"Variable sortante: x{self.base[sortante]+1}",
+                                ligne=sortante, variable=self.base[sortante])
+            self.regle.avant_pivot(self, sortante, entrante, alpha)
+            self._mettre_a_jour(sortante, entrante, alpha)
+            self.iterations += 1
+            self._y = self._btran([couts[j] for j in self.base])
+        return "max_iterations"
+
+    def _iterer_dual(self, couts: list, exclues: set, iterations_max: int) -> str:
+        """Simplexe dual : la base reste duale-réalisable (aucun coût réduit améliorant) et la
+        variable de base la plus irréalisable sort, x_B < 0 ou artificielle non nulle.
+
+        Returns:
+            str: "optimal" (base primale réalisable), "irrealisable" ou "max_iterations"
+        """
+        self._couts = couts
+        self._y = self._btran([couts[j] for j in self.base])
+        artificielles = set(self.var_artificielles)
+        tolerance = TOLERANCE_COUT * max(1.0, max(map(abs, self._b), default=0.0))
+        for _ in range(iterations_max):
+            sortante, violation = -1, tolerance
+            for i, (x, j) in enumerate(zip(self._x, self.base)):
+                ecart = abs(x) if j in artificielles else -x
+                if ecart > violation:
+                    sortante, violation = i, ecart
+            if sortante == -1:
+                return "optimal"
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.iteration", f"\nItération {self.iterations + 1} (dual):",
+                                phase="dual", iteration=self.iterations + 1)
+                journal.emettre(journal.ETAPES, "simplex.sortante", f"Variable sortante: x{self.base[sortante]+1}",
+                                ligne=sortante, variable=self.base[sortante])
+            # La variable sortante remonte vers 0 (x < 0) ou, artificielle positive, y redescend
+            sens = 1.0 if self._x[sortante] < 0 else -1.0
+            rangee = self.ligne_pivot(sortante)
+            d = self.couts_reduits()
+            dans_base = set(self.base)
+            entrante, meilleur = -1, float("inf")
+            for j, a in enumerate(rangee):
+                a *= sens
+                if a < -TOLERANCE_PIVOT and j not in exclues and j not in dans_base:
+                    quotient = min(d[j], 0.0) / a
+                    if quotient < meilleur:
+                        meilleur, entrante = quotient, j
+            if entrante == -1:
+                return "irrealisable"
+            if journal.NIVEAU >= journal.ETAPES:
+                journal.emettre(journal.ETAPES, "simplex.entrante", f"Variable entrante: x{entrante+1}",
+                                colonne=entrante)
+            self._mettre_a_jour(sortante, entrante, self._ftran(self._colonne(entrante)))
+            self.iterations += 1
+            self._y = self._btran([couts[j] for j in self.base])
+        return "max_iterations"
+
+    def _chasser_artificielles(self) -> None:
+        """Fait sortir de la base les artificielles restées à zéro après la Phase I.
+
+        Une artificielle qu'aucune colonne ne peut remplacer correspond à une contrainte
+        redondante : elle reste dans la base, à zéro, et n'entrera plus.
+        """
+        artificielles = set(self.var_artificielles)
+        for j in self.var_artificielles:
+            # Une refactorisation peut réordonner la base : la ligne est recherchée à chaque fois
+            if j not in self.base:
+                continue
+            r = self.base.index(j)
+            ligne = self.ligne_pivot(r)
+            dans_base = set(self.base)
+            for k in range(self.total):
+                if k not in dans_base and k not in artificielles and abs(ligne[k]) > TOLERANCE_PIVOT:
+                    self._mettre_a_jour(r, k, self._ftran(self._colonne(k)))
+                    break
+
+    def resoudre(self, iterations_max: int | None = None) -> bool:
+        """Résout le problème en deux phases.
+
+        Args:
+            iterations_max (int, optional): Le nombre maximal d'itérations par phase
+                                            (10 (m + n) par défaut)
+
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon
+        """
+        if iterations_max is None:
+            iterations_max = 10 * (self.m + self.n)
+        self.iterations = 0
+        self.iterations_phase_i = 0
+        self.iterations_duales = 0
+        self._factoriser()
+
+        if self.var_artificielles:
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.phase_i", "\n=== PHASE I: Élimination des variables artificielles ===")
+            couts = [0.0] * self.total
+            for j in self.var_artificielles:
+                couts[j] = -1.0
+            statut = self._iterer("Phase I", couts, set(), iterations_max)
+            self.iterations_phase_i = self.iterations
+            # Phase I interrompue : w n'est pas minimal, on ne sait pas si le problème est réalisable
+            if statut != "optimal":
+                return self._terminer(statut)
+            w = sum(self._x[i] for i, j in enumerate(self.base) if j in self.var_artificielles)
+            if w > TOLERANCE_COUT * max(1.0, max(self._b, default=0.0)):
+                self.irrealisable = True
+                if journal.NIVEAU >= journal.RESUME:
+                    journal.emettre(journal.RESUME, "simplex.phase_i.irrealisable",
+                                    f"Solution non réalisable en Phase I (w = {-w}).", w=-w)
+                    journal.emettre(journal.RESUME, "simplex.irrealisable", "Le problème n'a pas de solution réalisable.")
+                return False
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.phase_i.realisable", "Solution réalisable trouvée en Phase I (w ≈ 0).")
+            self._chasser_artificielles()
+
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.phase_ii", "\n=== PHASE II: Optimisation du problème original ===")
+        couts = list(self.c) + [0.0] * (self.total - self.n)
+        statut = self._iterer("Phase II", couts, set(self.var_artificielles), iterations_max)
+        return self._terminer(statut)
+
+    def _terminer(self, statut: str) -> bool:
+        """Enregistre le résultat de la Phase II (ou d'une reprise)."""
+        if statut == "optimal":
+            self.optimal = True
+            self.extraire_solution()
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.optimal", "Solution optimale trouvée.", iterations=self.iterations)
+            return True
+        if statut == "non_borne":
+            self.unbounded = True
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.non_borne", "Le problème est non borné (valeur optimale: +inf)")
+        elif journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.max_iterations", "Nombre maximum d'itérations atteint sans convergence.")
+        return False
+
+    def resoudre_a_nouveau(self, b=None, c=None, contraintes=None, iterations_max: int | None = None) -> bool:
+        """Résout le problème modifié en repartant de la base optimale de la résolution précédente.
+
+        Les nouvelles contraintes entrent en base par leur écart (ou leur artificielle pour
+        une égalité), ce qui garde la base duale-réalisable ; le simplexe dual rétablit alors
+        x_B >= 0 avec les anciens coûts, puis le simplexe primal optimise les nouveaux. Sans
+        changement de b ni contrainte ajoutée, seule la seconde étape a lieu, et inversement.
+
+        Args:
+            b (Vecteur | list, optional): Le nouveau second membre des contraintes existantes
+            c (Vecteur | list, optional): Les nouveaux coûts
+            contraintes (list, optional): Les contraintes ajoutées, triplets (coefficients, type,
+                second membre) ; les coefficients sont n valeurs ou un dictionnaire {colonne: valeur}
+            iterations_max (int, optional): Le nombre maximal d'itérations par étape
+                                            (10 (m + n) par défaut)
+
+        Returns:
+            bool: True si une solution optimale a été trouvée, False sinon
+
+        Raises:
+            ValueError: Si la résolution précédente n'est pas optimale ou si les dimensions,
+                        types ou coefficients des modifications sont incorrects
+        """
+        if not self.optimal:
+            raise ValueError("Aucune base optimale à reprendre : le problème doit d'abord être résolu à l'optimum")
+        if b is not None and len(b) != self.m:
+            raise ValueError(f"Le second membre doit avoir {self.m} composantes")
+        if c is not None and len(c) != self.n:
+            raise ValueError(f"Les coûts doivent avoir {self.n} composantes")
+        contraintes = list(contraintes or [])
+        for _, type_contrainte, _ in contraintes:
+            if type_contrainte not in ("<=", ">=", "="):
+                raise ValueError(f"Type de contrainte inconnu: {type_contrainte}")
+        if contraintes:
+            A = ajouter_lignes(self.A, [coefficients for coefficients, _, _ in contraintes])
+        if iterations_max is None:
+            iterations_max = 10 * (self.m + len(contraintes) + self.n)
+
+        self.iterations = 0
+        self.iterations_phase_i = 0
+        self.iterations_duales = 0
+        self.optimal = False
+        self.unbounded = False
+        self.irrealisable = False
+        self.solution = None
+        self.valeur_optimale = None
+        if b is not None:
+            self._b[:self.m] = array("d", [s * v for s, v in zip(self._signes, b)])
+        if contraintes:
+            self._ajouter_contraintes(A, contraintes)
+        else:
+            self._x = self._ftran(list(self._b))
+
+        exclues = set(self.var_artificielles)
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.reprise", "\n=== REPRISE: Simplexe dual depuis la base précédente ===")
+        statut = self._iterer_dual(list(self.c) + [0.0] * (self.total - self.n), exclues, iterations_max)
+        self.iterations_duales = self.iterations
+        if statut == "irrealisable":
+            self.irrealisable = True
+            if journal.NIVEAU >= journal.RESUME:
+                journal.emettre(journal.RESUME, "simplex.irrealisable", "Le problème n'a pas de solution réalisable.")
+            return False
+        if statut == "max_iterations":
+            return self._terminer(statut)
+        self._chasser_artificielles()
+
+        if c is not None:
+            self.c = array("d", c)
+        if journal.NIVEAU >= journal.RESUME:
+            journal.emettre(journal.RESUME, "simplex.phase_ii", "\n=== PHASE II: Optimisation du problème original ===")
+        statut = self._iterer("Phase II", list(self.c) + [0.0] * (self.total - self.n), exclues, iterations_max)
+        return self._terminer(statut)
+
+    def _ajouter_contraintes(self, A, contraintes: list) -> None:
+        """Ajoute les lignes de A (déjà complétée) à la base, avec leur écart ou leur artificielle.
+
+        Une contrainte >= est multipliée par -1 pour entrer en base par un écart ; une égalité
+        entre par son artificielle, que le simplexe dual ramène à zéro. Les colonnes
+        auxiliaires ajoutées sont numérotées après toutes les autres.
+        """
+        self.A = A
+        if self._colonnes is not None:
+            self._colonnes = A.transposee()
+        for _, type_contrainte, valeur in contraintes:
+            signe = -1.0 if type_contrainte == ">=" else 1.0
+            self._signes.append(signe)
+            self._b.append(signe * valeur)
+            self.types.append("=" if type_contrainte == "=" else "<=")
+            self._auxiliaires.append((self.m, 1.0))
+            if type_contrainte == "=":
+                self.var_artificielles.append(self.total)
+            self.base.append(self.total)
+            self.total += 1
+            self.m += 1
+        self._factoriser()
+
+    def extraire_solution(self) -> None:
+        """Lit la solution dans x_B = B⁻¹ b."""
+        self.solution = [0.0] * self.n
+        for i, j in enumerate(self.base):
+            if j < self.n:
+                self.solution[j] = self._x[i]
+        self.valeur_optimale = sum(map(mul, self.c, self.solution))
+
+
+def ajouter_lignes(A, lignes: list):
+    """Retourne une copie de A complétée par des lignes, du même type que A.
+
+    Args:
+        A (Matrice | MatriceCreuse): La matrice de départ (non modifiée)
+        lignes (list): Les nouvelles lignes, chacune donnée par ses num_colonne coefficients ou
+                       par un dictionnaire {colonne: valeur} de ses coefficients non nuls
+
+    Returns:
+        Matrice | MatriceCreuse: La matrice de num_ligne + len(lignes) lignes
+
+    Raises:
+        ValueError: Si une ligne n'a pas num_colonne coefficients ou si une colonne sort de A
+    """
+    m, n = A.num_ligne, A.num_colonne
+    couples = []
+    for ligne in lignes:
+        if isinstance(ligne, dict):
+            if any(not 0 <= j < n for j in ligne):
+                raise ValueError(f"Colonne hors de 0..{n - 1} dans une ligne ajoutée")
+            couples.append(sorted((j, float(v)) for j, v in ligne.items() if v != 0))
+        else:
+            if len(ligne) != n:
+                raise ValueError(f"Une ligne ajoutée a {len(ligne)} coefficients, {n} attendus")
+            couples.append([(j, float(v)) for j, v in enumerate(ligne) if v != 0])
+
+    if isinstance(A, MatriceCreuse):
+        valeurs, indices, debuts = array("d", A._valeurs), array("q", A._indices), array("q", A._debuts)
+        for ligne in couples:
+            for j, v in ligne:
+                indices.append(j)
+                valeurs.append(v)
+            debuts.append(len(valeurs))
+        return MatriceCreuse._depuis_csr(A.name, valeurs, indices, debuts, m + len(couples), n)
+    tampon = array("d")
+    for i in range(m):
+        tampon.extend(A._ligne(i))
+    for ligne in couples:
+        nouvelle = array("d", [0.0]) * n
+        for j, v in ligne:
+            nouvelle[j] = v
+        tampon.extend(nouvelle)
+    return Matrice._depuis_tampon(A.name, tampon, m + len(couples), n)
@@ -0,0 +1,226 @@
+"""Règles de choix de la variable entrante (« pricing ») pour le simplexe.
+
+Une règle choisit, parmi les variables hors base de coût réduit améliorant, celle qui
+entre en base. Elle ne voit le problème qu'à travers un moteur (Simplex en tableau ou
+SimplexRevise) qui fournit :
+    total                       le nombre de variables (colonnes hors second membre)
+    base                        les variables de base, une par ligne
+    couts_reduits(debut, fin)   les coûts réduits d_j des colonnes debut à fin - 1, orientés
+                                de sorte que d_j > 0 améliore l'objectif (0 pour la base)
+    ligne_pivot(r)              la ligne r de B⁻¹ A (toutes les colonnes)
+    produits_colonnes(v)        les produits (B⁻¹ a_j) · v pour toutes les colonnes
+
+Règles disponibles :
+    Dantzig                plus grand coût réduit (règle historique du tableau)
+    Bland                  plus petit indice améliorant ; jamais de cyclage
+    Devex                  plus grand d_j² / w_j, poids de référence approchés (Forrest-Goldfarb)
+    PlusFortePente         plus grand d_j² / γ_j, γ_j = 1 + ||B⁻¹ a_j||² mis à jour exactement
+                           (Goldfarb-Reid) : moins d'itérations, chacune plus chère
+    TarificationPartielle  une autre règle appliquée segment par segment : on s'arrête au
+                           premier segment qui contient un candidat (toujours à partir du
+                           premier segment avec Bland, qui garde ainsi sa garantie)
+"""
+from math import ceil
+
+# Un coût réduit est améliorant au-delà de ce seuil
+TOLERANCE = 1e-9
+
+
+class Regle:
+    """Règle de choix de la variable entrante (classe de base)."""
+    nom = "regle"
+    # Test du quotient : en cas d'égalité, la variable de base de plus petit indice sort (Bland)
+    departage_par_indice = False
+
+    def demarrer(self, moteur) -> None:
+        """Appelée au début de chaque phase, avant le premier choix."""
+
+    def choisir(self, moteur, exclues=frozenset()) -> int:
+        """Retourne la variable entrante, ou -1 si aucun coût réduit n'est améliorant (optimum).
+
+        Args:
+            moteur (Simplex | SimplexRevise): Le moteur du simplexe
+            exclues (set): Les variables qui ne doivent pas entrer (artificielles en Phase II)
+        """
+        return self._meilleure(moteur.couts_reduits(0, moteur.total), 0, exclues)
+
+    def _meilleure(self, couts, debut: int, exclues) -> int:
+        """La meilleure colonne (indice absolu) parmi couts, qui commencent à la colonne debut."""
+        meilleur, entrante = 0.0, -1
+        for k, d in enumerate(couts):
+            if d > TOLERANCE and debut + k not in exclues:
+                score = self._score(debut + k, d)
+                if score > meilleur:
+                    meilleur, entrante = score, debut + k
+        return entrante
+
+    def _score(self, j: int, d: float) -> float:
+        return d
+
+    def avant_pivot(self, moteur, ligne: int, entrante: int, alpha) -> None:
+        """Appelée avant le pivot sur (ligne, entrante), alpha = B⁻¹ a_entrante."""
+
+    def __str__(self):
+        return self.nom
+
+
+class Dantzig(Regle):
+    """Plus grand coût réduit, le premier en cas d'égalité."""
+    nom = "dantzig"
+
+
+class Bland(Regle):
+    """Plus petit indice de coût réduit améliorant ; avec le départage du test du quotient,
+    garantit la terminaison sur les problèmes dégénérés."""
+    nom = "bland"
+    departage_par_indice = True
+
+    def _meilleure(self, couts, debut: int, exclues) -> int:
+        for k, d in enumerate(couts):
+            if d > TOLERANCE and debut + k not in exclues:
+                return debut + k
+        return -1
+
+
+class Devex(Regle):
+    """Plus grand d_j² / w_j, où w_j approche ||B⁻¹ a_j||² relativement à la base de départ.
+
+    Les poids sont mis à jour avec la seule ligne pivot : une ligne de B⁻¹ A par itération.
+    """
+    nom = "devex"
+
+    def __init__(self):
+        self.poids = []
+
+    def demarrer(self, moteur) -> None:
+        self.poids = [1.0] * moteur.total
+
+    def _score(self, j: int, d: float) -> float:
+        return d * d / self.poids[j]
+
+    def avant_pivot(self, moteur, ligne: int, entrante: int, alpha) -> None:
+        rangee = moteur.ligne_pivot(ligne)
+        pivot = rangee[entrante]
+        poids = self.poids
+        poids_entrante = poids[entrante]
+        for j, a in enumerate(rangee):
+            if a != 0 and j != entrante:
+                rapport = a / pivot
+                poids[j] = max(poids[j], rapport * rapport * poids_entrante)
+        poids[moteur.base[ligne]] = max(poids_entrante / (pivot * pivot), 1.0)
+
+
+class PlusFortePente(Regle):
+    """Plus forte pente (steepest edge) : plus grand d_j² / γ_j, γ_j = 1 + ||B⁻¹ a_j||².
+
+    Les normes sont calculées au début de chaque phase (m lignes de B⁻¹ A), puis mises à
+    jour exactement à chaque pivot avec la ligne pivot et les produits (B⁻¹ a_j) · alpha.
+    """
+    nom = "plus_forte_pente"
+
+    def __init__(self):
+        self.normes = []
+
+    def demarrer(self, moteur) -> None:
+        normes = [1.0] * moteur.total
+        for r in range(len(moteur.base)):
+            for j, a in enumerate(moteur.ligne_pivot(r)):
+                if a != 0:
+                    normes[j] += a * a
+        self.normes = normes
+
+    def _score(self, j: int, d: float) -> float:
+        return d * d / self.normes[j]
+
+    def avant_pivot(self, moteur, ligne: int, entrante: int, alpha) -> None:
+        rangee = moteur.ligne_pivot(ligne)
+        produits = moteur.produits_colonnes(alpha)
+        pivot = rangee[entrante]
+        normes = self.normes
+        norme_entrante = 1.0 + sum(a * a for a in alpha)
+        for j, a in enumerate(rangee):
+            if a != 0 and j != entrante:
+                rapport = a / pivot
+                normes[j] = max(normes[j] - 2 * rapport * produits[j] + rapport * rapport * norme_entrante,
+                                1.0 + rapport * rapport)
+        normes[moteur.base[ligne]] = max(norme_entrante / (pivot * pivot), 1.0)
+
+
+class TarificationPartielle(Regle):
+    """Tarification partielle : les colonnes sont découpées en segments ; le choix se fait
+    dans le premier segment (à partir du dernier utilisé) qui contient un candidat.
+
+    Seuls les coûts réduits des segments parcourus sont calculés, ce qui allège chaque
+    itération quand les colonnes sont bien plus nombreuses que les lignes.
+
+    Avec une règle qui départage par indice (Bland), le parcours repart toujours du premier
+    segment : la variable entrante reste le plus petit indice améliorant, ce qui conserve la
+    garantie de non-cyclage (au prix de l'allègement quand les premiers segments sont vides).
+    """
+    nom = "partielle"
+
+    def __init__(self, segments: int = 8, regle: Regle | None = None):
+        """
+        Args:
+            segments (int): Le nombre de segments
+            regle (Regle, optional): La règle appliquée dans chaque segment (Dantzig par défaut)
+
+        Raises:
+            ValueError: Si le nombre de segments est inférieur à 1
+        """
+        if segments < 1:
+            raise ValueError("Le nombre de segments doit être au moins 1")
+        self.segments = segments
+        self.regle = Dantzig() if regle is None else regle
+        self.departage_par_indice = self.regle.departage_par_indice
+        self._segment = 0
+
+    @property
+    def nom(self) -> str:
+        return f"partielle({self.regle.nom})"
+
+    def demarrer(self, moteur) -> None:
+        self._segment = 0
+        self.regle.demarrer(moteur)
+
+    def choisir(self, moteur, exclues=frozenset()) -> int:
+        total = moteur.total
+        taille = max(1, ceil(total / self.segments))
+        nombre = ceil(total / taille)
+        # Bland exige le plus petit indice améliorant : pas de reprise au dernier segment
+        depart = 0 if self.regle.departage_par_indice else self._segment
+        for k in range(nombre):
+            segment = (depart + k) % nombre
+            debut = segment * taille
+            fin = min(total, debut + taille)
+            entrante = self.regle._meilleure(moteur.couts_reduits(debut, fin), debut, exclues)
+            if entrante != -1:
+                self._segment = segment
+                return entrante
+        return -1
+
+    def avant_pivot(self, moteur, ligne: int, entrante: int, alpha) -> None:
+        self.regle.avant_pivot(moteur, ligne, entrante, alpha)
+
+
+REGLES = {
+    "dantzig": Dantzig,
+    "bland": Bland,
+    "devex": Devex,
+    "plus_forte_pente": PlusFortePente,
+    "partielle": TarificationPartielle,
+}
+
+
+def regle(nom_ou_regle) -> Regle:
+    """Retourne une nouvelle règle d'après son nom (voir REGLES), ou la règle donnée.
+
+    Raises:
+        ValueError: Si le nom est inconnu
+    """
+    if isinstance(nom_ou_regle, Regle):
+        return nom_ou_regle
+    try:
+        return REGLES[nom_ou_regle]()
+    except KeyError:
+        raise ValueError(f"Règle de choix inconnue: {nom_ou_regle} (attendu: {', '.join(REGLES)})") from None
@@ -1,28 +1,105 @@
+from array import array
 from collections.abc import MutableSequence
+from operator import mul
+import backend
+import expression
+import journal
 
 class Vecteur:
+    # Pas de __dict__ par instance : un Vecteur n'est qu'un nom, une taille et un tampon.
+    __slots__ = ("name", "taille", "_data")
+
     def __init__(self, name: str, elements: MutableSequence):
         """
         Initialise un vecteur avec un nom et une liste d'éléments.
 
+        Les éléments sont recopiés dans un tampon contigu array('d'). La conversion
+        sert aussi de validation : elle échoue dès qu'un élément n'est pas un nombre.
+
         :param name: Le nom du vecteur.
-        :param elements: Une liste contenant uniquement des int ou float.
+        :param elements: Une liste (ou un array) contenant uniquement des int ou float.
         """
-        if not isinstance(elements, MutableSequence) or not isinstance(elements, list):  
+        if not isinstance(elements, (list, array)):
             raise TypeError("elements doit être une liste.")
 
-        if not all(isinstance(x, (int, float)) for x in elements):  
-            raise TypeError("Tous les éléments doivent être des int ou des float.")
+        try:
+            tampon = array("d", elements)
+        except TypeError:
+            raise TypeError("Tous les éléments doivent être des int ou des float.") from None
 
         self.name = name
-        self.taille = len(elements)
-        self.elements = elements[:]
+        self.taille = len(tampon)
+        self._data = tampon
+
+    @classmethod
+    def _depuis_tampon(cls, name: str, tampon) -> "Vecteur":
+        """
+        Constructeur interne de confiance : ni copie ni validation.
+
+        :param name: Le nom du vecteur.
+        :param tampon: Un array('d') ou une memoryview de format 'd', dont le Vecteur devient propriétaire.
+        """
+        vecteur = cls.__new__(cls)
+        vecteur.name = name
+        vecteur.taille = len(tampon)
+        vecteur._data = tampon
+        return vecteur
+
+    @property
+    def elements(self):
+        """Le tampon des éléments (array('d'), ou memoryview si le Vecteur est une vue)."""
+        return self._data
+
+    def vue(self, debut: int | None = None, fin: int | None = None, pas: int | None = None) -> "Vecteur":
+        """
+        Retourne une vue sur une tranche du Vecteur, sans copie.
+
+        Les modifications faites à travers la vue sont visibles dans le Vecteur d'origine.
+
+        Args:
+            debut (int, optional): Indice de début de la tranche.
+            fin (int, optional): Indice de fin (exclu) de la tranche.
+            pas (int, optional): Pas de la tranche.
+
+        Returns:
+            Vecteur: Un Vecteur partageant la mémoire du Vecteur d'origine.
+        """
+        tampon = memoryview(self._data)[debut:fin:pas]
+        bornes = ":".join("" if x is None else str(x) for x in (debut, fin))
+        return Vecteur._depuis_tampon(f"{self.name}[{bornes}]", tampon)
+
+    def paresseux(self) -> "expression.Expression":
+        """Retourne le Vecteur enveloppé dans une Expression paresseuse (voir le module expression)."""
+        return expression.Feuille(self)
+
+    def __len__(self) -> int:
+        return self.taille
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __getitem__(self, index):
+        """Retourne un élément, ou une vue (sans copie) si index est une tranche."""
+        if isinstance(index, slice):
+            return self.vue(index.start, index.stop, index.step)
+        return self._data[index]
+
+    def __setitem__(self, index, valeur) -> None:
+        """Modifie un élément, ou une tranche de même longueur que valeur."""
+        if isinstance(index, slice):
+            memoryview(self._data)[index] = array("d", valeur)
+        else:
+            self._data[index] = valeur
+
+    def tolist(self) -> list:
+        """Retourne une copie des éléments sous forme de liste."""
+        return self._data.tolist()
 
     def __str__(self):
         """
         Retourne une représentation sous forme de chaîne de caractères de l'objet Vecteur.
         """
-        return f"(Vecteur : {self.name}, Taille : {self.taille}, Elements : {self.elements})"
+        return f"(Vecteur : {self.name}, Taille : {self.taille}, Elements : {self._data.tolist()})"
 
     def __add__(self, other):
         """
@@ -35,13 +112,19 @@ class Vecteur:
             Vecteur: Un nouvel objet Vecteur avec la somme élément par élément des deux Vecteurs.
             str: Un message d'erreur si les Vecteurs ont des tailles différentes.
         """
+        if not isinstance(other, Vecteur):
+            return NotImplemented
+        if expression.PARESSEUX:
+            return expression.Feuille(self) + other
         if self.taille != other.taille:
             return f"Erreur les tailles des vecteurs sont différentes {self.taille} != {other.taille}"
         else:
-            newElements = [x + y for x, y in zip(self.elements, other.elements)]
+            if backend.utilise_numpy("vecteur", self.taille):
+                newElements = backend.somme(self._data, other._data)
+            else:
+                newElements = array("d", [x + y for x, y in zip(self._data, other._data)])
             newName = self.name + " + " + other.name
-            newVec = Vecteur(newName, newElements)
-            return newVec
+            return Vecteur._depuis_tampon(newName, newElements)
 
     def __mul__(self, coef: float | int):
         """
@@ -56,11 +139,15 @@ class Vecteur:
         """
         if not isinstance(coef, (float | int)):
             return "Aucun coef ou flottant n'a été rentré par l'utilisateur, Erreur"
+        elif expression.PARESSEUX:
+            return expression.Feuille(self) * coef
         else:
-            newElements = [x * coef for x in self.elements]
-            newName =  self.name + " * " + str(coef)
-            newVec = Vecteur(newName, newElements)
-            return newVec
+            if backend.utilise_numpy("vecteur", self.taille):
+                newElements = backend.produit(self._data, coef)
+            else:
+                newElements = array("d", [x * coef for x in self._data])
+            newName = self.name + " * " + str(coef)
+            return Vecteur._depuis_tampon(newName, newElements)
 
     def __matmul__(self, other) -> float | int:
         """
@@ -76,9 +163,9 @@ class Vecteur:
         if self.taille != other.taille:
             return f"Erreur les tailles des vecteurs sont différentes {self.taille} != {other.taille}"
         else:
-            newListe = [x * y for x, y in zip(self.elements, other.elements)]
-            Entier = sum(newListe)
-            return Entier
+            if backend.utilise_numpy("vecteur", self.taille):
+                return backend.produit_scalaire(self._data, other._data)
+            return sum(map(mul, self._data, other._data))
         
     def __rmul__(self, scalaire: int | float):
         """Permet la multiplication scalaire * vecteur"""
@@ -91,9 +178,13 @@ class Vecteur:
         Returns:
             Vecteur: Un nouvel objet Vecteur avec les éléments négativés.
         """
-        neg_elements = [-x for x in self.elements]
-        newVec = Vecteur("-" + self.name, neg_elements)
-        return newVec
+        if expression.PARESSEUX:
+            return -expression.Feuille(self)
+        if backend.utilise_numpy("vecteur", self.taille):
+            neg_elements = backend.oppose(self._data)
+        else:
+            neg_elements = array("d", [-x for x in self._data])
+        return Vecteur._depuis_tampon("-" + self.name, neg_elements)
 
     def __sub__(self, other):
         """
@@ -106,13 +197,98 @@ class Vecteur:
             Vecteur: Un nouvel objet Vecteur avec la différence élément par élément des deux Vecteurs.
             str: Un message d'erreur si les Vecteurs ont des tailles différentes.
         """
+        if not isinstance(other, Vecteur):
+            return NotImplemented
+        if expression.PARESSEUX:
+            return expression.Feuille(self) - other
         if self.taille != other.taille:
             return f"Erreur les tailles des vecteurs sont différentes {self.taille} != {other.taille}"
         else:
-            newVec = vecteur+(-other)
-            return newVec
+            if backend.utilise_numpy("vecteur", self.taille):
+                newElements = backend.difference(self._data, other._data)
+            else:
+                newElements = array("d", [x - y for x, y in zip(self._data, other._data)])
+            newName = self.name + " - " + other.name
+            return Vecteur._depuis_tampon(newName, newElements)
+
+    def _ecrire(self, valeurs) -> None:
+        """Recopie valeurs dans le tampon existant (le Vecteur et ses vues restent valides).
+
+        Un array('d') ou une memoryview de format 'd' est recopié directement, sans conversion.
+        """
+        if not isinstance(valeurs, (array, memoryview)):
+            valeurs = array("d", valeurs)
+        memoryview(self._data)[:] = valeurs
+
+    def _verifier_taille(self, other) -> None:
+        if self.taille != other.taille:
+            raise ValueError(f"Erreur les tailles des vecteurs sont différentes {self.taille} != {other.taille}")
+
+    def axpy(self, alpha: float | int, x: "Vecteur") -> "Vecteur":
+        """
+        Mise à jour fusionnée en place : self <- self + alpha * x.
+
+        Aucun Vecteur intermédiaire n'est créé (contrairement à self + x * alpha).
+
+        Args:
+            alpha (float|int): Le coefficient appliqué à x.
+            x (Vecteur): Le Vecteur à ajouter.
+
+        Returns:
+            Vecteur: self, modifié en place.
+
+        Raises:
+            ValueError: Si les Vecteurs ont des tailles différentes.
+        """
+        self._verifier_taille(x)
+        if not alpha:
+            return self
+        if backend.utilise_numpy("vecteur", self.taille):
+            backend.axpy(self._data, alpha, x._data)
+        else:
+            _axpy_tampon(self._data, alpha, x._data)
+        return self
+
+    def __iadd__(self, other):
+        """Addition en place (+=), sans créer de nouveau Vecteur."""
+        self._verifier_taille(other)
+        if backend.utilise_numpy("vecteur", self.taille):
+            backend.en_place("add", self._data, other._data)
+        else:
+            _axpy_tampon(self._data, 1.0, other._data)
+        return self
+
+    def __isub__(self, other):
+        """Soustraction en place (-=), sans créer de nouveau Vecteur."""
+        self._verifier_taille(other)
+        if backend.utilise_numpy("vecteur", self.taille):
+            backend.en_place("subtract", self._data, other._data)
+        else:
+            _axpy_tampon(self._data, -1.0, other._data)
+        return self
+
+    def __imul__(self, coef: float | int):
+        """Multiplication en place (*=) par un scalaire."""
+        if not isinstance(coef, (float | int)):
+            raise TypeError("Le multiplicateur doit être un nombre")
+        if backend.utilise_numpy("vecteur", self.taille):
+            backend.en_place("multiply", self._data, coef)
+        else:
+            _multiplier_tampon(self._data, coef)
+        return self
+
+    def __itruediv__(self, coef: float | int):
+        """Division en place (/=) par un scalaire."""
+        if not isinstance(coef, (float | int)):
+            raise TypeError("Le diviseur doit être un nombre")
+        if coef == 0:
+            raise ZeroDivisionError("Division d'un vecteur par zéro")
+        if backend.utilise_numpy("vecteur", self.taille):
+            backend.en_place("divide", self._data, coef)
+        else:
+            _diviser_tampon(self._data, coef)
+        return self
 
-    
 
     def __eq__(self, other) -> bool:
         """
@@ -127,29 +303,65 @@ class Vecteur:
         marge = 12-10
         if self.taille != other.taille:
             return False
-        for i in range(len(self.elements)):
-            if self.elements[i] != other.elements[i]:
-                if abs(self.elements[i] - other.elements[i]) > abs(marge):
+        for x, y in zip(self._data, other._data):
+            if x != y:
+                if abs(x - y) > abs(marge):
                     return False
         return True
 
-    def __del__(self) -> None:
+    def _tracer_suppression(self) -> None:
         """
-        Supprime l'objet Vecteur.
+        Trace la suppression de l'objet Vecteur.
+
+        N'est installée comme __del__ qu'au niveau de trace COMPLET : en dessous, les
+        Vecteurs n'ont pas de finaliseur et leur destruction ne coûte rien.
         """
-        print(f"Le vecteur {self.name} a été supprimé")
-        del self
+        journal.emettre(journal.COMPLET, "vecteur.suppression", f"Le vecteur {self.name} a été supprimé",
+                        name=self.name)
+
+
+# Mises à jour en place du chemin Python : on écrit élément par élément dans le tampon
+# (array ou memoryview), sans liste ni tampon temporaire
+
+def _axpy_tampon(y, alpha: float, x) -> None:
+    """y <- y + alpha * x ; les éléments nuls de x sont sautés."""
+    for k, v in enumerate(x):
+        if v:
+            y[k] += alpha * v
+
+
+def _multiplier_tampon(y, coef: float) -> None:
+    """y <- coef * y"""
+    for k, v in enumerate(y):
+        y[k] = v * coef
+
+
+def _diviser_tampon(y, coef: float) -> None:
+    """y <- y / coef"""
+    for k, v in enumerate(y):
+        y[k] = v / coef
+
+
+def _suivre_niveau_trace(niveau: int) -> None:
+    if niveau >= journal.COMPLET:
+        Vecteur.__del__ = Vecteur._tracer_suppression
+    elif "__del__" in Vecteur.__dict__:
+        del Vecteur.__del__
+
+
+journal.observer_niveau(_suivre_niveau_trace)
 
 def ieme_canonique(taille: int, position: int) -> Vecteur:
-    liste = [0] * taille
-    liste[position] = 1
-    name = f"Canonique {position}e position" 
-    return Vecteur(name, liste)
+    tampon = array("d", [0.0]) * taille
+    tampon[position] = 1
+    name = f"Canonique {position}e position"
+    return Vecteur._depuis_tampon(name, tampon)
         
 
 
 
 if __name__=="__main__":
+    journal.configurer(journal.COMPLET)
     ma_liste = [1, 2, 3]
     vecteur = Vecteur("A", ma_liste)
     print(vecteur)